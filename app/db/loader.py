@@ -0,0 +1,319 @@
+"""Bulk movies loader implementation."""
+
+import argparse
+import codecs
+import csv
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from contextlib import contextmanager
+
+import polars as pl
+from sqlalchemy import Connection, inspect, insert
+from sqlalchemy.orm import Session
+
+from app.db.sqlite import engine
+from app.models.movies import (
+    Movie,
+    MovieDTO,
+    MovieProducer,
+    MoviesVersion,
+    bump_movies_version,
+    link_movie_producers,
+)
+from app.settings import env_data
+from app.utils.logger import Logger
+
+logger = Logger(__name__)
+
+CSV_SCHEMA = {
+    "year": pl.Int64,
+    "title": pl.String,
+    "studios": pl.String,
+    "producers": pl.String,
+    "winner": pl.String,
+}
+
+
+def normalize_movies(df: pl.DataFrame) -> pl.DataFrame:
+    """Convert a batch of the award list CSV into `movies` table columns.
+
+    The `winner` column holds "yes" for the winning movies and is empty otherwise,
+    so it is converted into a boolean.
+
+    Arguments:
+        df (pl.DataFrame): The batch read from the CSV.
+
+    Returns:
+        pl.DataFrame: The batch with the `movies` columns and a boolean winner.
+
+    """
+    return df.select(
+        pl.col("year"),
+        pl.col("title"),
+        pl.col("studios"),
+        pl.col("producers"),
+        (pl.col("winner").str.to_lowercase() == "yes").fill_null(False).alias("winner"),
+    )
+
+
+def parse_movie(row: dict) -> dict:
+    """Convert a row of the award list CSV into `movies` table columns.
+
+    Arguments:
+        row (dict): The CSV row, keyed by the header names.
+
+    Returns:
+        dict: The movie, with an integer year and a boolean winner.
+
+    Raises:
+        ValueError: If a column is missing or the year is not an integer.
+
+    """
+    try:
+        return {
+            "year": int(row["year"]),
+            "title": row["title"],
+            "studios": row["studios"],
+            "producers": row["producers"],
+            "winner": (row.get("winner") or "").strip().lower() == "yes",
+        }
+    except KeyError as err:
+        raise ValueError(f"Malformed CSV row: {row}") from err
+
+
+async def iter_csv_stream_chunks(stream: AsyncIterable[bytes],
+                                 chunk_size: int) -> AsyncIterator[list[dict]]:
+    """Parse a streamed award list CSV in bounded chunks of movies.
+
+    Only the incomplete last line of the data received so far is buffered between
+    reads, so memory use is bounded by the chunk size and not by the upload size.
+
+    Arguments:
+        stream (AsyncIterable[bytes]): The UTF-8 encoded, semicolon-separated CSV.
+        chunk_size (int): The maximum number of movies of each chunk.
+
+    Returns:
+        AsyncIterator[list[dict]]: Yields the movies of each chunk.
+
+    Raises:
+        ValueError: If the header misses a column or a row is malformed.
+
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    header = None
+    pending = ""
+    chunk = []
+
+    def parse_lines(lines: list[str]) -> Iterator[dict]:
+        nonlocal header
+        for values in csv.reader(lines, delimiter=";"):
+            if not values:
+                continue
+            if header is None:
+                header = [name.strip() for name in values]
+                missing = set(CSV_SCHEMA) - {"winner"} - set(header)
+                if missing:
+                    raise ValueError(f"Missing CSV columns: {sorted(missing)}")
+                continue
+            yield parse_movie(dict(zip(header, values)))
+
+    async for data in stream:
+        pending += decoder.decode(data)
+        *lines, pending = pending.split("\n")
+        for movie in parse_lines(lines):
+            chunk.append(movie)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+    pending += decoder.decode(b"", final=True)
+    chunk.extend(parse_lines([pending]))
+    if chunk:
+        yield chunk
+
+
+def insert_movies(connection: Connection, movies: list[dict],
+                  link_producers: bool = True) -> int:
+    """Insert a chunk of movies with a single executemany call.
+
+    Arguments:
+        connection (Connection): The connection used to write the movies.
+        movies (list[dict]): The movies, with the `movies` table columns.
+        link_producers (bool, optional): Whether the `movie_producers` table must be
+            populated for the inserted movies.
+
+    Returns:
+        int: The number of inserted movies.
+
+    """
+    if not movies:
+        return 0
+
+    if link_producers:
+        statement = insert(Movie).returning(
+            Movie.id, Movie.year, Movie.producers, Movie.winner,
+            sort_by_parameter_order=True
+        )
+        link_movie_producers(connection, connection.execute(statement, movies).all())
+    else:
+        connection.execute(insert(Movie), movies)
+
+    return len(movies)
+
+
+def iter_csv_chunks(path: str, chunk_size: int) -> Iterator[list[dict]]:
+    """Stream the award list CSV in chunks of normalized movies.
+
+    Arguments:
+        path (str): The path of the semicolon-separated CSV file.
+        chunk_size (int): The approximate number of rows of each chunk.
+
+    Returns:
+        Iterator[list[dict]]: Yields the movies of each chunk.
+
+    """
+    reader = pl.read_csv_batched(
+        path, separator=";", batch_size=chunk_size, schema_overrides=CSV_SCHEMA)
+
+    while batches := reader.next_batches(1):
+        for batch in batches:
+            yield normalize_movies(batch).to_dicts()
+
+
+@contextmanager
+def secondary_indexes_dropped(connection: Connection,
+                              tables: Iterable = (Movie.__table__,
+                                                  MovieProducer.__table__)
+                              ) -> Iterator[None]:
+    """Drop the secondary indexes of the given tables and rebuild them on exit.
+
+    Only the indexes declared in the models that exist in the database are
+    touched, so the context can be used on a partially migrated schema. The
+    indexes are rebuilt even if the load fails.
+
+    Arguments:
+        connection (Connection): The connection used to drop and create indexes.
+        tables (Iterable, optional): The tables whose indexes are rebuilt.
+
+    Returns:
+        Iterator[None]: Yields control while the indexes are dropped.
+
+    """
+    inspector = inspect(connection)
+    indexes = []
+    for table in tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        indexes.extend(index for index in table.indexes if index.name in existing)
+
+    for index in indexes:
+        index.drop(connection)
+
+    try:
+        yield
+    finally:
+        for index in indexes:
+            index.create(connection)
+
+
+def load_movies(connection: Connection, chunks: Iterable[list[dict]],
+                rebuild_indexes: bool = False) -> dict:
+    """Insert chunks of movies and measure the load throughput.
+
+    The `movie_producers` table is populated along with the movies when it exists,
+    so the loader can run before or after the migration that creates it. The
+    shared version of the movies data, when its table exists, is bumped once for
+    the whole load.
+
+    Arguments:
+        connection (Connection): The connection used to write the movies. The
+            caller owns the transaction.
+        chunks (Iterable[list[dict]]): The chunks of movies to insert.
+        rebuild_indexes (bool, optional): Whether the secondary indexes are
+            dropped before the load and rebuilt after it.
+
+    Returns:
+        dict: The number of loaded "rows", the elapsed "seconds" and the
+            "rows_per_second" throughput.
+
+    """
+    inspector = inspect(connection)
+    link_producers = inspector.has_table(MovieProducer.__tablename__)
+    start = time.perf_counter()
+    rows = 0
+
+    if rebuild_indexes:
+        with secondary_indexes_dropped(connection):
+            for chunk in chunks:
+                rows += insert_movies(connection, chunk, link_producers)
+    else:
+        for chunk in chunks:
+            rows += insert_movies(connection, chunk, link_producers)
+    if inspector.has_table(MoviesVersion.__tablename__):
+        bump_movies_version(connection)
+
+    seconds = time.perf_counter() - start
+    report = {
+        "rows": rows,
+        "seconds": round(seconds, 3),
+        "rows_per_second": round(rows / seconds) if seconds else rows,
+    }
+    logger.info(
+        f"Loaded {report['rows']} movies in {report['seconds']}s "
+        f"({report['rows_per_second']} rows/s).")
+    return report
+
+
+def load_movies_csv(connection: Connection, path: str, chunk_size: int = None,
+                    rebuild_indexes: bool = False) -> dict:
+    """Load an award list CSV into the `movies` table in chunks.
+
+    Arguments:
+        connection (Connection): The connection used to write the movies. The
+            caller owns the transaction.
+        path (str): The path of the semicolon-separated CSV file.
+        chunk_size (int, optional): The number of rows inserted per executemany
+            call. Defaults to the `LOAD_CHUNK_SIZE` setting.
+        rebuild_indexes (bool, optional): Whether the secondary indexes are
+            dropped before the load and rebuilt after it.
+
+    Returns:
+        dict: The load report returned by `load_movies`.
+
+    """
+    chunks = iter_csv_chunks(path, chunk_size or env_data.LOAD_CHUNK_SIZE)
+    return load_movies(connection, chunks, rebuild_indexes)
+
+
+def main(argv: list[str] = None) -> dict:
+    """Load an award list CSV from the command line in a single transaction.
+
+    The interval snapshot file is rewritten once the load is committed, so the
+    workers using the "snapshot" engine pick up the new movies.
+
+    Arguments:
+        argv (list[str], optional): The command line arguments.
+
+    Returns:
+        dict: The load report returned by `load_movies`.
+
+    """
+    parser = argparse.ArgumentParser(description="Load an award list CSV.")
+    parser.add_argument("path", help="Semicolon-separated CSV file.")
+    parser.add_argument("--chunk-size", type=int, default=env_data.LOAD_CHUNK_SIZE)
+    parser.add_argument("--rebuild-indexes", action="store_true",
+                        help="Drop the secondary indexes during the load.")
+    args = parser.parse_args(argv)
+
+    with engine.begin() as connection:
+        report = load_movies_csv(
+            connection, args.path, args.chunk_size, args.rebuild_indexes)
+
+    with Session(engine) as session:
+        MovieDTO(session).write_snapshot()
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,150 @@
 """Database access implementation."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from prettyconf import config
-from sqlalchemy import create_engine
+from sqlalchemy import URL, Engine, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 
+from app.settings import env_data
+from app.utils.metrics import instrument_engine
+
 DATABASE_URL=config("DATABASE_URL", default=None)
+ASYNC_DATABASE_URL = make_url(DATABASE_URL).set(drivername="sqlite+aiosqlite")
+
+POOL_OPTIONS = {
+    "pool_size": env_data.DB_POOL_SIZE,
+    "max_overflow": env_data.DB_MAX_OVERFLOW,
+    "pool_recycle": env_data.DB_POOL_RECYCLE,
+}
+
+
+def is_file_database(url: URL) -> bool:
+    """Check whether a SQLite URL points to a database file.
+
+    Arguments:
+        url (URL): The database URL.
+
+    Returns:
+        bool: `False` for the in-memory databases, e.g. `sqlite://`.
+
+    """
+    return (url.database or ":memory:") != ":memory:" and \
+        url.query.get("mode") != "memory"
+
+
+def pool_options(url: URL) -> dict:
+    """Return the pool sizing options of an engine.
+
+    In-memory databases live in a single connection, which SQLAlchemy keeps in a
+    `SingletonThreadPool` or `StaticPool` that takes no sizing, so the options
+    only apply to database files.
+
+    Arguments:
+        url (URL): The database URL.
+
+    Returns:
+        dict: The `POOL_OPTIONS` for a database file, empty otherwise.
+
+    """
+    return POOL_OPTIONS if is_file_database(url) else {}
+
+
+def sqlite_pragmas() -> dict:
+    """Return the pragmas of the SQLite profile selected in the settings.
+
+    The "performance" profile lets readers run alongside a writer through the
+    write-ahead log, only syncs the log on checkpoints, maps the database file in
+    memory and keeps a larger page cache and the temporary tables in memory.
+
+    Arguments:
+        Has no arguments.
+
+    Returns:
+        dict: The pragma values set on each new connection, empty for the
+            "default" profile.
+
+    """
+    if env_data.SQLITE_PROFILE != "performance":
+        return {}
+    return {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": env_data.SQLITE_MMAP_SIZE,
+        "cache_size": env_data.SQLITE_CACHE_SIZE,
+        "temp_store": "MEMORY",
+    }
+
+
+def apply_sqlite_profile(target: Engine, query_only: bool = False) -> None:
+    """Set the profile pragmas on every connection opened by an engine.
+
+    Arguments:
+        target (Engine): The engine whose connections are configured.
+        query_only (bool, optional): Whether the connections reject writes.
+
+    Returns:
+        None: Method without data return.
+
+    """
+    pragmas = sqlite_pragmas()
+    if query_only:
+        pragmas["query_only"] = "ON"
+
+    @event.listens_for(target, "connect")
+    def set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
+
+def create_read_engine(url: URL) -> Engine | None:
+    """Create the engine of the read routes when `SQLITE_READ_ONLY` is enabled.
+
+    Its connections reject writes and are kept in a pool of their own. An
+    in-memory database cannot be shared by a second engine, so it gets none.
+
+    Arguments:
+        url (URL): The database URL.
+
+    Returns:
+        Engine: The read-only engine, `None` if the read routes use `engine`.
+
+    """
+    if not env_data.SQLITE_READ_ONLY or not is_file_database(url):
+        return None
+
+    read_engine = create_engine(
+        url, connect_args={"check_same_thread": False}, **pool_options(url))
+    apply_sqlite_profile(read_engine, query_only=True)
+    instrument_engine(read_engine)
+    return read_engine
+
 
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    **pool_options(make_url(DATABASE_URL))
 )
+read_engine = create_read_engine(make_url(DATABASE_URL))
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, **pool_options(ASYNC_DATABASE_URL))
+
+apply_sqlite_profile(engine)
+apply_sqlite_profile(async_engine.sync_engine)
+for instrumented in (engine, async_engine.sync_engine):
+    instrument_engine(instrumented)
 
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=read_engine or engine)
+AsyncSessionLocal = async_sessionmaker(
+    autoflush=False, expire_on_commit=False, bind=async_engine)
 Base = declarative_base()
 
 
@@ -35,4 +165,42 @@ def get_db() -> Generator[Session, None, None]:
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """Provide a database session for routes that only read.
+
+    When `SQLITE_READ_ONLY` is enabled, the session uses the `query_only`
+    connections of `read_engine`, otherwise the connections of `engine`.
+
+    Arguments:
+        Has no arguments.
+
+    Returns:
+        yields: session a SQLAlchemy database session.
+
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Provide an async database session.
+
+    This function creates a new async database session using `AsyncSessionLocal`,
+    yields it for use, and ensures that the session is properly closed after
+    execution. The queries run on the event loop through aiosqlite.
+
+    Arguments:
+        Has no arguments.
+
+    Returns:
+        yields: session a SQLAlchemy async database session.
+
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,235 @@
+"""In-process result cache implementation."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from app.settings import env_data
+
+
+class DataVersion:
+    """A process-wide counter identifying the current state of the movies data.
+
+    The version is bumped whenever a transaction that changed the `movies` table is
+    committed, so any result computed for an older version can be safely discarded.
+    It can also follow sources changed by other processes, such as the interval
+    snapshot file, or observe the tokens read from them, such as the version row
+    of the database, and is bumped when their token changes.
+
+    Attributes:
+        value (int): The current data version.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the version counter at zero.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.__lock = threading.Lock()
+        self.__value = 0
+        self.__sources: dict[Callable[[], Hashable], Hashable] = {}
+        self.__observed: dict[Hashable, Hashable] = {}
+
+    @property
+    def value(self) -> int:
+        """Return the current data version, bumped first if a source changed."""
+        for source, token in list(self.__sources.items()):
+            current = source()
+            if current != token:
+                with self.__lock:
+                    if self.__sources.get(source) == token:
+                        self.__sources[source] = current
+                        self.__value += 1
+        return self.__value
+
+    def follow(self, source: Callable[[], Hashable]) -> None:
+        """Bump the version whenever the token returned by a source changes.
+
+        Following the same source twice has no effect.
+
+        Arguments:
+            source (Callable[[], Hashable]): Returns a token identifying the
+                current state of the source.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self.__lock:
+            self.__sources.setdefault(source, source())
+
+    def observe(self, source: Hashable, token: Hashable, previous: Hashable = None,
+                on_change: Callable[[], None] = None) -> bool:
+        """Bump the version if the token read from a shared source changed.
+
+        The first token observed for a source is only recorded, and so is a token
+        replacing `previous`, the one a write of this process replaced, as the
+        writer refreshes the data itself. On any other change, `on_change` is
+        called before the version is bumped, under the lock, so a reader
+        observing the same token waits for it and never computes a result for
+        the new version from data derived from the old one.
+
+        Arguments:
+            source (Hashable): The name of the source.
+            token (Hashable): The token read from the source.
+            previous (Hashable, optional): The token replaced by a write of this
+                process.
+            on_change (Callable[[], None], optional): Discards the data derived
+                from the source.
+
+        Returns:
+            bool: Whether the source was changed by another process.
+
+        """
+        with self.__lock:
+            last = self.__observed.setdefault(source, token)
+            self.__observed[source] = token
+            if last in (token, previous):
+                return False
+            if on_change is not None:
+                on_change()
+            self.__value += 1
+            return True
+
+    def bump(self) -> int:
+        """Advance the data version.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            int: The new data version.
+
+        """
+        with self.__lock:
+            self.__value += 1
+            return self.__value
+
+
+class ResultCache:
+    """A thread-safe LRU cache with time-to-live expiration.
+
+    Entries are evicted when they are older than `ttl` seconds or when the cache
+    grows beyond `max_size` entries, starting from the least recently used one.
+
+    Attributes:
+        max_size (int): The maximum number of entries kept in the cache.
+        ttl (float): The lifetime of an entry in seconds, `0` disables expiration.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that had to compute the value.
+
+    """
+
+    def __init__(self, max_size: int = 128, ttl: float = 0) -> None:
+        """Initialize an empty cache.
+
+        Arguments:
+            max_size (int, optional): The maximum number of entries.
+            ttl (float, optional): The lifetime of an entry in seconds.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value of a key, counting the lookup as a hit or miss.
+
+        Arguments:
+            key (Hashable): The cache key.
+
+        Returns:
+            Any: The cached value, or `None` if the key is missing or expired.
+
+        """
+        now = time.monotonic()
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and (not self.ttl or now - entry[0] < self.ttl):
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store the value of a key, evicting the least recently used entries.
+
+        Arguments:
+            key (Hashable): The cache key.
+            value (Any): The value to cache, which must not be `None`.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self.__lock:
+            self.__entries[key] = (time.monotonic(), value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value of a key, computing and storing it on a miss.
+
+        The factory runs outside the cache lock, so a slow computation does not
+        block the lookups of other keys.
+
+        Arguments:
+            key (Hashable): The cache key.
+            factory (Callable): A callable without arguments that computes the value.
+
+        Returns:
+            Any: The cached or freshly computed value.
+
+        """
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Remove every entry and reset the hit and miss counters.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return the cache counters.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            dict: The "size", "hits" and "misses" of the cache.
+
+        """
+        return {"size": len(self.__entries), "hits": self.hits, "misses": self.misses}
+
+
+data_version = DataVersion()
+result_cache = ResultCache(max_size=env_data.CACHE_MAX_SIZE, ttl=env_data.CACHE_TTL)
@@ -0,0 +1,288 @@
+"""Incremental producer interval index implementation."""
+
+import heapq
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+
+
+def interval_rank(interval: int, producer: str, previous_win: int,
+                  following_win: int) -> tuple[int, str, int, int]:
+    """Return the key ranking an interval by length, then producer and years.
+
+    Every `top_k` selection ranks with this key, so the ties kept when `top_k`
+    cuts a length are the same whatever path answers the request. The largest
+    intervals are ranked by the key of their negated length.
+
+    Arguments:
+        interval (int): The length of the interval, negated for the largest.
+        producer (str): The producer of the interval.
+        previous_win (int): The year of the first win.
+        following_win (int): The year of the second win.
+
+    Returns:
+        tuple[int, str, int, int]: The ranking key.
+
+    """
+    return interval, producer, previous_win, following_win
+
+
+class IntervalIndex:
+    """In-memory index of the intervals between consecutive producer wins.
+
+    The index keeps the sorted winning years of each producer and groups every
+    interval by its length. Two heaps over the interval lengths give the current
+    minimum and maximum, with stale lengths discarded lazily when they reach the
+    top. Adding a win only touches the neighbours of the new year in the producer
+    list, so the index never has to be rebuilt after an insert. For year range
+    queries, the intervals of each length are also kept sorted by previous win,
+    built on the first range query after a change.
+
+    Every change, new win or invalidation, advances a generation counter. A
+    rebuild started at a generation that changed while its rows were read does
+    not mark the index as ready, so a commit landing between the query and the
+    rebuild is never lost.
+
+    Attributes:
+        ready (bool): Whether the index reflects the `movies` table.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index that still has to be built.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.__lock = threading.RLock()
+        self.__generation = 0
+        self.__reset()
+        self.ready = False
+
+    def __reset(self) -> None:
+        """Drop every year and interval held by the index."""
+        self.__years: dict[str, list[int]] = defaultdict(list)
+        self.__intervals: dict[int, Counter] = {}
+        self.__min_heap: list[int] = []
+        self.__max_heap: list[int] = []
+        self.__result = None
+        self.__windows = None
+
+    @property
+    def generation(self) -> int:
+        """Return the counter of the changes applied to the index."""
+        with self.__lock:
+            return self.__generation
+
+    def rebuild(self, wins: Iterable[tuple[str, int]], generation: int = None) -> None:
+        """Build the index from every winning year of every producer.
+
+        Arguments:
+            wins (Iterable[tuple[str, int]]): The (producer, year) pairs of the
+                winning movies, ordered by producer and year.
+            generation (int, optional): The `generation` read before querying the
+                wins. The index is only marked as ready if no change happened
+                since, otherwise the next read rebuilds it again.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self.__lock:
+            self.__reset()
+            for producer, year in wins:
+                years = self.__years[producer]
+                if years:
+                    self.__add_interval(producer, years[-1], year)
+                years.append(year)
+            self.ready = generation is None or generation == self.__generation
+
+    def invalidate(self) -> None:
+        """Mark the index as stale so the next read rebuilds it.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self.__lock:
+            self.__generation += 1
+            self.ready = False
+
+    def add_win(self, producer: str, year: int) -> None:
+        """Register a new winning year of a producer.
+
+        The interval between the surrounding wins, if any, is replaced by the two
+        intervals formed with the new year.
+
+        Arguments:
+            producer (str): The producer name.
+            year (int): The winning year.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self.__lock:
+            self.__generation += 1
+            years = self.__years[producer]
+            position = bisect_left(years, year)
+            previous_win = years[position - 1] if position > 0 else None
+            following_win = years[position] if position < len(years) else None
+
+            if previous_win is not None and following_win is not None:
+                self.__remove_interval(producer, previous_win, following_win)
+            if previous_win is not None:
+                self.__add_interval(producer, previous_win, year)
+            if following_win is not None:
+                self.__add_interval(producer, year, following_win)
+
+            insort(years, year)
+
+    def get_intervals(self) -> dict:
+        """Get the producers with the minimum and maximum intervals.
+
+        The result is kept until the next change, so repeated reads do not touch
+        the heaps.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            dict: A dictionary with two keys:
+                - "min" (list): The producers with the smallest winning interval.
+                - "max" (list): The producers with the largest winning interval.
+
+        """
+        with self.__lock:
+            if self.__result is None:
+                self.__result = {
+                    "min": self.__bound_entries(self.__min_heap, 1),
+                    "max": self.__bound_entries(self.__max_heap, -1),
+                }
+            return self.__result
+
+    def get_intervals_between(self, year_from: int = None, year_to: int = None,
+                              top_k: int = None) -> dict:
+        """Get the bound intervals whose wins both fall within a year range.
+
+        An interval joins two consecutive wins of a producer, so the consecutive
+        wins within the range are the intervals of the whole history that start
+        and end in it. For each interval length, the intervals starting from
+        `year_from` and ending by `year_to` are a slice of the ones sorted by
+        previous win, found with two `bisect` calls, so the query costs a few
+        bisections per length instead of a scan. Without bounds, the result is
+        the one of `get_intervals`.
+
+        Arguments:
+            year_from (int, optional): The first year of the range.
+            year_to (int, optional): The last year of the range.
+            top_k (int, optional): The number of smallest and largest intervals
+                to return instead of every interval tied on the bounds, ranked
+                by `interval_rank`.
+
+        Returns:
+            dict: A dictionary with two keys:
+                - "min" (list): The producers with the smallest winning interval.
+                - "max" (list): The producers with the largest winning interval.
+
+        """
+        with self.__lock:
+            lengths, groups = self.__window_index()
+
+            def window(length: int) -> list[tuple[str, int, int]]:
+                previous_wins, entries = groups[length]
+                start = end = None
+                if year_from is not None:
+                    start = bisect_left(previous_wins, year_from)
+                if year_to is not None:
+                    end = bisect_right(previous_wins, year_to - length)
+                return entries[start:end]
+
+            bounds = {}
+            for bound, ordered in (("min", lengths), ("max", lengths[::-1])):
+                selected = []
+                for length in ordered:
+                    entries = sorted(
+                        window(length), key=lambda entry: interval_rank(length, *entry))
+                    if top_k:
+                        selected.extend(entries[:top_k - len(selected)])
+                        if len(selected) == top_k:
+                            break
+                    elif entries:
+                        selected = entries
+                        break
+                bounds[bound] = [
+                    {
+                        "producer": producer,
+                        "interval": following_win - previous_win,
+                        "previousWin": previous_win,
+                        "followingWin": following_win,
+                    }
+                    for producer, previous_win, following_win in selected
+                ]
+            return bounds
+
+    def __window_index(self) -> tuple[list[int], dict[int, tuple[list, list]]]:
+        """Return the sorted lengths and the intervals of each by previous win."""
+        if self.__windows is None:
+            groups = {}
+            for length, counter in self.__intervals.items():
+                entries = sorted(counter.elements(), key=lambda entry: entry[1])
+                groups[length] = ([entry[1] for entry in entries], entries)
+            self.__windows = (sorted(groups), groups)
+        return self.__windows
+
+    def __add_interval(self, producer: str, previous_win: int,
+                       following_win: int) -> None:
+        """Store the interval between two consecutive wins of a producer."""
+        interval = following_win - previous_win
+        if interval not in self.__intervals:
+            self.__intervals[interval] = Counter()
+            heapq.heappush(self.__min_heap, interval)
+            heapq.heappush(self.__max_heap, -interval)
+        self.__intervals[interval][(producer, previous_win, following_win)] += 1
+        self.__result = None
+        self.__windows = None
+
+    def __remove_interval(self, producer: str, previous_win: int,
+                          following_win: int) -> None:
+        """Forget the interval between two wins that are no longer consecutive."""
+        interval = following_win - previous_win
+        entries = self.__intervals[interval]
+        entries[(producer, previous_win, following_win)] -= 1
+        if entries[(producer, previous_win, following_win)] <= 0:
+            del entries[(producer, previous_win, following_win)]
+        if not entries:
+            del self.__intervals[interval]
+        self.__result = None
+        self.__windows = None
+
+    def __bound_entries(self, heap: list[int], sign: int) -> list[dict]:
+        """Return the intervals at the top of a heap, dropping stale lengths."""
+        while heap and sign * heap[0] not in self.__intervals:
+            heapq.heappop(heap)
+        if not heap:
+            return []
+
+        interval = sign * heap[0]
+        return [
+            {
+                "producer": producer,
+                "interval": interval,
+                "previousWin": previous_win,
+                "followingWin": following_win,
+            }
+            for producer, previous_win, following_win in sorted(
+                self.__intervals[interval].elements())
+        ]
+
+
+interval_index = IntervalIndex()
@@ -1,10 +1,27 @@
 """Movies model implementation."""
-from collections import defaultdict
+import heapq
+from collections.abc import Iterable, Iterator
 
-from sqlalchemy import Column, Integer, String, Boolean, select
-from sqlalchemy.orm import Session
+import polars as pl
+from sqlalchemy import (
+    Column, Integer, String, Boolean, ForeignKey, Index, Connection, event, select,
+    CTE, Select, delete, insert, func, or_, tuple_, update
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
 
 from app.db.sqlite import Base
+from app.models.cache import data_version, result_cache
+from app.models.interval_index import interval_index, interval_rank
+from app.models.producer_index import ProducerIndex, producer_index
+from app.models.snapshot import snapshot_store, write_snapshot
+from app.models.winners_store import winners_store
+from app.utils.metrics import INTERVAL_COMPUTE
+from app.utils.tokenizer import SEPARATOR, split_producers, tokenize_credits
+from app.settings import env_data
+
+# Keeps the "IN (...)" lists below the SQLite host parameter limit.
+_SQLITE_IN_CHUNK = 500
 
 
 class Movie(Base):
@@ -12,7 +29,8 @@ class Movie(Base):
 
     This SQLAlchemy model defines the structure of the `movies` table, storing
     information about movies, including their title, release year, studios,
-    producers, and whether they won an award.
+    producers, and whether they won an award. The winners are read in producer
+    and year order from the `ix_movies_winner_producers_year` partial index.
 
     Table Name:
         movies
@@ -29,13 +47,847 @@ class Movie(Base):
 
     __tablename__ = "movies"
     id = Column(Integer, primary_key=True, index=True)
-    year = Column(Integer, nullable=False, index=True)
-    title = Column(String(255), nullable=False, index=True)
-    studios = Column(String(255), nullable=False, index=True)
-    producers = Column(String(255), nullable=False, index=True)
+    year = Column(Integer, nullable=False)
+    title = Column(String(255), nullable=False)
+    studios = Column(String(255), nullable=False)
+    producers = Column(String(255), nullable=False)
+    winner = Column(Boolean, default=False, nullable=False)
+
+
+# winner is repeated in the key so SQLite sees the index as covering, it does not
+# count the columns only referenced by the index WHERE clause.
+Index(
+    "ix_movies_winner_producers_year",
+    Movie.producers,
+    Movie.year,
+    Movie.winner,
+    sqlite_where=Movie.winner.is_(True),
+)
+
+class MoviesVersion(Base):
+    """Represents the version of the movies data shared by every process.
+
+    The single row is bumped once by every transaction that writes to the `movies`
+    table, see `bump_movies_version`, whether it is made by a worker of the
+    application or by the bulk loader. The epoch is drawn when the table is
+    created, so two databases never share a version.
+
+    Table Name:
+        movies_version
+
+    Attributes:
+        id (int): The identifier of the single row (Primary Key).
+        epoch (str): A random token of the database.
+        version (int): The number of transactions that wrote to the `movies` table.
+
+    """
+
+    __tablename__ = "movies_version"
+    id = Column(Integer, primary_key=True)
+    epoch = Column(String(32), nullable=False)
+    version = Column(Integer, nullable=False, default=0)
+
+
+MOVIES_VERSION_SEED = (
+    "INSERT INTO movies_version (id, epoch, version) "
+    "VALUES (1, lower(hex(randomblob(8))), 0)"
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_movies_version(target, connection: Connection, **kwargs) -> None:
+    """Seed the movies version along with the tables."""
+    if not connection.scalar(select(func.count()).select_from(MoviesVersion)):
+        connection.exec_driver_sql(MOVIES_VERSION_SEED)
+
+
+def bump_movies_version(connection: Connection) -> str | None:
+    """Advance the shared version of the movies data.
+
+    Writers call it once per transaction, in the transaction that writes the
+    movies, so readers of every process see the new version with the movies.
+
+    Arguments:
+        connection (Connection): The connection of the writing transaction.
+
+    Returns:
+        str: The new "epoch-version" token, `None` if the version row is missing.
+
+    """
+    row = connection.execute(
+        update(MoviesVersion)
+        .where(MoviesVersion.id == 1)
+        .values(version=MoviesVersion.version + 1)
+        .returning(MoviesVersion.epoch, MoviesVersion.version)
+    ).first()
+    return f"{row.epoch}-{row.version}" if row else None
+
+
+def read_movies_version(session: Session) -> str | None:
+    """Read the shared version of the movies data.
+
+    Arguments:
+        session (Session): The session used to read the version.
+
+    Returns:
+        str: The "epoch-version" token, `None` if the version row is missing.
+
+    """
+    row = session.execute(select(MoviesVersion.epoch, MoviesVersion.version)).first()
+    return f"{row.epoch}-{row.version}" if row else None
+
+
+def _invalidate_derived_data(token: str) -> None:
+    """Mark every structure derived from the movies for a rebuild."""
+    interval_index.invalidate()
+    winners_store.invalidate()
+    producer_index.invalidate()
+    snapshot_store.discard(token)
+
+
+def observe_movies_version(token: str | None, written: bool = False) -> bool:
+    """Follow the shared version of the movies data read from the database.
+
+    Writes made by other processes, such as another worker or the bulk loader,
+    are not seen by the commit hook of this process. When the token differs from
+    the last one observed, the interval index and the winners store are marked
+    for a rebuild and the snapshot is discarded unless it was already written for
+    the new version, like after a commit of this process, before `data_version`
+    is bumped.
+
+    Arguments:
+        token (str): The "epoch-version" token, ignored when `None`.
+        written (bool, optional): Whether the token was written by a commit of
+            this process, which refreshed the derived data itself unless another
+            process wrote in between.
+
+    Returns:
+        bool: Whether the movies were changed by another process.
+
+    """
+    if token is None:
+        return False
+    previous = None
+    if written:
+        epoch, version = token.rsplit("-", 1)
+        previous = f"{epoch}-{int(version) - 1}"
+    return data_version.observe(
+        "movies_version", token, previous, lambda: _invalidate_derived_data(token))
+
+
+def refresh_movies_version(session: Session) -> str | None:
+    """Read the shared version of the movies data and follow its changes.
+
+    Arguments:
+        session (Session): The session used to read the version.
+
+    Returns:
+        str: The "epoch-version" token, `None` if the version row is missing.
+
+    """
+    token = read_movies_version(session)
+    observe_movies_version(token)
+    return token
+
+
+# The credits columns whose consecutive wins can be analyzed, with the field
+# naming each entry of their intervals. Both columns use the same list format.
+DIMENSIONS = {
+    "producers": (Movie.producers, "producer"),
+    "studios": (Movie.studios, "studio"),
+}
+
+
+class Producer(Base):
+    """Represents a producer entity in the database.
+
+    Producer names are interned in the `producers` table, so each distinct name
+    is split out of the free-text `Movie.producers` column only once, at write
+    time, instead of on every interval request.
+
+    Table Name:
+        producers
+
+    Attributes:
+        id (int): The unique identifier for the producer (Primary Key).
+        name (str): The producer name, unique across the table.
+
+    """
+
+    __tablename__ = "producers"
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), nullable=False, unique=True)
+
+
+class MovieProducer(Base):
+    """Association between movies and their producers.
+
+    The `year` and `winner` columns are copied from the movie so the winners of a
+    producer can be read in year order straight from the
+    `ix_movie_producers_winner_producer_year` partial index.
+
+    Table Name:
+        movie_producers
+
+    Attributes:
+        movie_id (int): The movie identifier (Primary Key, Foreign Key).
+        producer_id (int): The producer identifier (Primary Key, Foreign Key).
+        year (int): The release year of the movie.
+        winner (bool): Indicates whether the movie won an award.
+
+    """
+
+    __tablename__ = "movie_producers"
+    movie_id = Column(
+        Integer, ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    producer_id = Column(Integer, ForeignKey("producers.id"), primary_key=True)
+    year = Column(Integer, nullable=False)
     winner = Column(Boolean, default=False, nullable=False)
 
 
+Index(
+    "ix_movie_producers_winner_producer_year",
+    MovieProducer.producer_id,
+    MovieProducer.year,
+    sqlite_where=MovieProducer.winner.is_(True),
+)
+
+
+def intern_producers(connection: Connection, names: Iterable[str]) -> dict[str, int]:
+    """Get the identifiers of the given producer names, creating missing ones.
+
+    Arguments:
+        connection (Connection): The connection used to read and write producers.
+        names (Iterable[str]): The producer names to intern.
+
+    Returns:
+        dict[str, int]: A mapping of each producer name to its identifier.
+
+    """
+    pending = list(dict.fromkeys(names))
+    producer_ids = {}
+
+    for start in range(0, len(pending), _SQLITE_IN_CHUNK):
+        chunk = pending[start:start + _SQLITE_IN_CHUNK]
+        query = select(Producer.name, Producer.id).where(Producer.name.in_(chunk))
+        producer_ids.update(connection.execute(query).tuples().all())
+
+    missing = [name for name in pending if name not in producer_ids]
+    for name in missing:
+        result = connection.execute(insert(Producer).values(name=name))
+        producer_ids[name] = result.inserted_primary_key[0]
+
+    return producer_ids
+
+
+def link_movie_producers(connection: Connection, movies: Iterable) -> None:
+    """Populate the `movie_producers` table for the given movies.
+
+    Each movie row must expose the `id`, `year`, `producers` and `winner`
+    attributes, as `Movie` instances and `movies` table rows do.
+
+    Arguments:
+        connection (Connection): The connection used to write the association rows.
+        movies (Iterable): The movies whose producers must be linked.
+
+    Returns:
+        None: Method without data return.
+
+    """
+    movies = [(movie, split_producers(movie.producers)) for movie in movies]
+    producer_ids = intern_producers(
+        connection, (name for _, names in movies for name in names))
+
+    links = [
+        {
+            "movie_id": movie.id,
+            "producer_id": producer_ids[name],
+            "year": movie.year,
+            "winner": movie.winner,
+        }
+        for movie, names in movies
+        for name in names
+    ]
+    if links:
+        connection.execute(insert(MovieProducer), links)
+
+
+def unlink_movie_producers(connection: Connection, movie_id: int) -> None:
+    """Remove the `movie_producers` rows of a movie.
+
+    Arguments:
+        connection (Connection): The connection used to delete the association rows.
+        movie_id (int): The identifier of the movie.
+
+    Returns:
+        None: Method without data return.
+
+    """
+    connection.execute(delete(MovieProducer).where(MovieProducer.movie_id == movie_id))
+
+
+def mark_movies_changed(session: Session, wins: Iterable[tuple[str, int]] = (),
+                        reindex: bool = False, connection: Connection = None) -> None:
+    """Flag a session so its commit refreshes the data derived from movies.
+
+    ORM writes flag their session automatically; writes made with Core statements
+    on the session connection, such as bulk imports, must call this function
+    before committing. The first call of a transaction bumps the shared version
+    of the movies data.
+
+    Arguments:
+        session (Session): The session that wrote to the `movies` table.
+        wins (Iterable[tuple[str, int]], optional): The (producer, year) pairs of
+            the new winning movies, added incrementally to the interval index.
+        reindex (bool, optional): Whether the interval index must be rebuilt
+            instead of updated with the new winning years.
+        connection (Connection, optional): The connection of the transaction,
+            given by the flush events. Defaults to the session connection.
+
+    Returns:
+        None: Method without data return.
+
+    """
+    if not session.info.get("movies_changed"):
+        session.info["movies_version"] = bump_movies_version(
+            connection or session.connection())
+    session.info["movies_changed"] = True
+    if reindex:
+        session.info["reindex_intervals"] = True
+    else:
+        session.info.setdefault("pending_wins", []).extend(wins)
+
+
+def _mark_movies_changed(connection: Connection, target: Movie,
+                         reindex: bool = False) -> None:
+    """Flag the session of a movie written through the ORM."""
+    session = object_session(target)
+    if session is None:
+        return
+
+    wins = []
+    if target.winner:
+        wins = [(producer, target.year)
+                for producer in split_producers(target.producers)]
+    mark_movies_changed(session, wins, reindex, connection)
+
+
+@event.listens_for(Movie, "after_insert")
+def _movie_after_insert(mapper, connection: Connection, target: Movie) -> None:
+    """Link the producers of a movie added through the ORM."""
+    link_movie_producers(connection, [target])
+    _mark_movies_changed(connection, target)
+
+
+@event.listens_for(Movie, "after_update")
+def _movie_after_update(mapper, connection: Connection, target: Movie) -> None:
+    """Relink the producers of a movie changed through the ORM."""
+    unlink_movie_producers(connection, target.id)
+    link_movie_producers(connection, [target])
+    _mark_movies_changed(connection, target, reindex=True)
+
+
+@event.listens_for(Movie, "after_delete")
+def _movie_after_delete(mapper, connection: Connection, target: Movie) -> None:
+    """Unlink the producers of a movie removed through the ORM."""
+    unlink_movie_producers(connection, target.id)
+    _mark_movies_changed(connection, target, reindex=True)
+
+
+@event.listens_for(Session, "after_commit")
+def _session_after_commit(session: Session) -> None:
+    """Refresh the derived data once the movie changes are visible to readers.
+
+    New winning years are added incrementally to the interval index, while
+    updates and deletes mark it for a rebuild. The winners store and the producer
+    index are marked for a rebuild and the interval snapshot, which no longer
+    matches the database, is removed. The data version is bumped last.
+
+    An index that is not ready is invalidated again rather than skipped, so a
+    rebuild that read the winners before this commit does not mark it as ready.
+    The version written by the commit is observed, so it is not mistaken for a
+    write of another process, unless one was committed in between.
+    """
+    pending_wins = session.info.pop("pending_wins", [])
+    reindex = session.info.pop("reindex_intervals", False)
+    token = session.info.pop("movies_version", None)
+    if not session.info.pop("movies_changed", False):
+        return
+
+    if reindex or not interval_index.ready:
+        interval_index.invalidate()
+    else:
+        for producer, year in pending_wins:
+            interval_index.add_win(producer, year)
+
+    winners_store.invalidate()
+    producer_index.invalidate()
+    snapshot_store.discard()
+    observe_movies_version(token, written=True)
+    data_version.bump()
+
+
+@event.listens_for(Session, "after_rollback")
+def _session_after_rollback(session: Session) -> None:
+    """Forget the movie changes discarded by a rollback."""
+    for key in ("movies_changed", "reindex_intervals", "pending_wins",
+                "movies_version"):
+        session.info.pop(key, None)
+
+
+def _winning_producer_years_query() -> Select:
+    """Build the query of the producer names and years of the winning movies.
+
+    Arguments:
+        Has no arguments.
+
+    Returns:
+        Select: The query of the (name, year) rows, ordered by producer and year.
+
+    """
+    return select(
+        Producer.name, MovieProducer.year
+    ).join(
+        Producer, Producer.id == MovieProducer.producer_id
+    ).where(
+        MovieProducer.winner.is_(True)
+    ).order_by(MovieProducer.producer_id, MovieProducer.year)
+
+
+def _producer_wins_query() -> Select:
+    """Build the query of the winning movies of every producer.
+
+    Arguments:
+        Has no arguments.
+
+    Returns:
+        Select: The query of the (name, year, title) rows, ordered by year and
+            title.
+
+    """
+    return select(
+        Producer.name, MovieProducer.year, Movie.title
+    ).join(
+        Producer, Producer.id == MovieProducer.producer_id
+    ).join(
+        Movie, Movie.id == MovieProducer.movie_id
+    ).where(
+        MovieProducer.winner.is_(True)
+    ).order_by(MovieProducer.year, Movie.title)
+
+
+def _interval_entry(entry: tuple[int, str, int, int], key: str = "producer") -> dict:
+    """Convert an (interval, name, previous, following) tuple into a dict.
+
+    Arguments:
+        entry (tuple[int, str, int, int]): The interval tuple.
+        key (str, optional): The field of the name, "producer" for the
+            `ProducersSchema` fields.
+
+    Returns:
+        dict: The interval with the schema fields.
+
+    """
+    interval, name, previous_win, following_win = entry
+    return {
+        key: name,
+        "interval": interval,
+        "previousWin": previous_win,
+        "followingWin": following_win,
+    }
+
+
+def _intervals_from_producer_years(rows: Iterable[tuple[str, int]],
+                                   key: str = "producer") -> dict:
+    """Calculate the producer intervals in Python with a single linear pass.
+
+    Consecutive rows of the same producer form an interval. The current minimum
+    and maximum are tracked while the rows stream in, keeping every interval tied
+    on either bound, so no list of all the intervals is built or sorted. The rows
+    can be of any dimension, e.g. studios, named by `key` in the result.
+
+    Arguments:
+        rows (Iterable[tuple[str, int]]): The (name, year) rows of the winners,
+            ordered by producer and year.
+        key (str, optional): The field of the name in each interval.
+
+    Returns:
+        dict: A dictionary with two keys:
+            - "min" (list): The producers with the smallest winning interval.
+            - "max" (list): The producers with the largest winning interval.
+
+    """
+    min_interval = max_interval = None
+    min_entries = []
+    max_entries = []
+    previous_producer = previous_year = None
+
+    for producer, year in rows:
+        if producer == previous_producer:
+            interval = year - previous_year
+            entry = (interval, producer, previous_year, year)
+
+            if min_interval is None or interval < min_interval:
+                min_interval = interval
+                min_entries = [entry]
+            elif interval == min_interval:
+                min_entries.append(entry)
+
+            if max_interval is None or interval > max_interval:
+                max_interval = interval
+                max_entries = [entry]
+            elif interval == max_interval:
+                max_entries.append(entry)
+
+        previous_producer, previous_year = producer, year
+
+    return {
+        "min": [_interval_entry(entry, key) for entry in sorted(min_entries)],
+        "max": [_interval_entry(entry, key) for entry in sorted(max_entries)],
+    }
+
+
+class _Descending:
+    """Invert the order of a ranking key, so a min-heap keeps the smallest keys."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: tuple) -> None:
+        """Wrap a ranking key."""
+        self.key = key
+
+    def __lt__(self, other: "_Descending") -> bool:
+        """Order the wrapped keys from the largest to the smallest."""
+        return other.key < self.key
+
+
+def _keep_smallest(heap: list, top_k: int, rank: tuple) -> None:
+    """Offer a ranking key to a heap holding the `top_k` smallest keys seen."""
+    if len(heap) < top_k:
+        heapq.heappush(heap, _Descending(rank))
+    elif rank < heap[0].key:
+        heapq.heapreplace(heap, _Descending(rank))
+
+
+def _top_intervals_from_producer_years(rows: Iterable[tuple[str, int]],
+                                       top_k: int, key: str = "producer") -> dict:
+    """Find the `top_k` smallest and largest producer intervals in one pass.
+
+    Two heaps bounded to `top_k` entries hold the best candidates seen so far, so
+    memory does not grow with the number of intervals. The intervals are ranked
+    by `interval_rank`, like in `IntervalIndex.get_intervals_between`, so the
+    ties kept do not depend on the order the rows are read in nor on the path
+    answering the request.
+
+    Arguments:
+        rows (Iterable[tuple[str, int]]): The (name, year) rows of the winners,
+            ordered by producer and year.
+        top_k (int): The number of intervals returned for each bound.
+        key (str, optional): The field of the name in each interval.
+
+    Returns:
+        dict: A dictionary with two keys:
+            - "min" (list): The smallest intervals, in ascending order.
+            - "max" (list): The largest intervals, in descending order.
+
+    """
+    smallest = []
+    largest = []
+    previous_producer = previous_year = None
+
+    for producer, year in rows:
+        if producer == previous_producer:
+            interval = year - previous_year
+            _keep_smallest(
+                smallest, top_k, interval_rank(interval, producer, previous_year, year))
+            _keep_smallest(
+                largest, top_k, interval_rank(-interval, producer, previous_year, year))
+
+        previous_producer, previous_year = producer, year
+
+    return {
+        "min": [
+            _interval_entry(rank, key)
+            for rank in sorted(item.key for item in smallest)
+        ],
+        "max": [
+            _interval_entry((-interval, *entry), key)
+            for interval, *entry in sorted(item.key for item in largest)
+        ],
+    }
+
+
+def _intervals_cte() -> CTE:
+    """Build the CTE of every interval between consecutive producer wins.
+
+    Consecutive wins of each producer are paired with
+    `LAG(year) OVER (PARTITION BY producer ORDER BY year)`. The movie of the
+    following win is kept to tell apart intervals that are otherwise identical.
+
+    Arguments:
+        Has no arguments.
+
+    Returns:
+        CTE: The "intervals" CTE, with the `ProducersSchema` columns and
+            `movie_id`.
+
+    """
+    wins = select(
+        MovieProducer.producer_id,
+        MovieProducer.movie_id,
+        func.lag(MovieProducer.year).over(
+            partition_by=MovieProducer.producer_id,
+            order_by=(MovieProducer.year, MovieProducer.movie_id)
+        ).label("previousWin"),
+        MovieProducer.year.label("followingWin"),
+    ).where(MovieProducer.winner.is_(True)).cte("wins")
+
+    return select(
+        Producer.name.label("producer"),
+        (wins.c.followingWin - wins.c.previousWin).label("interval"),
+        wins.c.previousWin,
+        wins.c.followingWin,
+        wins.c.movie_id,
+    ).join(
+        Producer, Producer.id == wins.c.producer_id
+    ).where(wins.c.previousWin.is_not(None)).cte("intervals")
+
+
+def _interval_bounds_query() -> Select:
+    """Build the query of the producer intervals at the minimum and maximum.
+
+    Only the intervals equal to the minimum or the maximum are returned by the
+    query, so every producer tied on either bound is included.
+
+    Arguments:
+        Has no arguments.
+
+    Returns:
+        Select: The query of the bound intervals, ordered by interval and producer.
+
+    """
+    intervals = _intervals_cte()
+
+    return select(
+        intervals.c.producer,
+        intervals.c.interval,
+        intervals.c.previousWin,
+        intervals.c.followingWin,
+    ).where(
+        or_(
+            intervals.c.interval == select(
+                func.min(intervals.c.interval)).scalar_subquery(),
+            intervals.c.interval == select(
+                func.max(intervals.c.interval)).scalar_subquery(),
+        )
+    ).order_by(intervals.c.interval, intervals.c.producer, intervals.c.previousWin)
+
+
+def _intervals_page_query(limit: int = None, after: tuple = None) -> Select:
+    """Build the keyset-paginated query of every producer interval.
+
+    Arguments:
+        limit (int, optional): The maximum number of intervals of the page, every
+            interval when omitted.
+        after (tuple, optional): The (interval, producer, previousWin, movie_id)
+            key of the last interval of the previous page.
+
+    Returns:
+        Select: The query of the page, ordered by the keyset columns.
+
+    """
+    intervals = _intervals_cte()
+    key = (intervals.c.interval, intervals.c.producer,
+           intervals.c.previousWin, intervals.c.movie_id)
+
+    query = select(
+        intervals.c.producer,
+        intervals.c.interval,
+        intervals.c.previousWin,
+        intervals.c.followingWin,
+        intervals.c.movie_id,
+    ).order_by(*key)
+
+    if limit is not None:
+        query = query.limit(limit)
+
+    if after is not None:
+        query = query.where(tuple_(*key) > tuple_(*after))
+
+    return query
+
+
+def _intervals_from_bound_rows(rows: Iterable) -> dict:
+    """Split the rows of `_interval_bounds_query` into minimum and maximum.
+
+    Arguments:
+        rows (Iterable): The rows returned by the bounds query.
+
+    Returns:
+        dict: A dictionary with two keys:
+            - "min" (list): The producers with the smallest winning interval.
+            - "max" (list): The producers with the largest winning interval.
+
+    """
+    rows = [row._asdict() for row in rows]
+
+    if not rows:
+        return {"min": [], "max": []}
+
+    min_interval = rows[0]["interval"]
+    max_interval = rows[-1]["interval"]
+
+    return {
+        "min": [row for row in rows if row["interval"] == min_interval],
+        "max": [row for row in rows if row["interval"] == max_interval],
+    }
+
+
+def _winning_movies_query() -> Select:
+    """Build the query of the raw producers column and year of the winning movies.
+
+    The rows are read in the order of the `ix_movies_winner_producers_year` partial
+    index, which covers the query, so SQLite neither visits the table nor sorts.
+
+    Arguments:
+        Has no arguments.
+
+    Returns:
+        Select: The query of the (producers, year) rows.
+
+    """
+    return select(Movie.producers, Movie.year).where(
+        Movie.winner.is_(True)
+    ).order_by(Movie.producers, Movie.year)
+
+
+def _winning_credits_query(dimension: str) -> Select:
+    """Build the query of a raw credits column and year of the winning movies.
+
+    Arguments:
+        dimension (str): The credits column, one of `DIMENSIONS`.
+
+    Returns:
+        Select: The query of the (credits, year) rows.
+
+    """
+    column, _ = DIMENSIONS[dimension]
+    return select(column, Movie.year).where(Movie.winner.is_(True))
+
+
+def _dimension_years(rows: Iterable[tuple[str, int]]) -> list[tuple[str, int]]:
+    """Split the credits of the winning movies into (name, year) pairs.
+
+    Arguments:
+        rows (Iterable[tuple[str, int]]): The (credits, year) rows of the winners.
+
+    Returns:
+        list[tuple[str, int]]: The pairs, ordered by name and year.
+
+    """
+    return sorted(
+        (name, year) for credits, year in rows for name in tokenize_credits(credits))
+
+
+def _intervals_from_polars(rows: Iterable[tuple[str, int]]) -> dict:
+    """Calculate the producer intervals with vectorized polars expressions.
+
+    The producers column is split with the separator of the producer tokenizer,
+    normalized the same way and exploded into one row per producer, the years of
+    each producer are sorted and diffed, and the bounds are selected with
+    filters, without Python-level loops over the rows.
+
+    Arguments:
+        rows (Iterable[tuple[str, int]]): The (producers, year) rows of the winners.
+
+    Returns:
+        dict: A dictionary with two keys:
+            - "min" (list): The producers with the smallest winning interval.
+            - "max" (list): The producers with the largest winning interval.
+
+    """
+    movies = pl.DataFrame(
+        list(rows), schema={"producers": pl.String, "year": pl.Int64}, orient="row")
+
+    intervals = movies.lazy().with_row_index("movie").select(
+        pl.col("movie"),
+        pl.col("year"),
+        pl.col("producers").str.replace_all(SEPARATOR.pattern, ",")
+        .str.split(",").alias("producer"),
+    ).explode("producer").with_columns(
+        pl.col("producer").str.normalize("NFC")
+        .str.replace_all(r"\s+", " ").str.strip_chars()
+    ).filter(
+        pl.col("producer") != ""
+    ).unique(
+        subset=["movie", "producer"]
+    ).sort(["producer", "year"]).with_columns(
+        pl.col("year").diff().over("producer").alias("interval")
+    ).drop_nulls("interval").select(
+        pl.col("producer"),
+        pl.col("interval"),
+        (pl.col("year") - pl.col("interval")).alias("previousWin"),
+        pl.col("year").alias("followingWin"),
+    ).filter(
+        (pl.col("interval") == pl.col("interval").min())
+        | (pl.col("interval") == pl.col("interval").max())
+    ).sort(["interval", "producer", "previousWin"]).collect()
+
+    if intervals.is_empty():
+        return {"min": [], "max": []}
+
+    bounds = intervals["interval"]
+    return {
+        "min": intervals.filter(pl.col("interval") == bounds.min()).to_dicts(),
+        "max": intervals.filter(pl.col("interval") == bounds.max()).to_dicts(),
+    }
+
+
+def _write_snapshot(session: Session) -> tuple[int | None, dict]:
+    """Write the snapshot of the committed winners, tagged with their version.
+
+    The version is read before the winners and again right before the file is
+    renamed over the current one, so a snapshot computed from rows that a commit
+    replaced in the meantime is dropped instead of being mapped by every worker.
+    The async DTO runs it through `AsyncSession.run_sync`.
+
+    Arguments:
+        session (Session): The session used to read the winners.
+
+    Returns:
+        tuple[int | None, dict]: The generation of the written snapshot, `None`
+            if it was dropped, and the intervals computed from the winners.
+
+    """
+    token = read_movies_version(session)
+    wins = session.execute(_winning_producer_years_query()).tuples().all()
+    intervals = _intervals_from_producer_years(wins)
+    generation = write_snapshot(
+        snapshot_store.path, wins, intervals, token,
+        lambda: read_movies_version(session) == token)
+    return generation, intervals
+
+
+def _resolve_engine(engine: str = None) -> str:
+    """Validate an interval engine name, defaulting to the configured one.
+
+    Arguments:
+        engine (str, optional): The interval engine name.
+
+    Returns:
+        str: The interval engine name.
+
+    Raises:
+        ValueError: If the engine is not one of `MovieDTO.ENGINES`.
+
+    """
+    engine = engine or env_data.INTERVAL_ENGINE
+    if engine not in MovieDTO.ENGINES:
+        raise ValueError(f"Unknown interval engine: {engine}")
+
+    return engine
+
+
 class MovieDTO:
     """Data Transfer Object for movies.
 
@@ -44,8 +896,19 @@ class MovieDTO:
     on movies that have won awards. It provides methods to query winning movies and
     return relevant information.
 
+    The intervals can be computed by six engines: "python", which loads every
+    winning row and builds the intervals in memory, "sql", which lets SQLite
+    compute them with window functions and only transfers the rows at the minimum
+    and maximum intervals, "polars", which splits the raw producers column and
+    computes the intervals with vectorized polars expressions, "index", which
+    answers from the incrementally maintained `interval_index`, "snapshot",
+    which reads the precomputed intervals of the snapshot file shared by every
+    worker process, and "columnar", which scans the typed arrays of the
+    `winners_store`.
+
     Attributes:
         __session (Session): The SQLAlchemy session used to interact with the database.
+        __engine (str): The engine used to compute the intervals.
 
     Methods:
         get_winning_movies(): Retrieves all winning movies and their associated
@@ -53,7 +916,9 @@ class MovieDTO:
 
     """
 
-    def __init__(self, session: Session):
+    ENGINES = ("python", "sql", "polars", "index", "snapshot", "columnar")
+
+    def __init__(self, session: Session, engine: str = None):
         """Initialize the MovieDTO with a database session.
 
         This method initializes the MovieDTO instance with a SQLAlchemy session,
@@ -62,61 +927,518 @@ class MovieDTO:
         Arguments:
             session (Session): The database session used to interact with the movie
                 database.
+            engine (str, optional): The interval engine, one of `ENGINES`. Defaults
+                to the `INTERVAL_ENGINE` setting.
 
         Returns:
             None: Method without data return.
 
+        Raises:
+            ValueError: If the engine is not one of `ENGINES`.
+
         """
         self.__session = session
+        self.__engine = _resolve_engine(engine)
+
+    @property
+    def engine(self) -> str:
+        """Return the engine used to compute the intervals."""
+        return self.__engine
 
-    def get_winning_movies(self) -> dict:
+    def get_winning_movies(self, top_k: int = None) -> dict:
         """Get winning movies and calculate intervals for each producer.
 
-        This method executes a query to select the producers and years of winning
-        movies. It then calculates the intervals between the years each producer won.
-        The results are sorted by the interval and returned, with the minimum and
-        maximum intervals separately.
+        The calculation is delegated to the engine selected when the DTO was
+        created. The "index" engine builds the index from the database on first
+        use, or after an update or delete marked it as stale, the "columnar"
+        engine rebuilds the winners store after any change, and the "snapshot"
+        engine writes the snapshot file when it is missing or was written for
+        another version of the movies. When `top_k` is
+        given, the intervals are ranked by a bounded-heap pass over the winners,
+        whatever the engine.
 
         Arguments:
-            Has no arguments.
+            top_k (int, optional): The number of smallest and largest intervals
+                to return instead of every interval tied on the bounds.
 
         Returns:
             dict: A dictionary with two keys:
-                - "min" (list): A list containing the producer with the smallest
-                    winning interval.
-                - "max" (list): A list containing the producer with the largest
-                    winning interval.
+                - "min" (list): The producers with the smallest winning interval.
+                - "max" (list): The producers with the largest winning interval.
+
+        """
+        with INTERVAL_COMPUTE.timer("top_k" if top_k else self.__engine):
+            return self.__compute(top_k)
+
+    def __compute(self, top_k: int = None) -> dict:
+        """Run the selected engine, see `get_winning_movies`."""
+        if top_k:
+            return _top_intervals_from_producer_years(
+                self.__session.execute(_winning_producer_years_query()).tuples(),
+                top_k)
+
+        if self.__engine == "sql":
+            return _intervals_from_bound_rows(
+                self.__session.execute(_interval_bounds_query()))
+
+        if self.__engine == "polars":
+            return _intervals_from_polars(
+                self.__session.execute(_winning_movies_query()).tuples())
+
+        if self.__engine == "index":
+            if not interval_index.ready:
+                self.rebuild_interval_index()
+            return interval_index.get_intervals()
+
+        if self.__engine == "columnar":
+            if not winners_store.ready:
+                generation = winners_store.generation
+                winners_store.rebuild(
+                    self.__session.execute(_winning_producer_years_query()).tuples(),
+                    generation)
+            return winners_store.get_intervals()
+
+        if self.__engine == "snapshot":
+            snapshot = snapshot_store.current(refresh_movies_version(self.__session))
+            if snapshot is None:
+                return _write_snapshot(self.__session)[1]
+            return snapshot.get_intervals()
+
+        return _intervals_from_producer_years(
+            self.__session.execute(_winning_producer_years_query()).tuples())
+
+    def rebuild_interval_index(self) -> None:
+        """Rebuild the shared interval index from the winning movies.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        generation = interval_index.generation
+        interval_index.rebuild(
+            self.__session.execute(_winning_producer_years_query()).tuples().all(),
+            generation)
+
+    def get_intervals_between(self, year_from: int = None, year_to: int = None,
+                              top_k: int = None) -> dict:
+        """Get the producer intervals whose wins fall within a year range.
+
+        The range is answered by the shared `interval_index`, whatever the engine,
+        so the `movies` table is only read when the index has to be rebuilt. The
+        shared version of the movies is read first, so a write of another process
+        marks the index for a rebuild, see `refresh_movies_version`.
+
+        Arguments:
+            year_from (int, optional): The first year of the range.
+            year_to (int, optional): The last year of the range.
+            top_k (int, optional): The number of smallest and largest intervals
+                to return instead of every interval tied on the bounds.
+
+        Returns:
+            dict: A dictionary with the "min" and "max" producer intervals.
+
+        """
+        with INTERVAL_COMPUTE.timer("year_range"):
+            refresh_movies_version(self.__session)
+            if not interval_index.ready:
+                self.rebuild_interval_index()
+            return interval_index.get_intervals_between(year_from, year_to, top_k)
+
+    def get_dimension_intervals(self, dimension: str, top_k: int = None) -> dict:
+        """Get the intervals between consecutive wins of a movie dimension.
+
+        The producers are computed by the selected engine, see
+        `get_winning_movies`. Other dimensions are read from their credits column,
+        split by the shared tokenizer and computed by the Python engine.
+
+        Arguments:
+            dimension (str): The dimension, one of `DIMENSIONS`.
+            top_k (int, optional): The number of smallest and largest intervals
+                to return instead of every interval tied on the bounds.
+
+        Returns:
+            dict: A dictionary with the "min" and "max" intervals, whose entries
+                name the dimension with its singular field, e.g. "studio".
+
+        Raises:
+            ValueError: If the dimension is not one of `DIMENSIONS`.
+
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension: {dimension}")
+        if dimension == "producers":
+            return self.get_winning_movies(top_k)
+
+        _, key = DIMENSIONS[dimension]
+        with INTERVAL_COMPUTE.timer(dimension):
+            wins = _dimension_years(
+                self.__session.execute(_winning_credits_query(dimension)).tuples())
+            if top_k:
+                return _top_intervals_from_producer_years(wins, top_k, key)
+            return _intervals_from_producer_years(wins, key)
+
+    def get_producer_index(self) -> ProducerIndex:
+        """Get the producer name index, rebuilding it if the data version changed.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            ProducerIndex: The shared `producer_index`, built for the current data
+                version.
+
+        """
+        version = data_version.value
+        if producer_index.version != version:
+            producer_index.rebuild(
+                self.__session.scalars(select(Producer.name)),
+                self.__session.execute(_producer_wins_query()).tuples(),
+                version)
+        return producer_index
+
+    def write_snapshot(self) -> int | None:
+        """Write the winning years and intervals to the shared snapshot file.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            int: The generation of the written snapshot, `None` if a commit
+                changed the movies while it was written, see `_write_snapshot`.
+
+        """
+        return _write_snapshot(self.__session)[0]
+
+    def get_intervals_page(self, limit: int = None, after: tuple = None) -> list[dict]:
+        """Get a page of every producer interval, using keyset pagination.
+
+        Each page runs the window function over the winners, read in producer and
+        year order from the `ix_movie_producers_winner_producer_year` index, and
+        only the rows after the cursor are returned.
+
+        Arguments:
+            limit (int, optional): The maximum number of intervals of the page,
+                every interval when omitted.
+            after (tuple, optional): The (interval, producer, previousWin,
+                movie_id) key of the last interval of the previous page.
+
+        Returns:
+            list[dict]: The intervals ordered by interval, producer and previous
+                win, each with the `movie_id` of its following win.
+
+        """
+        query = _intervals_page_query(limit, after)
+        return [row._asdict() for row in self.__session.execute(query)]
+
+    def iter_intervals(self, batch_size: int = 1000) -> Iterator[dict]:
+        """Yield every producer interval as it is computed.
+
+        The winners are fetched `batch_size` rows at a time with `yield_per`, so
+        neither the rows nor the intervals are ever held in memory as a whole.
+        Intervals are yielded in producer and year order.
+
+        Arguments:
+            batch_size (int, optional): The number of rows fetched per batch.
+
+        Returns:
+            Iterator[dict]: Yields each interval.
+
+        """
+        query = _winning_producer_years_query().execution_options(
+            yield_per=batch_size)
+        previous_producer = previous_year = None
+
+        for producer, year in self.__session.execute(query).tuples():
+            if producer == previous_producer:
+                yield _interval_entry(
+                    (year - previous_year, producer, previous_year, year))
+            previous_producer, previous_year = producer, year
+
+
+class AsyncMovieDTO:
+    """Asynchronous Data Transfer Object for movies.
+
+    The asynchronous counterpart of `MovieDTO`: it runs the same queries and
+    engines on an `AsyncSession`, so the interval routes can be served without
+    taking a slot of the thread pool.
+
+    Attributes:
+        __session (AsyncSession): The SQLAlchemy async session used to interact
+            with the database.
+        __engine (str): The engine used to compute the intervals.
+
+    """
+
+    def __init__(self, session: AsyncSession, engine: str = None):
+        """Initialize the AsyncMovieDTO with an async database session.
+
+        Arguments:
+            session (AsyncSession): The async database session used to interact
+                with the movie database.
+            engine (str, optional): The interval engine, one of `MovieDTO.ENGINES`.
+                Defaults to the `INTERVAL_ENGINE` setting.
+
+        Returns:
+            None: Method without data return.
+
+        Raises:
+            ValueError: If the engine is not one of `MovieDTO.ENGINES`.
+
+        """
+        self.__session = session
+        self.__engine = _resolve_engine(engine)
+
+    @property
+    def engine(self) -> str:
+        """Return the engine used to compute the intervals."""
+        return self.__engine
+
+    async def get_winning_movies(self, top_k: int = None) -> dict:
+        """Get winning movies and calculate intervals for each producer.
+
+        Arguments:
+            top_k (int, optional): The number of smallest and largest intervals
+                to return instead of every interval tied on the bounds.
+
+        Returns:
+            dict: A dictionary with the "min" and "max" producer intervals.
+
+        """
+        with INTERVAL_COMPUTE.timer("top_k" if top_k else self.__engine):
+            return await self.__compute(top_k)
+
+    async def __compute(self, top_k: int = None) -> dict:
+        """Run the selected engine, see `get_winning_movies`."""
+        if top_k:
+            result = await self.__session.execute(_winning_producer_years_query())
+            return _top_intervals_from_producer_years(result.tuples(), top_k)
+
+        if self.__engine == "sql":
+            return _intervals_from_bound_rows(
+                await self.__session.execute(_interval_bounds_query()))
+
+        if self.__engine == "polars":
+            result = await self.__session.execute(_winning_movies_query())
+            return _intervals_from_polars(result.tuples())
+
+        if self.__engine == "index":
+            if not interval_index.ready:
+                await self.rebuild_interval_index()
+            return interval_index.get_intervals()
+
+        if self.__engine == "columnar":
+            if not winners_store.ready:
+                generation = winners_store.generation
+                result = await self.__session.execute(_winning_producer_years_query())
+                winners_store.rebuild(result.tuples(), generation)
+            return winners_store.get_intervals()
+
+        if self.__engine == "snapshot":
+            snapshot = snapshot_store.current(
+                await self.__session.run_sync(refresh_movies_version))
+            if snapshot is None:
+                return (await self.__session.run_sync(_write_snapshot))[1]
+            return snapshot.get_intervals()
+
+        result = await self.__session.execute(_winning_producer_years_query())
+        return _intervals_from_producer_years(result.tuples())
+
+    async def rebuild_interval_index(self) -> None:
+        """Rebuild the shared interval index from the winning movies.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        generation = interval_index.generation
+        result = await self.__session.execute(_winning_producer_years_query())
+        interval_index.rebuild(result.tuples().all(), generation)
+
+    async def get_intervals_between(self, year_from: int = None,
+                                    year_to: int = None, top_k: int = None) -> dict:
+        """Get the producer intervals whose wins fall within a year range.
+
+        The shared version of the movies is read first, like in
+        `MovieDTO.get_intervals_between`.
+
+        Arguments:
+            year_from (int, optional): The first year of the range.
+            year_to (int, optional): The last year of the range.
+            top_k (int, optional): The number of smallest and largest intervals
+                to return instead of every interval tied on the bounds.
+
+        Returns:
+            dict: A dictionary with the "min" and "max" producer intervals.
+
+        """
+        with INTERVAL_COMPUTE.timer("year_range"):
+            observe_movies_version(await self.__session.run_sync(read_movies_version))
+            if not interval_index.ready:
+                await self.rebuild_interval_index()
+            return interval_index.get_intervals_between(year_from, year_to, top_k)
+
+    async def get_dimension_intervals(self, dimension: str, top_k: int = None) -> dict:
+        """Get the intervals between consecutive wins of a movie dimension.
+
+        Arguments:
+            dimension (str): The dimension, one of `DIMENSIONS`.
+            top_k (int, optional): The number of smallest and largest intervals
+                to return instead of every interval tied on the bounds.
+
+        Returns:
+            dict: A dictionary with the "min" and "max" intervals, whose entries
+                name the dimension with its singular field, e.g. "studio".
+
+        Raises:
+            ValueError: If the dimension is not one of `DIMENSIONS`.
+
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension: {dimension}")
+        if dimension == "producers":
+            return await self.get_winning_movies(top_k)
+
+        _, key = DIMENSIONS[dimension]
+        with INTERVAL_COMPUTE.timer(dimension):
+            result = await self.__session.execute(_winning_credits_query(dimension))
+            wins = _dimension_years(result.tuples())
+            if top_k:
+                return _top_intervals_from_producer_years(wins, top_k, key)
+            return _intervals_from_producer_years(wins, key)
+
+    async def write_snapshot(self) -> int | None:
+        """Write the winning years and intervals to the shared snapshot file.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            int: The generation of the written snapshot, `None` if a commit
+                changed the movies while it was written, see `_write_snapshot`.
 
         """
-        query = select(
-            Movie.producers, Movie.year
-        ).where(Movie.winner.is_(True)).order_by(Movie.producers, Movie.year)
-        movies = (self.__session.execute(query)).all()
+        return (await self.__session.run_sync(_write_snapshot))[0]
 
-        producer_years = defaultdict(list)
 
-        for movie in movies:
-            cleaned_producers = movie.producers.replace(" and ", ",")
-            producers = [producer.strip() for producer in cleaned_producers.split(",")]
+class CachedMovieDTO(MovieDTO):
+    """Movie DTO whose interval results are cached per data version.
 
-            for producer in producers:
-                producer_years[producer].append(movie.year)
+    Results are stored in `result_cache` under the engine and the current
+    `data_version`, so they are reused until a commit changes the `movies` table or
+    the entry expires. The cached dictionaries are shared between callers and must
+    not be mutated.
+    """
 
-        intervals = []
-        for producer, years in producer_years.items():
-            years.sort()
-            for i in range(len(years) - 1):
-                intervals.append({
-                    "producer": producer,
-                    "interval": years[i + 1] - years[i],
-                    "previousWin": years[i],
-                    "followingWin": years[i + 1]
-                })
+    def get_winning_movies(self, top_k: int = None) -> dict:
+        """Get the producer intervals from the cache, computing them on a miss.
 
-        sorted_intervals = sorted(intervals, key=lambda x: x["interval"])
+        Arguments:
+            top_k (int, optional): The number of smallest and largest intervals
+                to return instead of every interval tied on the bounds.
+
+        Returns:
+            dict: A dictionary with the "min" and "max" producer intervals.
+
+        """
+        key = ("producer_intervals", self.engine, top_k, data_version.value)
+        compute = super().get_winning_movies
+        return result_cache.get_or_set(key, lambda: compute(top_k))
+
+    def get_dimension_intervals(self, dimension: str, top_k: int = None) -> dict:
+        """Get the intervals of a dimension from the cache, computing them on a miss.
+
+        The producers share the entries of `get_winning_movies`.
+
+        Arguments:
+            dimension (str): The dimension, one of `DIMENSIONS`.
+            top_k (int, optional): The number of smallest and largest intervals
+                to return instead of every interval tied on the bounds.
+
+        Returns:
+            dict: A dictionary with the "min" and "max" intervals.
+
+        """
+        if dimension == "producers":
+            return self.get_winning_movies(top_k)
 
-        min_intervals = [sorted_intervals[0]]
+        key = ("dimension_intervals", dimension, top_k, data_version.value)
+        compute = super().get_dimension_intervals
+        return result_cache.get_or_set(key, lambda: compute(dimension, top_k))
 
-        max_intervals = [sorted_intervals[-1]]
+    def get_intervals_page(self, limit: int = None, after: tuple = None) -> list[dict]:
+        """Get a page of every producer interval from the cache, querying it on a miss.
+
+        Each page is read with the keyset query of `MovieDTO.get_intervals_page`
+        and only that page is cached, under its limit and cursor, so the whole
+        list of intervals is never held in memory.
+
+        Arguments:
+            limit (int, optional): The maximum number of intervals of the page,
+                every interval when omitted.
+            after (tuple, optional): The (interval, producer, previousWin,
+                movie_id) key of the last interval of the previous page.
+
+        Returns:
+            list[dict]: The intervals ordered by interval, producer and previous
+                win, each with the `movie_id` of its following win.
+
+        """
+        after = tuple(after) if after is not None else None
+        key = ("producer_intervals_page", limit, after, data_version.value)
+        compute = super().get_intervals_page
+        return result_cache.get_or_set(key, lambda: compute(limit, after))
+
+
+class CachedAsyncMovieDTO(AsyncMovieDTO):
+    """Async movie DTO whose interval results are cached per data version.
+
+    It shares the `result_cache` entries of `CachedMovieDTO`.
+    """
+
+    async def get_winning_movies(self, top_k: int = None) -> dict:
+        """Get the producer intervals from the cache, computing them on a miss.
+
+        Arguments:
+            top_k (int, optional): The number of smallest and largest intervals
+                to return instead of every interval tied on the bounds.
+
+        Returns:
+            dict: A dictionary with the "min" and "max" producer intervals.
+
+        """
+        key = ("producer_intervals", self.engine, top_k, data_version.value)
+        intervals = result_cache.get(key)
+        if intervals is None:
+            intervals = await super().get_winning_movies(top_k)
+            result_cache.set(key, intervals)
+        return intervals
+
+    async def get_dimension_intervals(self, dimension: str, top_k: int = None) -> dict:
+        """Get the intervals of a dimension from the cache, computing them on a miss.
+
+        The producers share the entries of `get_winning_movies`.
+
+        Arguments:
+            dimension (str): The dimension, one of `DIMENSIONS`.
+            top_k (int, optional): The number of smallest and largest intervals
+                to return instead of every interval tied on the bounds.
+
+        Returns:
+            dict: A dictionary with the "min" and "max" intervals.
+
+        """
+        if dimension == "producers":
+            return await self.get_winning_movies(top_k)
 
-        return {"min": min_intervals, "max": max_intervals}
+        key = ("dimension_intervals", dimension, top_k, data_version.value)
+        intervals = result_cache.get(key)
+        if intervals is None:
+            intervals = await super().get_dimension_intervals(dimension, top_k)
+            result_cache.set(key, intervals)
+        return intervals
@@ -0,0 +1,134 @@
+"""Sorted producer name index implementation."""
+
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections.abc import Iterable
+
+from app.utils.tokenizer import WHITESPACE, normalize_name
+
+
+def search_key(name: str, prefix: bool = False) -> str:
+    """Return the key a producer name is searched by.
+
+    A prefix keeps its trailing whitespace, collapsed into one space, so "joel "
+    only matches names with a word starting after "joel".
+
+    Arguments:
+        name (str): The producer name or prefix.
+        prefix (bool, optional): Whether `name` is a prefix. Defaults to False.
+
+    Returns:
+        str: The normalized, case-folded name.
+
+    """
+    if prefix:
+        name = WHITESPACE.sub(" ", unicodedata.normalize("NFC", name))
+        return name.lstrip().casefold()
+    return normalize_name(name).casefold()
+
+
+class ProducerIndex:
+    """In-memory index of the producer names and their winning movies.
+
+    The names are kept sorted by their case-folded key, so a prefix search is a
+    `bisect` to the first candidate followed by at most `limit` comparisons, and
+    the wins of each producer are kept by name. The index is built for a data
+    version and rebuilt by its reader when the version changes.
+
+    Attributes:
+        version (int): The data version the index was built for, `None` before the
+            first build.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index that still has to be built.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.__lock = threading.Lock()
+        self.__keys: list[str] = []
+        self.__names: list[str] = []
+        self.__wins: dict[str, list[tuple[int, str]]] = {}
+        self.version = None
+
+    def rebuild(self, names: Iterable[str], wins: Iterable[tuple[str, int, str]],
+                version: int) -> None:
+        """Build the index from every producer name and winning movie.
+
+        Arguments:
+            names (Iterable[str]): The producer names.
+            wins (Iterable[tuple[str, int, str]]): The (producer, year, title) rows
+                of the winning movies, ordered by year.
+            version (int): The data version the rows were read at.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        producers = {name: [] for name in names}
+        for producer, year, title in wins:
+            producers.setdefault(producer, []).append((year, title))
+        entries = sorted((search_key(name), name) for name in producers)
+
+        with self.__lock:
+            self.__keys = [key for key, _ in entries]
+            self.__names = [name for _, name in entries]
+            self.__wins = producers
+            self.version = version
+
+    def invalidate(self) -> None:
+        """Mark the index as stale so the next read rebuilds it.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self.__lock:
+            self.version = None
+
+    def search(self, prefix: str, limit: int) -> list[str]:
+        """Find the producer names starting with a prefix, ignoring case.
+
+        Arguments:
+            prefix (str): The beginning of the names.
+            limit (int): The maximum number of names returned.
+
+        Returns:
+            list[str]: The matching names, in key order.
+
+        """
+        key = search_key(prefix, prefix=True)
+        with self.__lock:
+            keys, names = self.__keys, self.__names
+        start = bisect_left(keys, key)
+        end = start
+        while end < len(keys) and end - start < limit and keys[end].startswith(key):
+            end += 1
+        return names[start:end]
+
+    def get_wins(self, name: str) -> list[tuple[int, str]] | None:
+        """Get the winning movies of a producer.
+
+        Arguments:
+            name (str): The producer name.
+
+        Returns:
+            list[tuple[int, str]]: The (year, title) of each win, ordered by year,
+                or `None` if the producer is unknown.
+
+        """
+        with self.__lock:
+            return self.__wins.get(normalize_name(name))
+
+
+producer_index = ProducerIndex()
@@ -0,0 +1,320 @@
+"""Shared interval snapshot implementation."""
+
+import contextlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from array import array
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from app.settings import env_data
+
+MAGIC = b"AWIS"
+FORMAT_VERSION = 2
+# magic, format version, reserved, generation, movies version token, producers,
+# years, min and max bounds
+HEADER = struct.Struct("<4sHHQ48sIIII")
+
+
+def snapshot_path() -> Path:
+    """Return the path of the snapshot file from the `SNAPSHOT_PATH` setting.
+
+    Arguments:
+        Has no arguments.
+
+    Returns:
+        Path: The absolute path, relative paths being resolved from `ROOT_DIR`.
+
+    """
+    return Path(env_data.ROOT_DIR, env_data.SNAPSHOT_PATH)
+
+
+def write_snapshot(path: str | Path, wins: Iterable[tuple[str, int]],
+                   intervals: dict, token: str = None,
+                   is_current: Callable[[], bool] = None) -> int | None:
+    """Write the winning years and precomputed intervals as a snapshot file.
+
+    The layout is a fixed header, holding the version token of the movies the
+    snapshot was computed from, followed by little-endian arrays: the name and
+    year offsets of every producer (sorted by name), their winning years, the
+    (producer, previousWin, followingWin) records of the minimum and maximum
+    intervals and the UTF-8 producer names. The file is written next to the
+    target and renamed over it, so readers see the old or the new snapshot, never
+    a partial one. It is only renamed if `is_current` still holds, so a snapshot
+    of rows a concurrent commit replaced is dropped instead.
+
+    Arguments:
+        path (str | Path): The path of the snapshot file.
+        wins (Iterable[tuple[str, int]]): The (producer, year) pairs of the winning
+            movies.
+        intervals (dict): The "min" and "max" intervals of the producers.
+        token (str, optional): The version token of the movies.
+        is_current (Callable[[], bool], optional): Checks, right before the
+            rename, that the movies still have the version `token`.
+
+    Returns:
+        int: The generation of the written snapshot, `None` if it was dropped.
+
+    """
+    years_by_name = defaultdict(list)
+    for producer, year in wins:
+        years_by_name[producer].append(year)
+    names = sorted(years_by_name)
+    positions = {name: position for position, name in enumerate(names)}
+
+    name_offsets, year_offsets = array("I", [0]), array("I", [0])
+    years, blob = array("H"), bytearray()
+    for name in names:
+        blob += name.encode()
+        name_offsets.append(len(blob))
+        years.extend(sorted(years_by_name[name]))
+        year_offsets.append(len(years))
+    if len(years) % 2:
+        years.append(0)
+
+    bounds = {}
+    for bound in ("min", "max"):
+        bounds[bound] = array("I", [
+            value for entry in intervals[bound]
+            for value in (positions[entry["producer"]], entry["previousWin"],
+                          entry["followingWin"])
+        ])
+
+    generation = time.time_ns()
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, generation,
+                         (token or "").encode(), len(names), year_offsets[-1],
+                         len(intervals["min"]), len(intervals["max"]))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, prefix=path.name)
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(header)
+            for section in (name_offsets, year_offsets, years, bounds["min"],
+                            bounds["max"]):
+                file.write(section.tobytes())
+            file.write(blob)
+        if is_current is not None and not is_current():
+            os.unlink(temporary)
+            return None
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return generation
+
+
+class Snapshot:
+    """A snapshot file memory-mapped read-only.
+
+    The arrays are read in place from the mapping, which the operating system
+    shares between every process that maps the same file.
+
+    Attributes:
+        generation (int): The generation written in the header.
+        token (str): The version token of the movies, `None` if unknown.
+        producers (int): The number of producers.
+
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Map a snapshot file.
+
+        Arguments:
+            path (str | Path): The path of the snapshot file.
+
+        Returns:
+            None: Method without data return.
+
+        Raises:
+            ValueError: If the file is not a snapshot of a supported format.
+
+        """
+        with open(path, "rb") as file:
+            self.__buffer = memoryview(
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+        magic, version, _, self.generation, token, self.producers, years, minimum, \
+            maximum = HEADER.unpack_from(self.__buffer)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot file: {path}")
+        self.token = token.rstrip(b"\0").decode() or None
+
+        offset = HEADER.size
+        self.__name_offsets, offset = self.__section(offset, "I", self.producers + 1)
+        self.__year_offsets, offset = self.__section(offset, "I", self.producers + 1)
+        self.__years, offset = self.__section(offset, "H", years + years % 2)
+        self.__min, offset = self.__section(offset, "I", minimum * 3)
+        self.__max, offset = self.__section(offset, "I", maximum * 3)
+        self.__names = self.__buffer[offset:]
+        self.__intervals = None
+
+    def __section(self, offset: int, code: str, length: int) -> tuple[memoryview, int]:
+        """Return a typed view of an array of the file and the offset after it."""
+        end = offset + length * struct.calcsize(code)
+        return self.__buffer[offset:end].cast(code), end
+
+    def name(self, position: int) -> str:
+        """Return the name of a producer.
+
+        Arguments:
+            position (int): The position of the producer in name order.
+
+        Returns:
+            str: The producer name.
+
+        """
+        start, end = self.__name_offsets[position], self.__name_offsets[position + 1]
+        return bytes(self.__names[start:end]).decode()
+
+    def producer_years(self, producer: str) -> list[int]:
+        """Return the winning years of a producer.
+
+        Arguments:
+            producer (str): The producer name.
+
+        Returns:
+            list[int]: The sorted winning years, empty for an unknown producer.
+
+        """
+        low, high = 0, self.producers
+        while low < high:
+            middle = (low + high) // 2
+            if self.name(middle) < producer:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.producers or self.name(low) != producer:
+            return []
+        start, end = self.__year_offsets[low], self.__year_offsets[low + 1]
+        return self.__years[start:end].tolist()
+
+    def get_intervals(self) -> dict:
+        """Get the precomputed minimum and maximum intervals.
+
+        The entries are decoded on the first call and kept with the snapshot.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            dict: A dictionary with the "min" and "max" producer intervals.
+
+        """
+        if self.__intervals is None:
+            self.__intervals = {
+                "min": self.__entries(self.__min),
+                "max": self.__entries(self.__max),
+            }
+        return self.__intervals
+
+    def __entries(self, records: memoryview) -> list[dict]:
+        """Decode the interval records of a bound."""
+        return [
+            {
+                "producer": self.name(records[index]),
+                "interval": records[index + 2] - records[index + 1],
+                "previousWin": records[index + 1],
+                "followingWin": records[index + 2],
+            }
+            for index in range(0, len(records), 3)
+        ]
+
+
+class SnapshotStore:
+    """The current snapshot of a file that other processes may replace.
+
+    Each read compares the identity of the file on disk with the mapped one and
+    maps the new generation when it changed, swapping it in under a lock so
+    readers always get a complete snapshot.
+
+    Attributes:
+        path (Path): The path of the snapshot file.
+
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the store without mapping the file.
+
+        Arguments:
+            path (str | Path): The path of the snapshot file.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.path = Path(path)
+        self.__lock = threading.Lock()
+        self.__identity = None
+        self.__snapshot = None
+
+    def current(self, token: str = None) -> Snapshot | None:
+        """Return the latest snapshot, mapping it if the file was replaced.
+
+        Arguments:
+            token (str, optional): The current version token of the movies; a
+                snapshot written for another version is refused.
+
+        Returns:
+            Snapshot: The latest snapshot, or `None` if the file does not exist,
+                is of an older format or was refused.
+
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if identity != self.__identity:
+            with self.__lock:
+                if identity != self.__identity:
+                    try:
+                        self.__snapshot = Snapshot(self.path)
+                    except ValueError:
+                        return None
+                    self.__identity = identity
+        if token is not None and self.__snapshot.token != token:
+            return None
+        return self.__snapshot
+
+    def discard(self, token: str = None) -> None:
+        """Remove the snapshot file once it no longer matches the database.
+
+        Processes keep reading the generation they mapped until they notice the
+        file is gone.
+
+        Arguments:
+            token (str, optional): The current version token of the movies; a
+                snapshot already written for it is kept.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        if token is not None and self.current(token) is not None:
+            return
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+
+    def generation(self) -> int | None:
+        """Return the generation of the latest snapshot.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            int: The generation, or `None` if the file does not exist.
+
+        """
+        snapshot = self.current()
+        return snapshot.generation if snapshot is not None else None
+
+
+snapshot_store = SnapshotStore(snapshot_path())
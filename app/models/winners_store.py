@@ -0,0 +1,172 @@
+"""Columnar in-memory winners store implementation."""
+
+import threading
+from array import array
+from collections.abc import Iterable
+from itertools import compress, repeat
+from operator import eq, sub
+
+
+class WinnersStore:
+    """Compact in-memory store of the winning years of every producer.
+
+    Producer names are interned to integer ids, their position in the list of
+    names, and the (producer id, year) pairs of the winners are held in two
+    parallel typed arrays, ordered by producer and year. A winning credit costs six
+    bytes instead of the list slot, int object and interval tuples of
+    `IntervalIndex`, and the intervals are computed by a single pass over the
+    contiguous buffers. The store is rebuilt from the database after a change
+    instead of being updated in place; a rebuild that raced with an invalidation
+    leaves the store stale, see `IntervalIndex`.
+
+    Attributes:
+        ready (bool): Whether the store reflects the `movies` table.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store that still has to be built.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.__lock = threading.Lock()
+        self.__generation = 0
+        self.__reset()
+        self.ready = False
+
+    def __reset(self) -> None:
+        """Drop every producer and winning year held by the store."""
+        self.__names: list[str] = []
+        self.__producers = array("I")
+        self.__years = array("H")
+        self.__result = None
+
+    def __len__(self) -> int:
+        """Return the number of winning credits held by the store."""
+        return len(self.__years)
+
+    @property
+    def generation(self) -> int:
+        """Return the counter of the invalidations of the store."""
+        with self.__lock:
+            return self.__generation
+
+    def rebuild(self, wins: Iterable[tuple[str, int]], generation: int = None) -> None:
+        """Build the store from every winning year of every producer.
+
+        The rows of a producer are contiguous, so a name gets the next id when it
+        differs from the previous row and no name lookup table is kept.
+
+        Arguments:
+            wins (Iterable[tuple[str, int]]): The (producer, year) pairs of the
+                winning movies, ordered by producer and year.
+            generation (int, optional): The `generation` read before querying the
+                wins. The store is only marked as ready if it was not invalidated
+                since.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self.__lock:
+            self.__reset()
+            names, producers, years = self.__names, self.__producers, self.__years
+            previous_producer = None
+            for producer, year in wins:
+                if producer != previous_producer:
+                    names.append(producer)
+                    previous_producer = producer
+                producers.append(len(names) - 1)
+                years.append(year)
+            self.ready = generation is None or generation == self.__generation
+
+    def invalidate(self) -> None:
+        """Mark the store as stale so the next read rebuilds it.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self.__lock:
+            self.__generation += 1
+            self.ready = False
+
+    def nbytes(self) -> int:
+        """Return the bytes held by the id and year buffers.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            int: The size of the buffers, without the interned names.
+
+        """
+        return (self.__producers.itemsize * len(self.__producers)
+                + self.__years.itemsize * len(self.__years))
+
+    def get_intervals(self) -> dict:
+        """Get the producers with the minimum and maximum intervals.
+
+        Consecutive positions of the same producer form an interval. The pass is
+        made of `map` and `compress` iterators over the buffers, so no bytecode runs
+        per credit, and the intervals are held in a typed array until only the
+        positions tied on a bound are left. The result is kept until the next
+        rebuild.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            dict: A dictionary with two keys:
+                - "min" (list): The producers with the smallest winning interval.
+                - "max" (list): The producers with the largest winning interval.
+
+        """
+        with self.__lock:
+            if self.__result is not None:
+                return self.__result
+
+            producers, years = self.__producers, self.__years
+            same_producer = bytes(map(eq, producers[1:], producers))
+            positions = array("I", compress(range(1, len(years)), same_producer))
+            intervals = array("H", compress(map(sub, years[1:], years), same_producer))
+            min_positions = max_positions = []
+            if intervals:
+                min_positions = list(compress(
+                    positions, map(eq, intervals, repeat(min(intervals)))))
+                max_positions = list(compress(
+                    positions, map(eq, intervals, repeat(max(intervals)))))
+
+            self.__result = {
+                "min": self.__entries(min_positions),
+                "max": self.__entries(max_positions),
+            }
+            return self.__result
+
+    def __entries(self, positions: list[int]) -> list[dict]:
+        """Build the sorted interval dicts ending at the given positions."""
+        entries = sorted(
+            (self.__names[self.__producers[position]], self.__years[position - 1],
+             self.__years[position])
+            for position in positions
+        )
+        return [
+            {
+                "producer": producer,
+                "interval": following_win - previous_win,
+                "previousWin": previous_win,
+                "followingWin": following_win,
+            }
+            for producer, previous_win, following_win in entries
+        ]
+
+
+winners_store = WinnersStore()
@@ -0,0 +1,10 @@
+"""Registry of the route modules included in the application."""
+
+# Each module exposes an `APIRouter` named `routes`, included under `/api`. The
+# modules are imported by name when the application is created, so the registry
+# does not depend on the working directory.
+ROUTE_MODULES = (
+    "app.routes.movies",
+    "app.routes.producers",
+    "app.routes.studios",
+)
@@ -0,0 +1,34 @@
+"""Query parameters and errors shared by the interval routes."""
+
+from typing import Annotated
+
+from fastapi import Query
+
+from app.utils.exception import http_exception
+from app.utils.logger import Logger
+
+logger = Logger(__name__)
+
+TopKQuery = Annotated[int | None, Query(
+    ge=1, le=1000,
+    description="Return the top_k smallest and largest intervals instead of the "
+                "intervals tied on the minimum and maximum.")]
+
+
+def intervals_error(err: Exception) -> Exception:
+    """Log an interval calculation error and build the HTTP error returned for it.
+
+    Arguments:
+        err (Exception): The error raised while searching for intervals.
+
+    Returns:
+        Exception: The generic internal error raised to the client.
+
+    """
+    msg = f"An error occurred while searching for intervals: {err}"
+    logger.error(msg)
+
+    return http_exception(
+        message="An internal error has occurred. Please try again later.",
+        status=500
+    )
@@ -0,0 +1,104 @@
+"""Movies routes implementation."""
+
+import time
+
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.db.loader import insert_movies, iter_csv_stream_chunks
+from app.db.sqlite import get_db
+from app.models.movies import MovieDTO, MovieProducer, mark_movies_changed
+from app.models.snapshot import snapshot_store
+from app.schemas.movies import MoviesImportSchema
+from app.settings import env_data
+from app.utils.exception import http_exception
+from app.utils.logger import Logger
+
+routes = APIRouter(prefix="/movies", tags=["Movies"])
+logger = Logger(__name__)
+
+
+async def write_snapshot(session: Session) -> None:
+    """Write the interval snapshot of committed movies, discarding it on failure.
+
+    The movies are already imported, so a failed write is logged and the stale
+    snapshot is removed, making the workers fall back to the database, instead of
+    failing the request.
+
+    Arguments:
+        session (Session): The database session that committed the import.
+
+    Returns:
+        None: Method without data return.
+
+    """
+    try:
+        await run_in_threadpool(MovieDTO(session).write_snapshot)
+    except Exception as err:
+        logger.error(f"An error occurred while writing the interval snapshot: {err}")
+        snapshot_store.discard()
+
+
+@routes.post("/import", response_model=MoviesImportSchema)
+async def import_movies(
+        request: Request, session: Session = Depends(get_db)) -> MoviesImportSchema:
+    """Import an award list sent as a semicolon-separated CSV body.
+
+    The body is read as a stream and inserted in chunks of `LOAD_CHUNK_SIZE` movies,
+    so the upload is never held in memory as a whole. Every chunk is written in the
+    same transaction, and the cached intervals and the interval index are
+    refreshed once, after the import is committed. With the "snapshot" interval
+    engine, the snapshot file shared by the workers is written right after; if
+    that fails, the import is still reported and the workers read the database.
+
+    ### Arguments:
+    - `request (Request)`: The request whose body holds the CSV, with the header
+        `year;title;studios;producers;winner`.
+    - `session (Session)`: The database session used to write movie data.
+
+    ### Returns:
+    - `MoviesImportSchema:` A schema with the import counters.
+        - **rows** (int): The number of imported movies.
+        - **seconds** (float): The time spent on the import.
+        - **rows_per_second** (int): The import throughput.
+
+    """
+    start = time.perf_counter()
+    rows = 0
+    try:
+        connection = await run_in_threadpool(session.connection)
+        link_producers = await run_in_threadpool(
+            lambda: inspect(connection).has_table(MovieProducer.__tablename__))
+
+        async for chunk in iter_csv_stream_chunks(
+                request.stream(), env_data.LOAD_CHUNK_SIZE):
+            rows += await run_in_threadpool(
+                insert_movies, connection, chunk, link_producers)
+
+        await run_in_threadpool(mark_movies_changed, session, reindex=True)
+        await run_in_threadpool(session.commit)
+    except ValueError as err:
+        await run_in_threadpool(session.rollback)
+        raise http_exception(message=str(err), status=400) from err
+    except Exception as err:
+        await run_in_threadpool(session.rollback)
+        msg = f"An error occurred while importing movies: {err}"
+        logger.error(msg)
+
+        raise http_exception(
+            message="An internal error has occurred. Please try again later.",
+            status=500
+        ) from err
+
+    if env_data.INTERVAL_ENGINE == "snapshot":
+        await write_snapshot(session)
+
+    seconds = time.perf_counter() - start
+    logger.info(f"{rows} movies were imported.")
+    return MoviesImportSchema(
+        rows=rows,
+        seconds=round(seconds, 3),
+        rows_per_second=round(rows / seconds) if seconds else rows,
+    )
@@ -1,27 +1,139 @@
 """Producers routes implementation."""
 
-from fastapi import APIRouter, Depends
+import base64
+import binascii
+import json
+from collections.abc import Iterator
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.sqlite import get_db
-from app.models.movies import MovieDTO
-from app.schemas.producers import ProducersResultSchema
+from app.db.sqlite import get_async_db, get_read_db
+from app.models.cache import data_version, result_cache
+from app.models.movies import (
+    AsyncMovieDTO,
+    CachedAsyncMovieDTO,
+    CachedMovieDTO,
+    MovieDTO,
+)
+from app.routes.common import TopKQuery, intervals_error
+from app.schemas.producers import (
+    ProducerNamesSchema,
+    ProducersPageSchema,
+    ProducersResultSchema,
+    ProducerWinsSchema,
+    ProducerWinSchema,
+)
+from app.settings import env_data
+from app.settings.fastapi_app import CONDITIONAL_GET
 from app.utils.exception import http_exception
 from app.utils.logger import Logger
+from app.utils.serializer import dumps
+from app.utils.tokenizer import normalize_name
+
+logger = Logger(__name__)
+
+# The intervals only change with the movies data, so every read is versioned and a
+# client holding the current ETag is answered before the database is touched.
+routes = APIRouter(
+    prefix="/producers", tags=["Producers"], dependencies=[CONDITIONAL_GET])
+
+YearQuery = Annotated[int | None, Query(
+    ge=0, le=9999,
+    description="Only count the intervals whose wins both fall within the year "
+                "range, unbounded when omitted.")]
+
+
+def check_year_range(year_from: int | None, year_to: int | None) -> bool:
+    """Check the year range of an interval request.
+
+    Arguments:
+        year_from (int, optional): The first year of the range.
+        year_to (int, optional): The last year of the range.
+
+    Returns:
+        bool: Whether the intervals have to be filtered by the range.
+
+    Raises:
+        HTTPException: If the range ends before it starts.
+
+    """
+    if year_from is not None and year_to is not None and year_from > year_to:
+        raise http_exception(
+            message="year_from must not be after year_to.", status=400)
+    return year_from is not None or year_to is not None
+
+
+def intervals_json_key(top_k: int | None) -> tuple:
+    """Build the cache key of the encoded intervals for the current data version.
+
+    Arguments:
+        top_k (int, optional): The number of smallest and largest intervals.
 
-routes = APIRouter(prefix="/producers", tags=["Producers"])
+    Returns:
+        tuple: The result cache key.
+
+    """
+    return ("producer_intervals_json", env_data.INTERVAL_ENGINE, top_k,
+            data_version.value)
+
+
+def encode_intervals(intervals: dict) -> bytes:
+    """Validate the intervals once against the response model and encode them.
+
+    Arguments:
+        intervals (dict): The "min" and "max" intervals of the producers.
+
+    Returns:
+        bytes: The JSON document served for the intervals.
+
+    """
+    result = ProducersResultSchema(min=intervals["min"], max=intervals["max"])
+    return dumps(result.model_dump())
+
+
+def intervals_response(content: bytes, response: Response) -> Response:
+    """Serve encoded intervals as is, skipping the response model.
+
+    Arguments:
+        content (bytes): The JSON document returned by `encode_intervals`.
+        response (Response): The response whose headers were set by the route
+            dependencies.
+
+    Returns:
+        Response: The raw JSON response.
+
+    """
+    return Response(content=content, media_type="application/json",
+                    headers=response.headers)
 
 
-@routes.get("/intervals", response_model=ProducersResultSchema)
 def get_producer_intervals(
-        session: Session = Depends(get_db)) -> ProducersResultSchema:
+        response: Response,
+        top_k: TopKQuery = None,
+        year_from: YearQuery = None,
+        year_to: YearQuery = None,
+        session: Session = Depends(get_read_db)) -> ProducersResultSchema:
     """Get the minimum and maximum intervals between years for movie producers.
 
     This endpoint calculates the intervals between consecutive years of work for each
-    producer in the dataset of winning movies. It returns producers who have the
-    smallest and largest gaps between their consecutive wins.
+    producer in the dataset of winning movies. It returns every producer tied on the
+    smallest and largest gaps between their consecutive wins, or the `top_k`
+    smallest and largest gaps when requested. Results are cached until the movies
+    data changes, already encoded when `RESPONSE_MODE` is "raw". With `year_from`
+    or `year_to`, only the intervals whose wins both fall within the range are
+    counted; they are answered by the in-memory interval index instead of the
+    cache.
 
     ### Arguments:
+    - `response (Response)`: The response whose headers are returned.
+    - `top_k (int, optional)`: The number of smallest and largest intervals.
+    - `year_from (int, optional)`: The first year of the range.
+    - `year_to (int, optional)`: The last year of the range.
     - `session (Session)`: The database session used to access movie data.
 
     ### Returns:
@@ -33,16 +145,266 @@ def get_producer_intervals(
             largest intervals.
 
     """
+    year_range = check_year_range(year_from, year_to)
     try:
-        intervals = MovieDTO(session).get_winning_movies()
+        if year_range:
+            intervals = MovieDTO(session).get_intervals_between(
+                year_from, year_to, top_k)
+            logger.info("The movie breaks of a year range were requested.")
+            return ProducersResultSchema(min=intervals["min"], max=intervals["max"])
+
+        if env_data.RESPONSE_MODE == "raw":
+            content = result_cache.get_or_set(
+                intervals_json_key(top_k),
+                lambda: encode_intervals(
+                    CachedMovieDTO(session).get_winning_movies(top_k)))
 
-        Logger(__name__).info("The movie breaks were requested.")
+            logger.info("The movie breaks were requested.")
+            return intervals_response(content, response)
+
+        intervals = CachedMovieDTO(session).get_winning_movies(top_k)
+
+        logger.info("The movie breaks were requested.")
         return ProducersResultSchema(min=intervals["min"], max=intervals["max"])
     except Exception as err:
-        msg = f"An error occurred while searching for intervals: {err}"
-        Logger(__name__).error(msg)
+        raise intervals_error(err) from err
 
-        raise http_exception(
-            message="An internal error has occurred. Please try again later.",
-            status=500
-        ) from err
\ No newline at end of file
+
+async def get_producer_intervals_async(
+        response: Response,
+        top_k: TopKQuery = None,
+        year_from: YearQuery = None,
+        year_to: YearQuery = None,
+        session: AsyncSession = Depends(get_async_db)) -> ProducersResultSchema:
+    """Get the minimum and maximum intervals between years for movie producers.
+
+    This endpoint calculates the intervals between consecutive years of work for each
+    producer in the dataset of winning movies. It returns every producer tied on the
+    smallest and largest gaps between their consecutive wins, or the `top_k`
+    smallest and largest gaps when requested. Results are cached until the movies
+    data changes, already encoded when `RESPONSE_MODE` is "raw". With `year_from`
+    or `year_to`, only the intervals whose wins both fall within the range are
+    counted; they are answered by the in-memory interval index instead of the
+    cache.
+
+    ### Arguments:
+    - `response (Response)`: The response whose headers are returned.
+    - `top_k (int, optional)`: The number of smallest and largest intervals.
+    - `year_from (int, optional)`: The first year of the range.
+    - `year_to (int, optional)`: The last year of the range.
+    - `session (AsyncSession)`: The async database session used to access movie data.
+
+    ### Returns:
+    - `ProducersResultSchema:` A schema containing the minimum and maximum
+        intervals for producers.
+        - **min** (List[ProducersSchema]): A list of producers who have the
+            smallest intervals.
+        - **max** (List[ProducersSchema]): A list of producers who have the
+            largest intervals.
+
+    """
+    year_range = check_year_range(year_from, year_to)
+    try:
+        if year_range:
+            intervals = await AsyncMovieDTO(session).get_intervals_between(
+                year_from, year_to, top_k)
+            logger.info("The movie breaks of a year range were requested.")
+            return ProducersResultSchema(min=intervals["min"], max=intervals["max"])
+
+        if env_data.RESPONSE_MODE == "raw":
+            key = intervals_json_key(top_k)
+            content = result_cache.get(key)
+            if content is None:
+                content = encode_intervals(
+                    await CachedAsyncMovieDTO(session).get_winning_movies(top_k))
+                result_cache.set(key, content)
+
+            logger.info("The movie breaks were requested.")
+            return intervals_response(content, response)
+
+        intervals = await CachedAsyncMovieDTO(session).get_winning_movies(top_k)
+
+        logger.info("The movie breaks were requested.")
+        return ProducersResultSchema(min=intervals["min"], max=intervals["max"])
+    except Exception as err:
+        raise intervals_error(err) from err
+
+
+# The sync endpoint runs in Starlette's thread pool, the async one on the event
+# loop; DATABASE_MODE picks the one served so both can be compared under load.
+routes.add_api_route(
+    "/intervals",
+    get_producer_intervals_async
+    if env_data.DATABASE_MODE == "async" else get_producer_intervals,
+    methods=["GET"],
+    response_model=ProducersResultSchema,
+    name="get_producer_intervals",
+)
+
+
+def encode_cursor(interval: dict) -> str:
+    """Encode the keyset of an interval as an opaque pagination cursor.
+
+    Arguments:
+        interval (dict): The last interval of a page.
+
+    Returns:
+        str: The URL-safe cursor.
+
+    """
+    key = [interval["interval"], interval["producer"],
+           interval["previousWin"], interval["movie_id"]]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Decode a pagination cursor into the keyset of an interval.
+
+    Arguments:
+        cursor (str): The cursor returned by a previous page.
+
+    Returns:
+        tuple: The (interval, producer, previousWin, movie_id) keyset.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+
+    """
+    try:
+        interval, producer, previous_win, movie_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode()))
+        return int(interval), str(producer), int(previous_win), int(movie_id)
+    except (binascii.Error, TypeError, ValueError) as err:
+        raise http_exception(message="Invalid cursor.", status=400) from err
+
+
+def stream_intervals(intervals: Iterator[dict]) -> Iterator[bytes]:
+    """Encode intervals as newline-delimited JSON.
+
+    Arguments:
+        intervals (Iterator[dict]): The intervals to encode.
+
+    Returns:
+        Iterator[bytes]: Yields one JSON document per line.
+
+    """
+    for interval in intervals:
+        yield json.dumps(interval).encode() + b"\n"
+
+
+def stream_session_intervals(bind: Engine) -> Iterator[bytes]:
+    """Stream every interval on a session that lives as long as the stream.
+
+    The session of the request dependencies is closed before a streaming response
+    starts to be sent, so the stream opens its own and returns the connection to
+    the pool once the last interval is sent or the client goes away.
+
+    Arguments:
+        bind (Engine): The engine of the request session.
+
+    Returns:
+        Iterator[bytes]: Yields one JSON document per line.
+
+    """
+    with Session(bind) as session:
+        yield from stream_intervals(MovieDTO(session).iter_intervals())
+
+
+@routes.get(
+    "/intervals/all",
+    response_model=ProducersPageSchema,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+def get_all_producer_intervals(
+        limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+        cursor: str | None = None,
+        output: Literal["json", "ndjson"] = "json",
+        session: Session = Depends(get_read_db)) -> ProducersPageSchema:
+    """Get every interval between consecutive wins of the movie producers.
+
+    In the default `json` output the intervals are paginated with a keyset on
+    `(interval, producer, previousWin)`: each page returns a `next_cursor` to be
+    sent back as `cursor` to get the following page. In the `ndjson` output every
+    interval is streamed, one JSON document per line and in producer order, as it
+    is computed. Each page is read with a keyset query and cached per data version,
+    while the stream reads the winners on a session of its own, open for as long
+    as the response is sent.
+
+    ### Arguments:
+    - `limit (int)`: The maximum number of intervals of a page.
+    - `cursor (str, optional)`: The `next_cursor` of the previous page.
+    - `output (str)`: `json` for a page or `ndjson` for a stream of every interval.
+    - `session (Session)`: The database session used to access movie data.
+
+    ### Returns:
+    - `ProducersPageSchema:` A page of intervals.
+        - **items** (List[ProducersSchema]): The intervals of the page.
+        - **next_cursor** (str, optional): The cursor of the next page, if any.
+
+    """
+    if output == "ndjson":
+        return StreamingResponse(
+            stream_session_intervals(session.get_bind()),
+            media_type="application/x-ndjson")
+
+    after = decode_cursor(cursor) if cursor else None
+    try:
+        items = CachedMovieDTO(session).get_intervals_page(limit, after)
+    except Exception as err:
+        raise intervals_error(err) from err
+
+    next_cursor = encode_cursor(items[-1]) if len(items) == limit else None
+    return ProducersPageSchema(items=items, next_cursor=next_cursor)
+
+
+@routes.get("", response_model=ProducerNamesSchema)
+def search_producers(
+        prefix: Annotated[str, Query(min_length=1, max_length=255)],
+        limit: Annotated[int, Query(ge=1, le=100)] = 10,
+        session: Session = Depends(get_read_db)) -> ProducerNamesSchema:
+    """Find the producers whose name starts with a prefix, for autocompletion.
+
+    The names are searched in the in-memory producer index, ignoring case and
+    extra whitespace, so the database is only read when the index is rebuilt
+    after the movies data changed.
+
+    ### Arguments:
+    - `prefix (str)`: The beginning of the producer names.
+    - `limit (int)`: The maximum number of names returned.
+    - `session (Session)`: The database session used to rebuild the index.
+
+    ### Returns:
+    - `ProducerNamesSchema:` A schema with the matching names.
+        - **producers** (List[str]): The names, in alphabetical order.
+
+    """
+    index = MovieDTO(session).get_producer_index()
+    return ProducerNamesSchema(producers=index.search(prefix, limit))
+
+
+@routes.get("/{name}/wins", response_model=ProducerWinsSchema)
+def get_producer_wins(
+        name: str, session: Session = Depends(get_read_db)) -> ProducerWinsSchema:
+    """Get the winning movies of a producer from the in-memory producer index.
+
+    The name is matched exactly, after collapsing extra whitespace, and an unknown
+    producer is answered with 404.
+
+    ### Arguments:
+    - `name (str)`: The producer name.
+    - `session (Session)`: The database session used to rebuild the index.
+
+    ### Returns:
+    - `ProducerWinsSchema:` A schema with the wins of the producer.
+        - **producer** (str): The producer name.
+        - **wins** (List[ProducerWinSchema]): The year and title of each winning
+            movie, ordered by year.
+
+    """
+    wins = MovieDTO(session).get_producer_index().get_wins(name)
+    if wins is None:
+        raise http_exception(message="Producer not found.", status=404)
+
+    return ProducerWinsSchema(
+        producer=normalize_name(name),
+        wins=[ProducerWinSchema(year=year, title=title) for year, title in wins])
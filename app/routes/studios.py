@@ -0,0 +1,92 @@
+"""Studios routes implementation."""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.sqlite import get_async_db, get_read_db
+from app.models.movies import CachedAsyncMovieDTO, CachedMovieDTO
+from app.routes.common import TopKQuery, intervals_error
+from app.schemas.studios import StudiosResultSchema
+from app.settings import env_data
+from app.settings.fastapi_app import CONDITIONAL_GET
+from app.utils.logger import Logger
+
+logger = Logger(__name__)
+
+routes = APIRouter(
+    prefix="/studios", tags=["Studios"], dependencies=[CONDITIONAL_GET])
+
+
+def get_studio_intervals(
+        top_k: TopKQuery = None,
+        session: Session = Depends(get_read_db)) -> StudiosResultSchema:
+    """Get the minimum and maximum intervals between years for movie studios.
+
+    The studios column uses the same list format as the producers one, so the
+    intervals between consecutive wins of each studio are computed by the same
+    engine and cached per data version like the producer intervals.
+
+    ### Arguments:
+    - `top_k (int, optional)`: The number of smallest and largest intervals.
+    - `session (Session)`: The database session used to access movie data.
+
+    ### Returns:
+    - `StudiosResultSchema:` A schema containing the minimum and maximum
+        intervals for studios.
+        - **min** (List[StudiosSchema]): A list of studios who have the smallest
+            intervals.
+        - **max** (List[StudiosSchema]): A list of studios who have the largest
+            intervals.
+
+    """
+    try:
+        intervals = CachedMovieDTO(session).get_dimension_intervals("studios", top_k)
+
+        logger.info("The studio breaks were requested.")
+        return StudiosResultSchema(min=intervals["min"], max=intervals["max"])
+    except Exception as err:
+        raise intervals_error(err) from err
+
+
+async def get_studio_intervals_async(
+        top_k: TopKQuery = None,
+        session: AsyncSession = Depends(get_async_db)) -> StudiosResultSchema:
+    """Get the minimum and maximum intervals between years for movie studios.
+
+    The studios column uses the same list format as the producers one, so the
+    intervals between consecutive wins of each studio are computed by the same
+    engine and cached per data version like the producer intervals.
+
+    ### Arguments:
+    - `top_k (int, optional)`: The number of smallest and largest intervals.
+    - `session (AsyncSession)`: The async database session used to access movie data.
+
+    ### Returns:
+    - `StudiosResultSchema:` A schema containing the minimum and maximum
+        intervals for studios.
+        - **min** (List[StudiosSchema]): A list of studios who have the smallest
+            intervals.
+        - **max** (List[StudiosSchema]): A list of studios who have the largest
+            intervals.
+
+    """
+    try:
+        intervals = await CachedAsyncMovieDTO(session).get_dimension_intervals(
+            "studios", top_k)
+
+        logger.info("The studio breaks were requested.")
+        return StudiosResultSchema(min=intervals["min"], max=intervals["max"])
+    except Exception as err:
+        raise intervals_error(err) from err
+
+
+# DATABASE_MODE picks the endpoint served, like the producer intervals.
+routes.add_api_route(
+    "/intervals",
+    get_studio_intervals_async
+    if env_data.DATABASE_MODE == "async" else get_studio_intervals,
+    methods=["GET"],
+    response_model=StudiosResultSchema,
+    name="get_studio_intervals",
+)
@@ -0,0 +1,11 @@
+"""Implementation of Movies schemas."""
+
+from pydantic import BaseModel
+
+
+class MoviesImportSchema(BaseModel):
+    """Movies Import Schema."""
+
+    rows: int
+    seconds: float
+    rows_per_second: int
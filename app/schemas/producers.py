@@ -17,3 +17,30 @@ class ProducersResultSchema(BaseModel):
 
     min: list[ProducersSchema]
     max: list[ProducersSchema]
+
+
+class ProducersPageSchema(BaseModel):
+    """Producers Page Schema."""
+
+    items: list[ProducersSchema]
+    next_cursor: str | None = None
+
+
+class ProducerNamesSchema(BaseModel):
+    """Producer Names Schema."""
+
+    producers: list[str]
+
+
+class ProducerWinSchema(BaseModel):
+    """Producer Win Schema."""
+
+    year: int
+    title: str
+
+
+class ProducerWinsSchema(BaseModel):
+    """Producer Wins Schema."""
+
+    producer: str
+    wins: list[ProducerWinSchema]
@@ -0,0 +1,19 @@
+"""Implementation of Studios schemas."""
+
+from pydantic import BaseModel
+
+
+class StudiosSchema(BaseModel):
+    """Studios Schemas."""
+
+    studio: str
+    interval: int
+    previousWin: int
+    followingWin: int
+
+
+class StudiosResultSchema(BaseModel):
+    """Studios Result Schema."""
+
+    min: list[StudiosSchema]
+    max: list[StudiosSchema]
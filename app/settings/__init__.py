@@ -17,6 +17,56 @@ class Config:
         OPENAPI_URL (str): The URL for the OpenAPI specification.
         AMBIENT_ENV (str): The environment setting (e.g., production, development).
         LOG_NAME (str): The name used for logging (default is "SDC").
+        LOG_FORMAT (str): The format of the log lines, "text" or "json" (default is
+            "text").
+        LOG_SAMPLE_RATES (str): Comma-separated `LEVEL=rate` fractions of the
+            records kept per level, e.g. "INFO=0.1" (default keeps every record).
+        INTERVAL_ENGINE (str): The engine used to compute producer intervals,
+            "python", "sql", "polars", "index", "snapshot" or "columnar" (default
+            is "python").
+        SNAPSHOT_PATH (str): The interval snapshot file shared by the workers,
+            relative to `ROOT_DIR` (default is "data/intervals.snapshot").
+        DATABASE_MODE (str): How the interval routes access the database, "sync"
+            through the thread pool or "async" on the event loop (default is
+            "sync").
+        RESPONSE_MODE (str): How the interval routes encode their result, "model"
+            through the response model or "raw" from bytes cached per data version
+            (default is "model").
+        SQLITE_PROFILE (str): The pragmas set on each SQLite connection,
+            "performance" (WAL journal, NORMAL synchronous, memory-mapped I/O,
+            larger cache and in-memory temporary tables) or "default" (default is
+            "performance").
+        SQLITE_MMAP_SIZE (int): The bytes of the database file mapped in memory
+            (default is 268435456).
+        SQLITE_CACHE_SIZE (int): The page cache size, in KiB when negative (default
+            is -65536).
+        SQLITE_READ_ONLY (bool): Whether the read routes use `query_only`
+            connections (default is False).
+        DB_POOL_SIZE (int): The connections kept open by each engine (default is 5).
+        DB_MAX_OVERFLOW (int): The connections opened beyond the pool size under
+            load (default is 10).
+        DB_POOL_RECYCLE (int): The age in seconds after which a connection is
+            replaced, `-1` disables it (default is -1).
+        CACHE_TTL (int): The lifetime in seconds of cached results (default is 300).
+        CACHE_MAX_SIZE (int): The maximum number of cached results (default is 128).
+        CACHE_CONTROL (str): The `Cache-Control` header of the versioned routes
+            (default is "no-cache", clients revalidate their copy on each read).
+        LOAD_CHUNK_SIZE (int): The number of movies inserted per statement by the
+            bulk loader (default is 10000).
+        TOKENIZER_CACHE_SIZE (int): The number of producer credits whose split is
+            memoized by the tokenizer (default is 4096).
+        PROFILING_ENABLED (bool): Whether requests can ask for a profile (default is
+            False).
+        PROFILING_HEADER (str): The request header asking for a profile, whose
+            value may name the profiler (default is "X-Profile").
+        PROFILING_MODE (str): The profiler used when the header does not name one,
+            "cprofile" or "sampling" (default is "sampling").
+        PROFILING_DIR (str): The directory the profiles are written to, empty to
+            return a summary header instead (default is "").
+        PROFILING_SAMPLE_RATE (float): The fraction of the asking requests that
+            are profiled (default is 1.0).
+        PROFILING_INTERVAL (float): The seconds between two samples of the
+            sampling profiler (default is 0.001).
         ROOT_DIR (Path): The root directory of the project, determined dynamically.
 
     """
@@ -28,6 +78,38 @@ class Config:
     AMBIENT_ENV = config("AMBIENT_ENV", default=None)
 
     LOG_NAME = config("LOG_NAME", default="SDC")
+    LOG_FORMAT = config("LOG_FORMAT", default="text")
+    LOG_SAMPLE_RATES = config("LOG_SAMPLE_RATES", default="")
+
+    INTERVAL_ENGINE = config("INTERVAL_ENGINE", default="python")
+    SNAPSHOT_PATH = config("SNAPSHOT_PATH", default="data/intervals.snapshot")
+
+    DATABASE_MODE = config("DATABASE_MODE", default="sync")
+    RESPONSE_MODE = config("RESPONSE_MODE", default="model")
+
+    SQLITE_PROFILE = config("SQLITE_PROFILE", default="performance")
+    SQLITE_MMAP_SIZE = config("SQLITE_MMAP_SIZE", default=268435456, cast=int)
+    SQLITE_CACHE_SIZE = config("SQLITE_CACHE_SIZE", default=-65536, cast=int)
+    SQLITE_READ_ONLY = config("SQLITE_READ_ONLY", default=False, cast=config.boolean)
+
+    DB_POOL_SIZE = config("DB_POOL_SIZE", default=5, cast=int)
+    DB_MAX_OVERFLOW = config("DB_MAX_OVERFLOW", default=10, cast=int)
+    DB_POOL_RECYCLE = config("DB_POOL_RECYCLE", default=-1, cast=int)
+
+    CACHE_TTL = config("CACHE_TTL", default=300, cast=int)
+    CACHE_MAX_SIZE = config("CACHE_MAX_SIZE", default=128, cast=int)
+    CACHE_CONTROL = config("CACHE_CONTROL", default="no-cache")
+
+    LOAD_CHUNK_SIZE = config("LOAD_CHUNK_SIZE", default=10000, cast=int)
+    TOKENIZER_CACHE_SIZE = config("TOKENIZER_CACHE_SIZE", default=4096, cast=int)
+
+    PROFILING_ENABLED = config("PROFILING_ENABLED", default=False, cast=config.boolean)
+    PROFILING_HEADER = config("PROFILING_HEADER", default="X-Profile")
+    PROFILING_MODE = config("PROFILING_MODE", default="sampling")
+    PROFILING_DIR = config("PROFILING_DIR", default="")
+    PROFILING_SAMPLE_RATE = config("PROFILING_SAMPLE_RATE", default=1.0, cast=float)
+    PROFILING_INTERVAL = config("PROFILING_INTERVAL", default=0.001, cast=float)
+
     ROOT_DIR = Path(__file__).parent.parent.parent
 
 def get_config() -> Config:
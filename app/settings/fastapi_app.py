@@ -1,12 +1,282 @@
 """Fastapi app configuration."""
 
 import importlib
-import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.db.sqlite import async_engine, get_async_db, get_read_db
+from app.models.cache import data_version
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.movies import CachedMovieDTO, refresh_movies_version
+from app.models.snapshot import snapshot_store
+from app.routes import ROUTE_MODULES
 from app.settings import env_data
+from app.utils.exception import http_exception
+from app.utils.logger import Logger
+from app.utils.metrics import (
+    TOKENIZER_HIT_RATIO,
+    TOKENIZER_LOOKUPS,
+    Gauge,
+    MetricsMiddleware,
+    registry,
+)
+from app.utils.profiling import ProfilingMiddleware
+from app.utils.tokenizer import tokenizer_stats
+
+logger = Logger(__name__)
+
+# Reference of the startup time, taken when the application module is imported.
+_IMPORTED_AT = time.perf_counter()
+
+TIME_TO_READY = registry.register(Gauge(
+    "app_time_to_ready_seconds",
+    "Seconds between the application import and the readiness to serve."))
+
+
+def current_etag(session: Session) -> str | None:
+    """Build the strong ETag of the current state of the movies data.
+
+    The tag is the version row of the database, bumped by every transaction
+    that writes to the `movies` table, so every worker gives the same tag for the
+    same data and writes made by other processes change it. The token is also
+    observed by this process, see `refresh_movies_version`, so the cached results
+    and the derived indexes never outlive the tag they are served with.
+
+    Arguments:
+        session (Session): The session used to read the version row.
+
+    Returns:
+        str: The quoted entity tag, `None` if the database has no version row.
+
+    """
+    token = refresh_movies_version(session)
+    return None if token is None else f'"{token}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an `If-None-Match` header against an entity tag.
+
+    The weak comparison required for `If-None-Match` is used, so a `W/` prefix sent
+    back by an intermediary cache still matches.
+
+    Arguments:
+        if_none_match (str): The value of the `If-None-Match` request header.
+        etag (str): The current entity tag.
+
+    Returns:
+        bool: Whether the client representation is still current.
+
+    """
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def conditional_get(request: Request, response: Response,
+                    session: Session = Depends(get_read_db)) -> None:
+    """Answer conditional reads of versioned resources without computing them.
+
+    Routes opt in by declaring this dependency before any other, so a request whose
+    `If-None-Match` matches the current data version is answered with `304 Not
+    Modified` after a single read of the version row, before the resource is
+    computed. Other reads get the `ETag` and `Cache-Control` headers, and
+    non-read methods are left untouched. The connection is returned to the pool
+    once the version is read.
+
+    Arguments:
+        request (Request): The incoming request.
+        response (Response): The response whose headers are set.
+        session (Session): The session used to read the version row.
+
+    Returns:
+        None: Method without data return.
+
+    Raises:
+        HTTPException: With status 304 if the client representation is current.
+
+    """
+    if request.method not in ("GET", "HEAD"):
+        return
+
+    etag = current_etag(session)
+    session.close()
+    answer_conditional_get(request, response, etag)
+
+
+async def conditional_get_async(
+        request: Request, response: Response,
+        session: AsyncSession = Depends(get_async_db)) -> None:
+    """Answer conditional reads of versioned resources on the event loop.
+
+    The asynchronous counterpart of `conditional_get`: the version row is read
+    with an `AsyncSession`, so the routes served with DATABASE_MODE "async" never
+    wait for a slot of the thread pool.
+
+    Arguments:
+        request (Request): The incoming request.
+        response (Response): The response whose headers are set.
+        session (AsyncSession): The async session used to read the version row.
+
+    Returns:
+        None: Method without data return.
+
+    Raises:
+        HTTPException: With status 304 if the client representation is current.
+
+    """
+    if request.method not in ("GET", "HEAD"):
+        return
+
+    etag = await session.run_sync(current_etag)
+    await session.close()
+    answer_conditional_get(request, response, etag)
+
+
+def answer_conditional_get(request: Request, response: Response,
+                           etag: str | None) -> None:
+    """Set the validator headers of a read, or answer it if the client is current.
+
+    Arguments:
+        request (Request): The incoming request.
+        response (Response): The response whose headers are set.
+        etag (str): The current entity tag, `None` if the data is not versioned.
+
+    Returns:
+        None: Method without data return.
+
+    Raises:
+        HTTPException: With status 304 if the client representation is current.
+
+    """
+    if etag is None:
+        return
+
+    headers = {"ETag": etag, "Cache-Control": env_data.CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+        raise http_exception(message="Not Modified", status=304, headers=headers)
+
+    response.headers.update(headers)
+
+
+# The dependency of the versioned routers, read on the event loop when
+# DATABASE_MODE serves the interval routes asynchronously.
+CONDITIONAL_GET = Depends(
+    conditional_get_async if env_data.DATABASE_MODE == "async" else conditional_get)
+
+
+def warm_up(app: FastAPI) -> bool:
+    """Compute the producer and studio intervals before the first request.
+
+    The producer intervals of the configured engine are computed, building the
+    interval index for the "index" engine, and stored with the studio intervals
+    in the result cache, which the sync and async routes share. The session comes
+    from the `get_read_db` dependency, or its override, so the warm-up reads the
+    database the routes read. If it fails, e.g. because the database is not
+    available yet, the first request computes the intervals instead.
+
+    Arguments:
+        app (FastAPI): The application being started.
+
+    Returns:
+        bool: Whether the intervals were precomputed.
+
+    """
+    sessions = app.dependency_overrides.get(get_read_db, get_read_db)()
+    try:
+        session = next(sessions)
+        refresh_movies_version(session)
+        dto = CachedMovieDTO(session)
+        dto.get_winning_movies()
+        dto.get_dimension_intervals("studios")
+        return True
+    except Exception as err:
+        logger.warning(f"The intervals were not precomputed: {err}")
+        return False
+    finally:
+        sessions.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Prepare the application state before it starts serving requests.
+
+    The producer intervals are precomputed by `warm_up`. With the "snapshot"
+    engine, the data version then follows the generation of the snapshot file, so
+    a snapshot written by another worker replaces the cached results and ETags of
+    this one. The application is then reported ready on `/ready` along with the
+    time it took since the application module was imported. On shutdown, the
+    pooled aiosqlite connections are closed so their worker threads do not keep
+    the process alive.
+
+    Arguments:
+        app (FastAPI): The application being started.
+
+    Returns:
+        AsyncIterator[None]: Yields control while the application is running.
+
+    """
+    start = time.perf_counter()
+    app.state.warm = warm_up(app)
+    if env_data.INTERVAL_ENGINE == "snapshot":
+        data_version.follow(snapshot_store.generation)
+    app.state.warm_up_seconds = round(time.perf_counter() - start, 3)
+    app.state.time_to_ready_seconds = round(time.perf_counter() - _IMPORTED_AT, 3)
+    app.state.ready = True
+
+    TIME_TO_READY.set(app.state.time_to_ready_seconds)
+    logger.info(
+        f"Ready to serve in {app.state.time_to_ready_seconds}s "
+        f"(warm-up {app.state.warm_up_seconds}s).")
+    yield
+    app.state.ready = False
+    await async_engine.dispose()
+
+
+def get_readiness(request: Request) -> JSONResponse:
+    """Report whether the application is ready to serve requests.
+
+    Arguments:
+        request (Request): The incoming request.
+
+    Returns:
+        JSONResponse: The readiness, whether the intervals were precomputed and the
+            startup durations, with status 503 until the startup is over.
+
+    """
+    state = request.app.state
+    ready = getattr(state, "ready", False)
+    content = {"ready": ready}
+    if ready:
+        content.update(warm=state.warm, warm_up_seconds=state.warm_up_seconds,
+                       time_to_ready_seconds=state.time_to_ready_seconds)
+    return JSONResponse(content, status_code=200 if ready else 503)
+
+
+def get_metrics() -> PlainTextResponse:
+    """Expose the application metrics in the Prometheus text format.
+
+    Arguments:
+        Has no arguments.
+
+    Returns:
+        PlainTextResponse: The request latency, in-flight and error metrics, the
+            SQL statement durations, the interval computation durations and the
+            producer tokenizer memo counters.
+
+    """
+    stats = tokenizer_stats()
+    TOKENIZER_LOOKUPS.set(stats["hits"], "hit")
+    TOKENIZER_LOOKUPS.set(stats["misses"], "miss")
+    TOKENIZER_HIT_RATIO.set(stats["hit_rate"])
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4")
 
 
 def create_app() -> FastAPI:
@@ -14,8 +284,10 @@ def create_app() -> FastAPI:
 
     This function creates a FastAPI application, configures it with middleware for
     handling Cross-Origin Resource Sharing (CORS), and sets up the OpenAPI
-    documentation URLs. It also dynamically loads route modules from the specified
-    directory and includes them in the app.
+    documentation URLs. It also includes the route modules listed in
+    `app.routes.ROUTE_MODULES`, and registers the startup `lifespan`.
+    Every request is measured by the `MetricsMiddleware`, exposed on `/metrics`, and
+    the `ProfilingMiddleware` is installed when `PROFILING_ENABLED` is set.
 
     Arguments:
         Has no arguments.
@@ -27,7 +299,8 @@ def create_app() -> FastAPI:
     app = FastAPI(
         docs_url=env_data.DOCS_URL,
         redoc_url=env_data.RE_DOC_URL,
-        openapi_url=env_data.OPENAPI_URL
+        openapi_url=env_data.OPENAPI_URL,
+        lifespan=lifespan
     )
 
     app.add_middleware(
@@ -37,16 +310,23 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(MetricsMiddleware)
+    if env_data.PROFILING_ENABLED:
+        app.add_middleware(
+            ProfilingMiddleware,
+            header=env_data.PROFILING_HEADER,
+            mode=env_data.PROFILING_MODE,
+            directory=env_data.PROFILING_DIR,
+            sample_rate=env_data.PROFILING_SAMPLE_RATE,
+            interval=env_data.PROFILING_INTERVAL,
+        )
+    app.add_api_route("/metrics", get_metrics, methods=["GET"],
+                      include_in_schema=False)
+    app.add_api_route("/ready", get_readiness, methods=["GET"],
+                      include_in_schema=False)
 
-    api = "/api"
-    routes_directory = "app.routes"
-    file_exceptions = ["__init__.py"]
-    for filename in os.listdir(routes_directory.replace(".", "/")):
-        if filename.endswith(".py") and filename not in file_exceptions:
-            module_name = f"{routes_directory}.{filename[:-3]}"
-            module = importlib.import_module(module_name)
-
-            if hasattr(module, "routes"):
-                app.include_router(module.routes, prefix=api)
+    for module_name in ROUTE_MODULES:
+        module = importlib.import_module(module_name)
+        app.include_router(module.routes, prefix="/api")
 
     return app
@@ -1,8 +1,203 @@
 """Implementation of the system log."""
 
+import atexit
+import itertools
+import json
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 
-from prettyconf import config
+from app.settings import env_data
+
+
+class JsonFormatter(logging.Formatter):
+    """A formatter that writes each record as a single-line JSON document.
+
+    The document carries the same fields as the text format, so log collectors can
+    parse them without a custom pattern.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as JSON.
+
+        Arguments:
+            record (logging.LogRecord): The record to format.
+
+        Returns:
+            str: The JSON document of the record.
+
+        """
+        document = {
+            "system": env_data.LOG_NAME,
+            "time": self.formatTime(record, self.datefmt),
+            "log_level": record.levelname,
+            "ref": "api-data",
+            "ambient": env_data.AMBIENT_ENV,
+            "origin": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            document["exception"] = self.formatException(record.exc_info)
+        return json.dumps(document, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """A filter that keeps a fixed fraction of the records of each level.
+
+    The records are counted per level and kept evenly, e.g. a rate of 0.1 keeps
+    one record out of ten, so the sampled output does not depend on chance. Levels
+    without a rate are always kept.
+
+    Attributes:
+        rates (dict[int, float]): The fraction of records kept for each level.
+
+    """
+
+    def __init__(self, rates: dict[int, float]) -> None:
+        """Initialize the filter with the sampling rate of each level.
+
+        Arguments:
+            rates (dict[int, float]): The fraction, between 0 and 1, of records kept
+                for each level.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        super().__init__()
+        self.rates = rates
+        self.__counters = {level: itertools.count(1) for level in rates}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether a record is kept.
+
+        Arguments:
+            record (logging.LogRecord): The record to check.
+
+        Returns:
+            bool: Whether the record is written.
+
+        """
+        rate = self.rates.get(record.levelno)
+        if rate is None:
+            return True
+        count = next(self.__counters[record.levelno])
+        return int(count * rate) > int((count - 1) * rate)
+
+
+def parse_sample_rates(value: str) -> dict[int, float]:
+    """Parse the `LOG_SAMPLE_RATES` setting.
+
+    Arguments:
+        value (str): Comma-separated `LEVEL=rate` pairs, e.g. "INFO=0.1,DEBUG=0".
+
+    Returns:
+        dict[int, float]: The sampling rate of each level.
+
+    Raises:
+        ValueError: If a level is unknown or a rate is not between 0 and 1.
+
+    """
+    rates = {}
+    for pair in filter(None, (item.strip() for item in value.split(","))):
+        name, _, rate = pair.partition("=")
+        level = logging.getLevelName(name.strip().upper())
+        if not isinstance(level, int) or not 0 <= float(rate) <= 1:
+            raise ValueError(f"Invalid log sample rate: {pair}")
+        rates[level] = float(rate)
+    return rates
+
+
+def build_formatter() -> logging.Formatter:
+    """Build the formatter selected by the `LOG_FORMAT` setting.
+
+    Arguments:
+        Has no arguments.
+
+    Returns:
+        logging.Formatter: The JSON formatter for "json", the text one otherwise.
+
+    """
+    datefmt = "%d/%m/%Y %H:%M:%S"
+    if env_data.LOG_FORMAT == "json":
+        return JsonFormatter(datefmt=datefmt)
+    return logging.Formatter(
+        f"{env_data.LOG_NAME}: time=%(asctime)s log_level=%(levelname)s "
+        f"ref=api-data ambient={env_data.AMBIENT_ENV} nivel=3 "
+        f"origin=%(name)s message=%(message)s",
+        datefmt=datefmt,
+    )
+
+
+class LogPipeline:
+    """The shared queue between the application loggers and the console writer.
+
+    Loggers only put their records in the queue, which is drained by the thread of
+    a `QueueListener` that formats and writes them, so request threads never block
+    on the console. The listener is started by the first logger and stopped at
+    exit, after writing the pending records.
+
+    Attributes:
+        handler (QueueHandler): The handler shared by the application loggers.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the pipeline without starting the writer thread.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        records = queue.SimpleQueue()
+        stream = logging.StreamHandler()
+        stream.setLevel(logging.DEBUG)
+        stream.setFormatter(build_formatter())
+
+        self.handler = QueueHandler(records)
+        self.handler.addFilter(SamplingFilter(parse_sample_rates(
+            env_data.LOG_SAMPLE_RATES)))
+        self.__listener = QueueListener(records, stream, respect_handler_level=True)
+        self.__lock = threading.Lock()
+        self.__started = False
+
+    def start(self) -> None:
+        """Start the writer thread if it is not running.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self.__lock:
+            if not self.__started:
+                self.__listener.start()
+                self.__started = True
+                atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Write the pending records and stop the writer thread.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self.__lock:
+            if self.__started:
+                self.__listener.stop()
+                self.__started = False
+
+
+pipeline = LogPipeline()
 
 
 class Logger:
@@ -10,14 +205,16 @@ class Logger:
 
     This class provides an interface to log messages at different log levels
     (debug, info, warning, error, critical). It uses Python's built-in logging
-    module and is configured to print logs to the console with a custom format.
+    module and hands the records to the shared `pipeline`, which prints them to the
+    console from a background thread. Instances are meant to be created once per
+    module and reused.
     """
 
     def __init__(self, name_call: str) -> None:
         """Initialize the Logger class.
 
-        Sets up the logging configuration with a custom format, logging level,
-        and console handler.
+        Attaches the queue handler of the shared pipeline to the named logger and
+        starts the pipeline writer if needed.
 
         Arguments:
             name_call (str): The name for the logger. This name will appear in
@@ -27,23 +224,12 @@ class Logger:
             None: Method without data return.
 
         """
-        self.AMBIENT_ENV = config("AMBIENT_ENV", default=None)
-        self.LOG_NAME = config("LOG_NAME", default="SDC")
         self.tip_logs = logging.getLogger(name_call)
         self.tip_logs.setLevel(logging.DEBUG)
 
-
-        if not self.tip_logs.handlers:
-            stream_format = logging.Formatter(
-                f"{self.LOG_NAME}: time=%(asctime)s log_level=%(levelname)s "
-                f"ref=api-data ambient={self.AMBIENT_ENV} nivel=3 "
-                f"origin=%(name)s message=%(message)s",
-                datefmt="%d/%m/%Y %H:%M:%S",
-            )
-            stream = logging.StreamHandler()
-            stream.setLevel(logging.DEBUG)
-            stream.setFormatter(stream_format)
-            self.tip_logs.addHandler(stream)
+        if pipeline.handler not in self.tip_logs.handlers:
+            self.tip_logs.addHandler(pipeline.handler)
+        pipeline.start()
 
     def debug(self, msg: str) -> None:
         """Log a debug message.
@@ -0,0 +1,449 @@
+"""Implementation of the in-process Prometheus metrics."""
+
+import bisect
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import Engine, event
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+# Bounds the (method, path) pairs whose route template is remembered, path
+# parameters making the number of distinct paths unbounded.
+ROUTE_CACHE_SIZE = 1024
+
+
+def escape_label(value: str) -> str:
+    """Escape a label value for the Prometheus text format.
+
+    Arguments:
+        value (str): The label value.
+
+    Returns:
+        str: The value with backslashes, quotes and newlines escaped.
+
+    """
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    """Format label pairs in the Prometheus text format.
+
+    Arguments:
+        names (tuple[str, ...]): The label names.
+        values (tuple[str, ...]): The label values.
+
+    Returns:
+        str: The `{name="value",...}` block, empty without labels.
+
+    """
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{escape_label(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Metric:
+    """Base of the metrics, holding one value per combination of labels.
+
+    Attributes:
+        name (str): The metric name.
+        documentation (str): The help text of the metric.
+        labels (tuple[str, ...]): The label names.
+
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str,
+                 labels: Iterable[str] = ()) -> None:
+        """Initialize a metric without samples.
+
+        Arguments:
+            name (str): The metric name.
+            documentation (str): The help text of the metric.
+            labels (Iterable[str], optional): The label names.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values = defaultdict(float)
+
+    def samples(self) -> Iterable[str]:
+        """Return the sample lines of the metric.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            Iterable[str]: The lines in the Prometheus text format.
+
+        """
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{format_labels(self.labels, labels)} {value}"
+
+    def render(self) -> str:
+        """Render the metric in the Prometheus text format.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            str: The help, type and sample lines.
+
+        """
+        lines = [f"# HELP {self.name} {self.documentation}",
+                 f"# TYPE {self.name} {self.kind}", *self.samples()]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    """A metric that only goes up."""
+
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """Increment the counter of a combination of labels.
+
+        Arguments:
+            *labels (str): The label values, in the order of `labels`.
+            amount (float, optional): The increment.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self._lock:
+            self._values[labels] += amount
+
+
+class Gauge(Metric):
+    """A metric that goes up and down."""
+
+    kind = "gauge"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """Increment the gauge of a combination of labels.
+
+        Arguments:
+            *labels (str): The label values, in the order of `labels`.
+            amount (float, optional): The increment, negative to decrement.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self._lock:
+            self._values[labels] += amount
+
+    def set(self, value: float, *labels: str) -> None:
+        """Set the gauge of a combination of labels.
+
+        Arguments:
+            value (float): The new value.
+            *labels (str): The label values, in the order of `labels`.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        with self._lock:
+            self._values[labels] = value
+
+    def dec(self, *labels: str) -> None:
+        """Decrement the gauge of a combination of labels by one.
+
+        Arguments:
+            *labels (str): The label values, in the order of `labels`.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.inc(*labels, amount=-1)
+
+
+class Histogram(Metric):
+    """A metric counting observations in cumulative buckets.
+
+    Attributes:
+        buckets (tuple[float, ...]): The upper bounds of the buckets.
+
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = (),
+                 buckets: Iterable[float] = LATENCY_BUCKETS) -> None:
+        """Initialize a histogram without observations.
+
+        Arguments:
+            name (str): The metric name.
+            documentation (str): The help text of the metric.
+            labels (Iterable[str], optional): The label names.
+            buckets (Iterable[float], optional): The upper bounds of the buckets.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record an observation for a combination of labels.
+
+        Arguments:
+            value (float): The observed value, e.g. a duration in seconds.
+            *labels (str): The label values, in the order of `labels`.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        position = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(labels)
+            if counts is None:
+                # One count per bucket plus +Inf, followed by the sum.
+                counts = self._values[labels] = [0] * (len(self.buckets) + 2)
+            counts[position] += 1
+            counts[-1] += value
+
+    @contextmanager
+    def timer(self, *labels: str) -> Iterator[None]:
+        """Observe the duration in seconds of a block of code.
+
+        Arguments:
+            *labels (str): The label values, in the order of `labels`.
+
+        Returns:
+            Iterator[None]: Yields control while the block runs.
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def samples(self) -> Iterable[str]:
+        """Return the bucket, sum and count lines of the histogram.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            Iterable[str]: The lines in the Prometheus text format.
+
+        """
+        with self._lock:
+            values = sorted((labels, list(counts))
+                            for labels, counts in self._values.items())
+        names = (*self.labels, "le")
+        for labels, counts in values:
+            total = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                total += count
+                le = bound if bound == "+Inf" else f"{bound:g}"
+                yield f"{self.name}_bucket{format_labels(names, (*labels, le))} {total}"
+            block = format_labels(self.labels, labels)
+            yield f"{self.name}_sum{block} {counts[-1]}"
+            yield f"{self.name}_count{block} {total}"
+
+
+class Registry:
+    """The collection of metrics exposed by the `/metrics` route.
+
+    Attributes:
+        metrics (list[Metric]): The registered metrics.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.metrics: list[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """Add a metric to the registry.
+
+        Arguments:
+            metric (Metric): The metric to expose.
+
+        Returns:
+            Metric: The registered metric.
+
+        """
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            str: The exposition document.
+
+        """
+        return "".join(metric.render() for metric in self.metrics)
+
+
+registry = Registry()
+
+REQUEST_LATENCY = registry.register(Histogram(
+    "http_request_duration_seconds", "Latency of the HTTP requests.",
+    ("method", "route")))
+REQUESTS_IN_PROGRESS = registry.register(Gauge(
+    "http_requests_in_progress", "HTTP requests being served.", ("method", "route")))
+REQUEST_ERRORS = registry.register(Counter(
+    "http_request_errors_total", "HTTP requests answered with an error status.",
+    ("method", "route", "status")))
+QUERY_LATENCY = registry.register(Histogram(
+    "db_query_duration_seconds", "Duration of the SQL statements.", ("statement",),
+    buckets=QUERY_BUCKETS))
+TOKENIZER_LOOKUPS = registry.register(Gauge(
+    "producer_tokenizer_lookups", "Lookups of the producer tokenizer memo.",
+    ("result",)))
+TOKENIZER_HIT_RATIO = registry.register(Gauge(
+    "producer_tokenizer_hit_ratio", "Fraction of the tokenizer lookups memoized."))
+INTERVAL_COMPUTE = registry.register(Histogram(
+    "interval_compute_duration_seconds",
+    "Time spent computing the producer intervals in MovieDTO.", ("engine",),
+    buckets=QUERY_BUCKETS))
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Record the duration of every statement executed by an engine.
+
+    Arguments:
+        engine (Engine): The engine to instrument, the `sync_engine` of an async
+            engine.
+
+    Returns:
+        None: Method without data return.
+
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def stop_query(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info["query_start"].pop()
+        keyword = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+        QUERY_LATENCY.observe(seconds, keyword)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording the latency, in-flight and error metrics.
+
+    Requests are labelled with the path template of the matching route, so path
+    parameters do not create new series, and "unmatched" otherwise. The template
+    of the last `ROUTE_CACHE_SIZE` method and path pairs is remembered, so the
+    routes are only scanned for a path seen for the first time.
+
+    Attributes:
+        app (ASGIApp): The wrapped application.
+
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an application.
+
+        Arguments:
+            app (ASGIApp): The application to instrument.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.app = app
+        self.__routes: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+    def route_of(self, scope: Scope) -> str:
+        """Return the path template of the route matching a request.
+
+        Arguments:
+            scope (Scope): The request scope.
+
+        Returns:
+            str: The route path, or "unmatched".
+
+        """
+        key = (scope["method"], scope["path"])
+        route = self.__routes.get(key)
+        if route is not None:
+            self.__routes.move_to_end(key)
+            return route
+
+        route = self.__match(scope)
+        self.__routes[key] = route
+        if len(self.__routes) > ROUTE_CACHE_SIZE:
+            self.__routes.popitem(last=False)
+        return route
+
+    def __match(self, scope: Scope) -> str:
+        """Scan the routes of the application for the one matching a request."""
+        for route in scope["app"].router.routes:
+            if route.matches(scope)[0] == Match.FULL:
+                return route.path
+        return "unmatched"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve a request and record its metrics.
+
+        Arguments:
+            scope (Scope): The request scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        labels = (scope["method"], self.route_of(scope))
+        status = 500
+
+        async def send_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        REQUESTS_IN_PROGRESS.inc(*labels)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_status)
+        finally:
+            REQUEST_LATENCY.observe(time.perf_counter() - start, *labels)
+            REQUESTS_IN_PROGRESS.dec(*labels)
+            if status >= 400:
+                REQUEST_ERRORS.inc(*labels, str(status))
@@ -0,0 +1,363 @@
+"""Implementation of the on-demand request profiler."""
+
+import cProfile
+import itertools
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.logger import Logger
+
+logger = Logger(__name__)
+
+APP_DIR = str(Path(__file__).parent.parent)
+SUMMARY_SIZE = 5
+
+
+class StackSampler:
+    """A sampling profiler collecting the stacks of the application threads.
+
+    A background thread snapshots the stack of every thread at a fixed interval
+    and keeps the stacks that run application code, so the work of a sync route
+    in the thread pool is seen as well as the one on the event loop. The stacks are
+    counted in the collapsed format read by flame graph tools.
+
+    Attributes:
+        interval (float): The seconds between two samples.
+        stacks (Counter): The number of samples of each collapsed stack.
+
+    """
+
+    def __init__(self, interval: float) -> None:
+        """Initialize a stopped sampler.
+
+        Arguments:
+            interval (float): The seconds between two samples.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+
+    def start(self) -> None:
+        """Start sampling.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        self.__stopped.set()
+        self.__thread.join()
+
+    def __run(self) -> None:
+        """Sample the stacks until stopped."""
+        own = threading.get_ident()
+        while not self.__stopped.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                in_app = False
+                while frame is not None:
+                    code = frame.f_code
+                    in_app = in_app or code.co_filename.startswith(APP_DIR)
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                                 f":{frame.f_lineno})")
+                    frame = frame.f_back
+                if in_app:
+                    self.stacks[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        """Return the samples in the collapsed stack format.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            str: One `frame;frame;... count` line per stack.
+
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+    def summary(self) -> str:
+        """Return the functions with the most samples at the top of the stack.
+
+        Arguments:
+            Has no arguments.
+
+        Returns:
+            str: The functions and their estimated self time.
+
+        """
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return ", ".join(
+            f"{leaf}={count * self.interval * 1000:.1f}ms"
+            for leaf, count in leaves.most_common(SUMMARY_SIZE))
+
+
+def profile_summary(profile: cProfile.Profile) -> str:
+    """Return the functions of a cProfile run with the most cumulative time.
+
+    The application functions are listed when the run reached any, so the time
+    the event loop spent waiting does not hide them.
+
+    Arguments:
+        profile (cProfile.Profile): The finished profile.
+
+    Returns:
+        str: The functions and their cumulative time.
+
+    """
+    stats = pstats.Stats(profile).stats
+    app_stats = {key: values for key, values in stats.items()
+                 if key[0].startswith(APP_DIR) and key[0] != __file__}
+    top = sorted((app_stats or stats).items(), key=lambda item: item[1][3],
+                 reverse=True)
+    return ", ".join(
+        f"{function} ({os.path.basename(filename)}:{line})={values[3] * 1000:.1f}ms"
+        for (filename, line, function), values in top[:SUMMARY_SIZE])
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling the requests that ask for it.
+
+    A request is profiled when it carries the profiling header and is picked by
+    the sampling rate. The header value selects "cprofile", which deterministically
+    profiles the event loop thread only (async routes, middleware and
+    serialization), or "sampling", which samples every thread running application
+    code, including the thread pool of the sync routes. The result is written to
+    the output directory as a `.pstats` or `.collapsed` file, or summarized in the
+    `X-Profile-Summary` response header when no directory is set. The middleware is
+    only installed when profiling is enabled, so it costs nothing otherwise.
+
+    One request is profiled at a time: a profiler covers the whole event loop, or
+    every thread, so a request asking for a profile while another one is profiled
+    is served without it. The files are written and the sampler thread is joined
+    in the thread pool, off the event loop.
+
+    Attributes:
+        app (ASGIApp): The wrapped application.
+        header (str): The request header asking for a profile.
+        mode (str): The profiler used when the header value does not name one.
+        directory (str): The output directory, empty for the summary header.
+        sample_rate (float): The fraction of the asking requests profiled.
+        interval (float): The seconds between two samples of the sampling mode.
+
+    """
+
+    MODES = ("cprofile", "sampling")
+
+    def __init__(self, app: ASGIApp, header: str = "X-Profile",
+                 mode: str = "sampling", directory: str = "",
+                 sample_rate: float = 1.0, interval: float = 0.001) -> None:
+        """Wrap an application.
+
+        Arguments:
+            app (ASGIApp): The application to profile.
+            header (str, optional): The request header asking for a profile.
+            mode (str, optional): The default profiler, one of `MODES`.
+            directory (str, optional): The output directory of the profiles.
+            sample_rate (float, optional): The fraction of the asking requests
+                profiled, between 0 and 1.
+            interval (float, optional): The seconds between two samples.
+
+        Returns:
+            None: Method without data return.
+
+        Raises:
+            ValueError: If the mode is not one of `MODES`.
+
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self.app = app
+        self.header = header.lower().encode("latin-1")
+        self.mode = mode
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.__requests = itertools.count(1)
+        self.__profiling = False
+
+    def selected_mode(self, scope: Scope) -> str | None:
+        """Return the profiler requested for a request, if it is profiled.
+
+        Arguments:
+            scope (Scope): The request scope.
+
+        Returns:
+            str: The profiler, or `None` if the request is not profiled.
+
+        """
+        if scope["type"] != "http":
+            return None
+        value = dict(scope["headers"]).get(self.header)
+        if value is None:
+            return None
+        count = next(self.__requests)
+        if int(count * self.sample_rate) <= int((count - 1) * self.sample_rate):
+            return None
+        value = value.decode("latin-1").strip().lower()
+        return value if value in self.MODES else self.mode
+
+    def output_path(self, scope: Scope, mode: str) -> str:
+        """Return the path of the profile file of a request.
+
+        Arguments:
+            scope (Scope): The profiled request scope.
+            mode (str): The profiler used.
+
+        Returns:
+            str: The path of the file in the output directory.
+
+        """
+        name = "-".join(filter(None, scope["path"].split("/"))) or "root"
+        extension = "pstats" if mode == "cprofile" else "collapsed"
+        return os.path.join(
+            self.directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{time.time_ns()}-"
+                            f"{scope['method']}-{name}.{extension}")
+
+    @staticmethod
+    def write(path: str, mode: str, profiler: cProfile.Profile | StackSampler) -> None:
+        """Write a profile to its file in the output directory.
+
+        Arguments:
+            path (str): The path returned by `output_path`.
+            mode (str): The profiler used.
+            profiler (cProfile.Profile | StackSampler): The finished profiler.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if mode == "cprofile":
+            profiler.dump_stats(path)
+        else:
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(profiler.collapsed())
+
+    @staticmethod
+    def summary(mode: str, profiler: cProfile.Profile | StackSampler) -> str:
+        """Summarize a finished profile.
+
+        Arguments:
+            mode (str): The profiler used.
+            profiler (cProfile.Profile | StackSampler): The finished profiler.
+
+        Returns:
+            str: The functions with the most time.
+
+        """
+        return profile_summary(profiler) if mode == "cprofile" else profiler.summary()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve a request, profiling it when asked and no other one is profiled.
+
+        Arguments:
+            scope (Scope): The request scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+
+        Returns:
+            None: Method without data return.
+
+        """
+        mode = self.selected_mode(scope)
+        if mode is None or self.__profiling:
+            await self.app(scope, receive, send)
+            return
+
+        self.__profiling = True
+        try:
+            await self.__profile(scope, receive, send, mode)
+        finally:
+            self.__profiling = False
+
+    async def __profile(self, scope: Scope, receive: Receive, send: Send,
+                        mode: str) -> None:
+        """Serve a request under a profiler.
+
+        The response is held until the request finishes, so the profile header can
+        be added to it. A streamed response is forwarded as soon as its first
+        chunk is sent instead: it gets the name of the profile file, written once
+        the stream ends, and without an output directory the summary is logged.
+        """
+        path = self.output_path(scope, mode) if self.directory else None
+        held: list[Message] = []
+        streaming = False
+
+        async def forward(message: Message) -> None:
+            nonlocal streaming
+            if streaming:
+                await send(message)
+                return
+            held.append(message)
+            if message["type"] == "http.response.body" and message.get("more_body"):
+                streaming = True
+                await self.__send(send, held, path and (
+                    b"x-profile-file", os.path.basename(path).encode("latin-1")))
+
+        if mode == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+        else:
+            profiler = StackSampler(self.interval)
+            profiler.start()
+        try:
+            await self.app(scope, receive, forward)
+        finally:
+            if mode == "cprofile":
+                profiler.disable()
+            else:
+                await run_in_threadpool(profiler.stop)
+
+        if path is not None:
+            await run_in_threadpool(self.write, path, mode, profiler)
+            header = (b"x-profile-file", os.path.basename(path).encode("latin-1"))
+        else:
+            summary = await run_in_threadpool(self.summary, mode, profiler)
+            header = (b"x-profile-summary", summary.encode("latin-1", "replace"))
+            if streaming:
+                logger.info(f"Profile of {scope['method']} {scope['path']}: {summary}")
+
+        if not streaming:
+            await self.__send(send, held, header)
+
+    @staticmethod
+    async def __send(send: Send, messages: list[Message],
+                     header: tuple[bytes, bytes] | None) -> None:
+        """Send the held messages, adding a header to the response start."""
+        for message in messages:
+            if header and message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), header]
+            await send(message)
+        messages.clear()
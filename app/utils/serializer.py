@@ -0,0 +1,27 @@
+"""Implementation of the JSON response serializer."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Encode a JSON-compatible value into compact UTF-8 bytes.
+
+    orjson is used when it is installed, otherwise the standard library encoder is
+    used with the same compact separators.
+
+    Arguments:
+        content (Any): The value made of dicts, lists, strings and numbers.
+
+    Returns:
+        bytes: The encoded JSON document.
+
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(",", ":"), ensure_ascii=False).encode()
@@ -0,0 +1,83 @@
+"""Implementation of the producer credits tokenizer."""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+from app.settings import env_data
+
+# A comma, optionally followed by "and" (", and"), or a standalone "and", with the
+# whitespace around them. "and" inside a name, e.g. "Sandy", is never a separator.
+SEPARATOR = re.compile(r"\s*,\s*(?:and\s+)?|\s+and\s+")
+WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_name(name: str) -> str:
+    """Return the canonical form of a producer name.
+
+    The name is NFC-normalized, so composed and decomposed accents are the same
+    name, and its whitespace runs are collapsed into single spaces.
+
+    Arguments:
+        name (str): The raw producer name.
+
+    Returns:
+        str: The canonical name, empty for a blank one.
+
+    """
+    return WHITESPACE.sub(" ", unicodedata.normalize("NFC", name)).strip()
+
+
+@lru_cache(maxsize=env_data.TOKENIZER_CACHE_SIZE)
+def tokenize_credits(credits: str) -> tuple[str, ...]:
+    """Split a credit, e.g. of producers or studios, into canonical names.
+
+    Names are separated by commas, " and " or ", and". Blank entries are discarded
+    and a name repeated within the same credit is only returned once. The same
+    credits repeat across the years, so results are memoized per raw string in an
+    LRU cache of `TOKENIZER_CACHE_SIZE` entries.
+
+    Arguments:
+        credits (str): The raw value of the `Movie.producers` or `Movie.studios`
+            column.
+
+    Returns:
+        tuple[str, ...]: The names, in the order they appear.
+
+    """
+    names = (normalize_name(name) for name in SEPARATOR.split(credits))
+    return tuple(dict.fromkeys(name for name in names if name))
+
+
+def split_producers(producers: str) -> list[str]:
+    """Split the free-text producers column into individual producer names.
+
+    Arguments:
+        producers (str): The raw value of the `Movie.producers` column.
+
+    Returns:
+        list[str]: The producer names, in the order they appear, see
+            `tokenize_credits`.
+
+    """
+    return list(tokenize_credits(producers))
+
+
+def tokenizer_stats() -> dict:
+    """Return the counters of the tokenizer memo.
+
+    Arguments:
+        Has no arguments.
+
+    Returns:
+        dict: The "size", "hits", "misses" and "hit_rate" of the memo.
+
+    """
+    info = tokenize_credits.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "size": info.currsize,
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+    }
@@ -0,0 +1,105 @@
+"""Memory footprint of the in-memory winners structures.
+
+The benchmark builds the structures the interval engines keep in memory from the
+same synthetic winning credits and reports the bytes they hold, measured with
+`tracemalloc`, normalized per 1M credits:
+
+- "index": the `IntervalIndex` of the "index" engine, a list of year ints per
+  producer and a counter of interval tuples per length;
+- "columnar": the `WinnersStore` of the "columnar" engine, interned producer ids
+  and years in two typed arrays.
+
+The time of a build and of the first interval computation over each structure
+are reported too: the index does its work while it is built, the store on the
+first read after a rebuild. The synthetic years tie many intervals on the
+minimum, so the computation time is dominated by building their dicts.
+
+Usage:
+    python -m benchmarks.memory --credits 1000000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from app.models.interval_index import IntervalIndex
+from app.models.winners_store import WinnersStore
+from benchmarks.synthetic import synthetic_credits
+
+PER_CREDITS = 1_000_000
+
+
+def measure(build: Callable[[], object], credits: int, seed: int) -> dict:
+    """Measure the memory held by a structure built from synthetic credits.
+
+    Arguments:
+        build (Callable[[], object]): Creates the empty structure, which has
+            `rebuild` and `get_intervals` methods.
+        credits (int): The number of winning credits.
+        seed (int): The seed of the synthetic credits.
+
+    Returns:
+        dict: The "bytes" held after the build, the "bytes_per_1m_credits", the
+            "build_ms" of an untraced build, the "intervals_ms" of the first
+            interval computation after it and, for the columnar store, the
+            "buffer_bytes" of its arrays.
+
+    """
+    wins = synthetic_credits(credits, seed)
+
+    tracemalloc.start()
+    structure = build()
+    structure.rebuild(wins)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    wins = synthetic_credits(credits, seed)
+    start = time.perf_counter()
+    structure.rebuild(wins)
+    built = time.perf_counter()
+    structure.get_intervals()
+    result = {
+        "bytes": held,
+        "bytes_per_1m_credits": round(held * PER_CREDITS / credits),
+        "build_ms": round((built - start) * 1000, 3),
+        "intervals_ms": round((time.perf_counter() - built) * 1000, 3),
+    }
+    if isinstance(structure, WinnersStore):
+        result["buffer_bytes"] = structure.nbytes()
+    return result
+
+
+def main(argv: list[str] = None) -> dict:
+    """Run the memory benchmark.
+
+    Arguments:
+        argv (list[str], optional): The command line arguments.
+
+    Returns:
+        dict: The measurements of each structure and the reduction of the columnar
+            store.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--credits", type=int, default=PER_CREDITS)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    results = {
+        "index": measure(IntervalIndex, args.credits, args.seed),
+        "columnar": measure(WinnersStore, args.credits, args.seed),
+    }
+    report = {
+        "credits": args.credits,
+        "results": results,
+        "reduction": round(
+            results["index"]["bytes"] / results["columnar"]["bytes"], 1),
+    }
+    print(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Per-request serialization cost of the producer interval responses.
+
+The benchmark computes the intervals once from the database configured in
+`DATABASE_URL` and times, per request, the work left after the intervals are
+cached:
+
+- "model": building `ProducersResultSchema`, the response model validation and
+  encoding FastAPI runs on it, and the `JSONResponse` rendering;
+- "raw": the lookup of the encoded bytes cached for the data version and the
+  raw `Response`, as served when `RESPONSE_MODE` is "raw";
+- "encode": the one-off encoding of the raw mode on each new data version.
+
+Usage:
+    python -m benchmarks.serialization --top-k 1000 --repeat 2000
+"""
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.db.sqlite import SessionLocal
+from app.models.cache import result_cache
+from app.models.movies import MovieDTO
+from app.routes.producers import (
+    encode_intervals,
+    intervals_json_key,
+    intervals_response,
+)
+from app.schemas.producers import ProducersResultSchema
+from app.utils.serializer import orjson
+
+RESPONSE_ADAPTER = TypeAdapter(ProducersResultSchema)
+
+
+def model_response(intervals: dict) -> bytes:
+    """Serialize the intervals the way the response model path does.
+
+    Arguments:
+        intervals (dict): The "min" and "max" intervals of the producers.
+
+    Returns:
+        bytes: The rendered response body.
+
+    """
+    result = ProducersResultSchema(min=intervals["min"], max=intervals["max"])
+    value = RESPONSE_ADAPTER.validate_python(result.model_dump())
+    content = jsonable_encoder(RESPONSE_ADAPTER.dump_python(value, mode="json"))
+    return JSONResponse(content).body
+
+
+def raw_response(top_k: int) -> bytes:
+    """Serve the intervals the way the raw response path does on a cache hit.
+
+    Arguments:
+        top_k (int): The number of smallest and largest intervals.
+
+    Returns:
+        bytes: The response body.
+
+    """
+    return intervals_response(result_cache.get(intervals_json_key(top_k)),
+                              Response()).body
+
+
+def time_call(call: Callable[[], bytes], repeat: int) -> dict:
+    """Time repeated calls of a serialization path.
+
+    Arguments:
+        call (Callable): The path to time, returning the response body.
+        repeat (int): The number of calls.
+
+    Returns:
+        dict: The mean "microseconds" per call and the body "bytes".
+
+    """
+    size = len(call())
+    start = time.perf_counter()
+    for _ in range(repeat):
+        call()
+    seconds = time.perf_counter() - start
+    return {"microseconds": round(seconds / repeat * 1e6, 2), "bytes": size}
+
+
+def main(argv: list[str] = None) -> dict:
+    """Run the serialization benchmark.
+
+    Arguments:
+        argv (list[str], optional): The command line arguments.
+
+    Returns:
+        dict: The measurements of each path.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top-k", type=int, default=1000,
+                        help="Number of smallest and largest intervals served.")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    with SessionLocal() as session:
+        intervals = MovieDTO(session).get_winning_movies(args.top_k)
+    result_cache.set(intervals_json_key(args.top_k), encode_intervals(intervals))
+
+    results = {
+        "encoder": "orjson" if orjson is not None else "json",
+        "model": time_call(lambda: model_response(intervals), args.repeat),
+        "raw": time_call(lambda: raw_response(args.top_k), args.repeat),
+        "encode": time_call(lambda: encode_intervals(intervals), args.repeat),
+    }
+    print(json.dumps(results, indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    main()
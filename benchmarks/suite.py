@@ -0,0 +1,208 @@
+"""Benchmark suite of the producer intervals on synthetic award lists.
+
+For each list size, a synthetic award list is written as CSV and loaded into a
+fresh SQLite database with the loader used by migration 0002. The suite then
+times `MovieDTO.get_winning_movies` for every interval engine and the full
+`/api/producers/intervals` round trip through `TestClient`, without and with the
+result cache, and writes the measurements as JSON so releases can be compared.
+
+Usage:
+    python -m benchmarks.suite --rows 1000 10000 100000 --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.loader import load_movies_csv
+from app.db.sqlite import Base, apply_sqlite_profile, get_db, get_read_db
+from app.models.cache import result_cache
+from app.models.interval_index import interval_index
+from app.models.movies import MovieDTO
+from app.models.snapshot import snapshot_store
+from app.models.winners_store import winners_store
+from benchmarks.synthetic import write_csv
+from main import app
+
+
+def timed(call: Callable[[], object], repeat: int) -> dict:
+    """Time repeated calls.
+
+    Arguments:
+        call (Callable): The call to time.
+        repeat (int): The number of calls.
+
+    Returns:
+        dict: The "min" and "median" duration of a call, in milliseconds.
+
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        durations.append((time.perf_counter() - start) * 1000)
+    return {"min": round(min(durations), 3),
+            "median": round(statistics.median(durations), 3)}
+
+
+def time_engines(engine: Engine, repeat: int) -> dict:
+    """Time `MovieDTO.get_winning_movies` for every interval engine.
+
+    The interval index and the winners store are dropped before each call, so the
+    "index" and "columnar" engines are timed with their rebuild.
+
+    Arguments:
+        engine (Engine): The engine of the benchmark database.
+        repeat (int): The number of calls per engine.
+
+    Returns:
+        dict: The durations of each engine.
+
+    """
+    results = {}
+    with Session(engine) as session:
+        for name in MovieDTO.ENGINES:
+            def compute(name: str = name) -> dict:
+                interval_index.invalidate()
+                winners_store.invalidate()
+                return MovieDTO(session, engine=name).get_winning_movies()
+
+            results[name] = timed(compute, repeat)
+    return results
+
+
+def time_round_trip(engine: Engine, repeat: int) -> dict:
+    """Time the `/api/producers/intervals` round trip through `TestClient`.
+
+    Arguments:
+        engine (Engine): The engine of the benchmark database.
+        repeat (int): The number of requests per measurement.
+
+    Returns:
+        dict: The durations of "uncached" requests, with the result cache cleared
+            before each one, and of "cached" requests.
+
+    """
+    session_local = sessionmaker(autoflush=False, bind=engine)
+
+    def override_get_db() -> Iterator[Session]:
+        with session_local() as session:
+            yield session
+
+    overrides = dict(app.dependency_overrides)
+    app.dependency_overrides.update({get_db: override_get_db,
+                                     get_read_db: override_get_db})
+
+    def request() -> None:
+        response = client.get("/api/producers/intervals")
+        response.raise_for_status()
+
+    def uncached_request() -> None:
+        result_cache.clear()
+        interval_index.invalidate()
+        winners_store.invalidate()
+        request()
+
+    try:
+        with TestClient(app) as client:
+            return {"uncached": timed(uncached_request, repeat),
+                    "cached": timed(request, repeat)}
+    finally:
+        app.dependency_overrides = overrides
+
+
+def run(rows: int, repeat: int, seed: int, directory: str) -> dict:
+    """Measure the loader, the engines and the round trip on a synthetic list.
+
+    The snapshot of the "snapshot" engine is written in `directory` and discarded
+    with the list, so neither the application's snapshot nor the one of another
+    size is read.
+
+    Arguments:
+        rows (int): The number of movies of the synthetic list.
+        repeat (int): The number of calls per measurement.
+        seed (int): The seed of the synthetic list.
+        directory (str): The directory of the CSV and database files.
+
+    Returns:
+        dict: The measurements of the list.
+
+    """
+    path = write_csv(os.path.join(directory, f"movies-{rows}.csv"), rows, seed)
+    engine = create_engine(f"sqlite:///{directory}/awards-{rows}.sqlite3",
+                           connect_args={"check_same_thread": False})
+    apply_sqlite_profile(engine)
+    Base.metadata.create_all(engine)
+    snapshot = snapshot_store.path
+    snapshot_store.path = Path(directory) / f"intervals-{rows}.snapshot"
+
+    try:
+        with engine.begin() as connection:
+            load = load_movies_csv(connection, path)
+        return {
+            "rows": rows,
+            "load": load,
+            "engines": time_engines(engine, repeat),
+            "round_trip": time_round_trip(engine, repeat),
+        }
+    finally:
+        engine.dispose()
+        snapshot_store.discard()
+        snapshot_store.path = snapshot
+        result_cache.clear()
+        interval_index.invalidate()
+        winners_store.invalidate()
+
+
+def main(argv: list[str] = None) -> dict:
+    """Run the benchmark suite.
+
+    Arguments:
+        argv (list[str], optional): The command line arguments.
+
+    Returns:
+        dict: The environment and the measurements of each list size.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Sizes of the synthetic lists, up to 10000000.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="JSON file the results are written to.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        report = {
+            "environment": {
+                "python": platform.python_version(),
+                "sqlite": sqlite3.sqlite_version,
+                "platform": platform.platform(),
+            },
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "results": [run(rows, args.repeat, args.seed, directory)
+                        for rows in args.rows],
+        }
+
+    document = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(document + "\n")
+    print(document)
+    return report
+
+
+if __name__ == "__main__":
+    main()
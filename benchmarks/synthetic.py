@@ -0,0 +1,132 @@
+"""Deterministic generator of synthetic award lists.
+
+The generated lists look like the bundled `Movielist.csv`: credits name one to
+four producers joined with ", " and a final " and ", a few producers are credited
+far more often than the rest (Zipf-like frequencies) and about a fifth of the
+movies are winners. The same seed always produces the same list, so benchmark
+runs of different releases measure the same input.
+"""
+
+import csv
+import itertools
+import random
+from array import array
+from collections.abc import Iterator
+
+STUDIOS = [
+    "Associated Film Distribution", "Columbia Pictures", "Paramount Pictures",
+    "Universal Studios", "Warner Bros.", "20th Century Fox", "MGM", "United Artists",
+]
+
+
+def join_credits(names: list[str]) -> str:
+    """Join producer names the way the award list writes them.
+
+    Arguments:
+        names (list[str]): The producer names.
+
+    Returns:
+        str: The names joined with ", " and a final " and ".
+
+    """
+    if len(names) == 1:
+        return names[0]
+    return ", ".join(names[:-1]) + " and " + names[-1]
+
+
+def synthetic_movies(rows: int, chunk_size: int = 10000, seed: int = 42,
+                     skew: float = 1.1) -> Iterator[list[dict]]:
+    """Generate chunks of award-list movies with multi-producer credits.
+
+    Arguments:
+        rows (int): The number of movies to generate.
+        chunk_size (int, optional): The number of movies of each chunk.
+        seed (int, optional): The seed of the random generator.
+        skew (float, optional): The Zipf exponent of the producer frequencies, `0`
+            credits every producer equally often.
+
+    Returns:
+        Iterator[list[dict]]: Yields the movies of each chunk, with the `movies`
+            table columns.
+
+    """
+    generator = random.Random(seed)
+    producers = [f"Producer {number}" for number in range(max(rows // 5, 10))]
+    cum_weights = list(itertools.accumulate(
+        1 / rank ** skew for rank in range(1, len(producers) + 1)))
+    years = range(1900, 2031)
+
+    for start in range(0, rows, chunk_size):
+        chunk = []
+        for number in range(start, min(start + chunk_size, rows)):
+            credited = generator.choices(
+                producers, cum_weights=cum_weights, k=generator.randint(1, 4))
+            chunk.append({
+                "year": generator.choice(years),
+                "title": f"Movie {number}",
+                "studios": generator.choice(STUDIOS),
+                "producers": join_credits(list(dict.fromkeys(credited))),
+                "winner": generator.random() < 0.2,
+            })
+        yield chunk
+
+
+def synthetic_credits(credits: int, seed: int = 42,
+                      skew: float = 1.1) -> Iterator[tuple[str, int]]:
+    """Generate the winning credits of a synthetic award list.
+
+    The credits are drawn with the Zipf-like producer frequencies of
+    `synthetic_movies` and yielded ordered by producer and year, like the rows of
+    the winners query. The draw is made by the call and kept in typed arrays, so
+    the iteration only allocates the yielded pairs, whose years are new int
+    objects as when the rows are read from the database.
+
+    Arguments:
+        credits (int): The number of winning credits.
+        seed (int, optional): The seed of the random generator.
+        skew (float, optional): The Zipf exponent of the producer frequencies.
+
+    Returns:
+        Iterator[tuple[str, int]]: Yields the (producer, year) pairs.
+
+    """
+    generator = random.Random(seed)
+    producers = max(credits // 5, 10)
+    cum_weights = list(itertools.accumulate(
+        1 / rank ** skew for rank in range(1, producers + 1)))
+    drawn = array("I", sorted(generator.choices(
+        range(producers), cum_weights=cum_weights, k=credits)))
+    years = array("H", (generator.randint(1900, 2030) for _ in range(credits)))
+
+    start = 0
+    for _, group in itertools.groupby(drawn):
+        end = start + sum(1 for _ in group)
+        years[start:end] = array("H", sorted(years[start:end]))
+        start = end
+
+    names = [f"Producer {number}" for number in range(producers)]
+    return ((names[producer], year) for producer, year in zip(drawn, years))
+
+
+def write_csv(path: str, rows: int, seed: int = 42) -> str:
+    """Write a synthetic award list in the format of `Movielist.csv`.
+
+    Arguments:
+        path (str): The path of the CSV file.
+        rows (int): The number of movies.
+        seed (int, optional): The seed of the random generator.
+
+    Returns:
+        str: The path of the CSV file.
+
+    """
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file, delimiter=";")
+        writer.writerow(["year", "title", "studios", "producers", "winner"])
+        for chunk in synthetic_movies(rows, seed=seed):
+            writer.writerows(
+                (movie["year"], movie["title"], movie["studios"],
+                 movie["producers"], "yes" if movie["winner"] else "")
+                for movie in chunk
+            )
+    return path
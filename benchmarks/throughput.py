@@ -0,0 +1,144 @@
+"""Throughput benchmark of the sync and async producer interval routes.
+
+The routers, their conditional GET dependency, the middlewares and the startup
+warm-up are picked once, when the application is imported, from DATABASE_MODE.
+Each mode is therefore measured in a process of its own, which builds the shipped
+application with `create_app`, fires the same number of concurrent requests at
+`/api/producers/intervals` and reports the requests per second. The results of
+every mode are printed as JSON. It reads the database configured in
+`DATABASE_URL`.
+
+Usage:
+    python -m benchmarks.throughput --requests 2000 --concurrency 10
+
+With the default pool of the sync engine, a concurrency above the pool size plus
+overflow makes the thread pool requests wait for connections.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI
+
+MODES = ("sync", "async")
+
+URL = "/api/producers/intervals"
+
+
+async def measure(app: FastAPI, requests: int, concurrency: int) -> dict:
+    """Send concurrent requests to an application and measure its throughput.
+
+    The application is started and stopped through its lifespan, as a server
+    would, so the intervals are warmed up before the first request is timed.
+
+    Arguments:
+        app (FastAPI): The application under test.
+        requests (int): The total number of requests.
+        concurrency (int): The maximum number of requests in flight.
+
+    Returns:
+        dict: The number of "requests", the failed "errors", the elapsed "seconds"
+            and the "requests_per_second" throughput.
+
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    client = httpx.AsyncClient(transport=transport, base_url="http://bench")
+
+    async def request() -> bool:
+        async with semaphore:
+            response = await client.get(URL)
+            return response.is_success
+
+    async with app.router.lifespan_context(app), client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(request() for _ in range(requests)))
+        seconds = time.perf_counter() - start
+
+    return {
+        "requests": requests,
+        "errors": responses.count(False),
+        "seconds": round(seconds, 3),
+        "requests_per_second": round(requests / seconds),
+    }
+
+
+def run_mode(args: argparse.Namespace) -> dict:
+    """Measure the shipped application in a database mode.
+
+    The mode is set before the application is imported, since the routers pick
+    their endpoints and dependencies when they are imported.
+
+    Arguments:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        dict: The measurement of the mode.
+
+    """
+    os.environ["DATABASE_MODE"] = args.mode
+
+    from app.models.cache import result_cache
+    from app.settings.fastapi_app import create_app
+
+    if not args.cache:
+        result_cache.max_size = 0
+
+    return asyncio.run(measure(create_app(), args.requests, args.concurrency))
+
+
+def spawn_mode(mode: str, argv: list[str]) -> dict:
+    """Measure a database mode in a child process.
+
+    Arguments:
+        mode (str): The DATABASE_MODE measured by the child process.
+        argv (list[str]): The command line arguments passed on to the child.
+
+    Returns:
+        dict: The measurement of the mode.
+
+    """
+    child = subprocess.run(
+        [sys.executable, "-m", "benchmarks.throughput", "--mode", mode, *argv],
+        capture_output=True, text=True, check=True)
+    return json.loads(child.stdout.splitlines()[-1])
+
+
+def main(argv: list[str] = None) -> dict:
+    """Run the throughput benchmark for every database mode.
+
+    Arguments:
+        argv (list[str], optional): The command line arguments.
+
+    Returns:
+        dict: The measurements of each mode.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--cache", action="store_true",
+                        help="Keep the result cache enabled.")
+    parser.add_argument("--mode", choices=MODES,
+                        help="Measure a single database mode in this process.")
+    argv = sys.argv[1:] if argv is None else argv
+    args = parser.parse_args(argv)
+
+    if args.mode:
+        result = run_mode(args)
+        print(json.dumps(result))
+        return result
+
+    results = {mode: spawn_mode(mode, argv) for mode in MODES}
+    print(json.dumps(results, indent=2))
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,11 @@ import uvicorn
 from app.settings.fastapi_app import create_app
 from app.utils.logger import Logger
 
+logger = Logger(__name__)
 app = create_app()
 
 
 if __name__ == "__main__":
     msg = 'Serviço iniciado'
-    Logger(__name__).debug(msg)
+    logger.debug(msg)
     uvicorn.run("main:app", host="127.0.0.1", port=7000, reload=True)
@@ -7,10 +7,10 @@ Create Date: 2025-03-03 10:15:37.610428
 """
 from typing import Sequence, Union
 
-import polars as pl
 import sqlalchemy as sa
 from alembic import op
 
+from app.db.loader import load_movies_csv
 from app.models.movies import Movie
 from app.settings import env_data
 
@@ -23,27 +23,9 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade():
     # ### commands auto generated by Alembic - please adjust! ###
-    df = pl.read_csv(f"{env_data.ROOT_DIR}/data/Movielist.csv", separator=";")
     bind = op.get_bind()
 
-
-    df = df.with_columns(
-        pl.when(df["winner"].is_null())
-        .then(False)
-        .otherwise(df["winner"].str.to_lowercase() == "yes")
-        .alias("winner")
-    )
-
-    for row in df.iter_rows(named=True):
-        bind.execute(
-            Movie.__table__.insert().values(
-                year=row["year"],
-                title=row["title"],
-                studios=row["studios"],
-                producers=row["producers"],
-                winner=row["winner"]
-            )
-        )
+    load_movies_csv(bind, f"{env_data.ROOT_DIR}/data/Movielist.csv")
     # ### end Alembic commands ###
 
 def downgrade() -> None:
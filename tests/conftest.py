@@ -1,20 +1,57 @@
 """Implementation of test management."""
 
+import asyncio
 import os
 from collections.abc import Iterator
+from pathlib import Path
 from typing import Callable
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, Engine, NullPool
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 
-from app.db.sqlite import Base, get_db
+from app.db.sqlite import Base, get_db, get_read_db
+from app.models.cache import result_cache
+from app.models.interval_index import interval_index
+from app.models.producer_index import producer_index
+from app.models.snapshot import snapshot_store
+from app.models.winners_store import winners_store
 from app.settings import env_data
 from main import app
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_state(tmp_path: Path,
+                       monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Start every test with an empty cache, stale indexes and no snapshot file.
+
+    The result cache, the interval and producer indexes, the winners store and
+    the interval snapshot are shared by the whole process, so results computed
+    against the database of a previous test must not leak into the next one.
+
+    Arguments:
+        tmp_path (Path): The temporary directory of the test.
+        monkeypatch (pytest.MonkeyPatch): Restores the snapshot path after the test.
+
+    Returns:
+        Iterator[None]: Yields control to the test.
+
+    """
+    monkeypatch.setattr(snapshot_store, "path", tmp_path / "intervals.snapshot")
+    result_cache.clear()
+    interval_index.invalidate()
+    winners_store.invalidate()
+    producer_index.invalidate()
+    yield
+    result_cache.clear()
+    interval_index.invalidate()
+    winners_store.invalidate()
+    producer_index.invalidate()
+
+
 @pytest.fixture(scope="module")
 def engine()-> Iterator[Engine]:
     """Create and manage an SQLite database engine for testing.
@@ -43,6 +80,26 @@ def engine()-> Iterator[Engine]:
     if os.path.exists(file_database):
         os.remove(file_database)
 
+@pytest.fixture(scope="module")
+def async_engine(engine: Engine) -> Iterator[AsyncEngine]:
+    """Create an aiosqlite engine on the same database file as `engine`.
+
+    Connections are not pooled, so the engine can be used by tests that run their
+    coroutines in separate event loops with `asyncio.run`.
+
+    Arguments:
+        engine (Engine): The sync engine whose database is shared.
+
+    Returns:
+        Iterator[AsyncEngine]: An SQLAlchemy `AsyncEngine` for the test database.
+
+    """
+    async_engine = create_async_engine(
+        engine.url.set(drivername="sqlite+aiosqlite"), poolclass=NullPool)
+    yield async_engine
+    asyncio.run(async_engine.dispose())
+
+
 @pytest.fixture(scope="function")
 def session(engine: create_engine) -> Session:
     """Create a new database session for each test.
@@ -94,8 +151,9 @@ def override_get_db(session: Session) -> Callable:
 def get_app(override_get_db: Callable) -> FastAPI:
     """Provide the FastAPI app instance with overridden dependencies for testing.
 
-    This fixture overrides the `get_db` dependency with the provided `override_get_db`
-    function, allowing for controlled database interactions during tests.
+    This fixture overrides the `get_db` and `get_read_db` dependencies with the
+    provided `override_get_db` function, allowing for controlled database
+    interactions during tests.
 
     Arguments:
         override_get_db (Callable): A function to override the default `get_db`
@@ -106,6 +164,7 @@ def get_app(override_get_db: Callable) -> FastAPI:
 
     """
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     return app
 
 
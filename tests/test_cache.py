@@ -0,0 +1,90 @@
+"""Implementation of the unit test for the result cache."""
+
+from unittest import mock
+
+from sqlalchemy.orm import Session
+
+from app.models.cache import DataVersion, ResultCache, data_version, result_cache
+from app.models.movies import CachedMovieDTO, Movie, MovieDTO
+
+
+def test_result_cache_eviction() -> None:
+    """Test the size and time-to-live eviction of the result cache.
+
+    Asserts:
+        - A repeated key is answered from the cache and counted as a hit.
+        - The least recently used entry is evicted beyond the maximum size.
+        - Expired entries are computed again.
+
+    """
+    cache = ResultCache(max_size=2, ttl=60)
+
+    assert cache.get_or_set("a", lambda: 1) == 1
+    assert cache.get_or_set("a", lambda: 2) == 1
+    assert cache.get_or_set("b", lambda: 3) == 3
+    assert cache.get_or_set("c", lambda: 4) == 4
+    assert cache.get_or_set("a", lambda: 5) == 5
+    assert cache.stats() == {"size": 2, "hits": 1, "misses": 4}
+
+    with mock.patch("app.models.cache.time.monotonic", return_value=10 ** 9):
+        assert cache.get_or_set("a", lambda: 6) == 6
+
+
+def test_data_version_observe() -> None:
+    """Test that the data version follows the tokens observed from a source.
+
+    Asserts:
+        - The first token and an unchanged one are only recorded.
+        - A token replacing the one written by this process is only recorded.
+        - Another change discards the derived data before bumping the version.
+
+    """
+    version = DataVersion()
+    seen = []
+    on_change = mock.Mock(side_effect=lambda: seen.append(version.value))
+
+    assert version.observe("source", "a-1", on_change=on_change) is False
+    assert version.observe("source", "a-1", on_change=on_change) is False
+    assert version.observe("source", "a-2", "a-1", on_change) is False
+    assert version.value == 0
+
+    assert version.observe("source", "a-4", "a-3", on_change) is True
+    assert seen == [0]
+    assert version.value == 1
+
+
+def test_cached_dto_invalidated_on_commit(session: Session) -> None:
+    """Test that committed movie changes invalidate the cached intervals.
+
+    Arguments:
+        session: The database session used in the test.
+
+    Asserts:
+        - A second request with unchanged data does not recompute the intervals.
+        - Committing a new movie bumps the data version and forces a recomputation.
+
+    """
+    session.add_all([
+        Movie(year=1990, title="Movie 1", studios="Studio 1",
+              producers="Producer X", winner=True),
+        Movie(year=1995, title="Movie 2", studios="Studio 1",
+              producers="Producer X", winner=True),
+    ])
+    session.commit()
+
+    with mock.patch.object(MovieDTO, "get_winning_movies",
+                           wraps=MovieDTO(session).get_winning_movies) as compute:
+        first = CachedMovieDTO(session).get_winning_movies()
+        assert CachedMovieDTO(session).get_winning_movies() is first
+        assert compute.call_count == 1
+
+        version = data_version.value
+        session.add(Movie(year=1996, title="Movie 3", studios="Studio 1",
+                          producers="Producer X", winner=True))
+        session.commit()
+
+        assert data_version.value == version + 1
+        CachedMovieDTO(session).get_winning_movies()
+        assert compute.call_count == 2
+
+    assert result_cache.hits == 1
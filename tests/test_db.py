@@ -1,8 +1,20 @@
 """Implementation of the database session unit test."""
 
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
-from app.db.sqlite import get_db
+from app.db.sqlite import (
+    POOL_OPTIONS,
+    apply_sqlite_profile,
+    create_read_engine,
+    get_db,
+    pool_options,
+)
+from app.settings import env_data
 
 
 def test_get_db(session: Session) -> None:
@@ -28,3 +40,73 @@ def test_get_db(session: Session) -> None:
 
     assert db_instance is not session
     assert db_instance != session
+
+
+def test_sqlite_profile(tmp_path: Path) -> None:
+    """Test the pragmas of the SQLite performance profile.
+
+    Arguments:
+        tmp_path: A temporary directory for the database file.
+
+    Asserts:
+        - New connections use the write-ahead log, NORMAL synchronous and
+          in-memory temporary tables.
+        - The `query_only` connections read but reject writes.
+
+    """
+    url = f"sqlite:///{tmp_path / 'profile.sqlite3'}"
+    engine = create_engine(url)
+    read_engine = create_engine(url)
+    apply_sqlite_profile(engine)
+    apply_sqlite_profile(read_engine, query_only=True)
+
+    with engine.begin() as connection:
+        assert connection.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert connection.scalar(text("PRAGMA synchronous")) == 1
+        assert connection.scalar(text("PRAGMA temp_store")) == 2
+        connection.execute(text("CREATE TABLE awards (year INTEGER)"))
+        connection.execute(text("INSERT INTO awards VALUES (1980)"))
+
+    with read_engine.connect() as connection:
+        assert connection.scalar(text("SELECT year FROM awards")) == 1980
+        with pytest.raises(OperationalError):
+            connection.execute(text("INSERT INTO awards VALUES (1981)"))
+
+    engine.dispose()
+    read_engine.dispose()
+
+
+def test_in_memory_database_engines(tmp_path: Path,
+                                    monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the engines can be created for an in-memory database.
+
+    Arguments:
+        tmp_path: A temporary directory for the database file.
+        monkeypatch: Used to enable the read-only connections.
+
+    Asserts:
+        - The pool sizing only applies to database files.
+        - An engine on an in-memory URL is created and usable.
+        - The read-only engine only exists when enabled, for a database file.
+
+    """
+    file_url = make_url(f"sqlite:///{tmp_path / 'pool.sqlite3'}")
+    for url in ("sqlite://", "sqlite:///:memory:", "sqlite+aiosqlite://",
+                "sqlite:///file:awards?mode=memory&uri=true"):
+        assert pool_options(make_url(url)) == {}
+    assert pool_options(file_url) == POOL_OPTIONS
+
+    engine = create_engine("sqlite://", **pool_options(make_url("sqlite://")))
+    with engine.connect() as connection:
+        assert connection.scalar(text("SELECT 1")) == 1
+    engine.dispose()
+
+    assert create_read_engine(file_url) is None
+    monkeypatch.setattr(env_data, "SQLITE_READ_ONLY", True)
+    assert create_read_engine(make_url("sqlite://")) is None
+
+    read_engine = create_read_engine(file_url)
+    with read_engine.connect() as connection:
+        assert connection.scalar(text("PRAGMA query_only")) == 1
+    read_engine.dispose()
+
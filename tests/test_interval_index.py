@@ -0,0 +1,215 @@
+"""Implementation of the unit test for the interval index."""
+
+import asyncio
+from unittest import mock
+
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.loader import load_movies
+from app.models.interval_index import IntervalIndex, interval_index
+from app.models.movies import (
+    AsyncMovieDTO,
+    Movie,
+    MovieDTO,
+    _intervals_from_producer_years,
+    _top_intervals_from_producer_years,
+)
+from app.models.winners_store import winners_store
+from benchmarks.synthetic import synthetic_credits
+
+
+def test_interval_index_add_win() -> None:
+    """Test that new wins only replace the intervals around them.
+
+    Asserts:
+        - The index built from sorted wins finds the minimum and maximum intervals.
+        - A win between two existing wins splits their interval.
+        - Producers tied on a bound are all returned.
+
+    """
+    index = IntervalIndex()
+    index.rebuild([("Producer X", 1990), ("Producer X", 2010),
+                   ("Producer Y", 2000), ("Producer Y", 2003)])
+
+    assert index.ready
+    assert index.get_intervals() == {
+        "min": [{"producer": "Producer Y", "interval": 3,
+                 "previousWin": 2000, "followingWin": 2003}],
+        "max": [{"producer": "Producer X", "interval": 20,
+                 "previousWin": 1990, "followingWin": 2010}],
+    }
+
+    index.add_win("Producer X", 1997)
+    index.add_win("Producer Z", 2020)
+    index.add_win("Producer Z", 2033)
+
+    assert index.get_intervals() == {
+        "min": [{"producer": "Producer Y", "interval": 3,
+                 "previousWin": 2000, "followingWin": 2003}],
+        "max": [{"producer": "Producer X", "interval": 13,
+                 "previousWin": 1997, "followingWin": 2010},
+                {"producer": "Producer Z", "interval": 13,
+                 "previousWin": 2020, "followingWin": 2033}],
+    }
+
+
+def test_interval_index_year_range() -> None:
+    """Test the intervals of a year range against the Python engine.
+
+    Asserts:
+        - Without bounds, the range query returns the unfiltered intervals.
+        - A range returns the intervals of the wins within it, ties included.
+        - The top_k intervals of a range match the one-pass selection.
+        - A range covering every year keeps the ties of the unfiltered top_k.
+        - A range without two wins of a producer has no intervals.
+
+    """
+    wins = list(synthetic_credits(5000, seed=7))
+    index = IntervalIndex()
+    index.rebuild(wins)
+
+    assert index.get_intervals_between() == index.get_intervals()
+    assert index.get_intervals_between(0, 9999) == _intervals_from_producer_years(wins)
+    for top_k in (1, 3, 50):
+        assert index.get_intervals_between(0, 9999, top_k) == \
+            _top_intervals_from_producer_years(wins, top_k)
+
+    for year_from, year_to in ((1990, 2000), (None, 1985), (2010, None)):
+        in_range = [
+            (producer, year) for producer, year in wins
+            if (year_from is None or year >= year_from)
+            and (year_to is None or year <= year_to)
+        ]
+        assert index.get_intervals_between(year_from, year_to) == \
+            _intervals_from_producer_years(in_range)
+        assert index.get_intervals_between(year_from, year_to, top_k=5) == \
+            _top_intervals_from_producer_years(in_range, 5)
+
+    index.add_win("Producer Z", 1500)
+    index.add_win("Producer Z", 1501)
+    assert index.get_intervals_between(1500, 1501)["min"] == [
+        {"producer": "Producer Z", "interval": 1,
+         "previousWin": 1500, "followingWin": 1501}]
+    assert index.get_intervals_between(1502, 1502) == {"min": [], "max": []}
+
+
+def test_index_engine_updated_on_commit(session: Session) -> None:
+    """Test that the index engine follows committed winners without a rebuild.
+
+    Arguments:
+        session: The database session used in the test.
+
+    Asserts:
+        - The index is built from the database on first use.
+        - A committed winner is added incrementally.
+        - A deleted movie marks the index for a rebuild.
+
+    """
+    interval_index.invalidate()
+    movie = Movie(year=1990, title="Movie 1", studios="Studio 1",
+                  producers="Producer X", winner=True)
+    session.add_all([movie, Movie(year=2000, title="Movie 2", studios="Studio 1",
+                                  producers="Producer X", winner=True)])
+    session.commit()
+
+    result = MovieDTO(session, engine="index").get_winning_movies()
+    assert result["min"][0]["interval"] == 10
+
+    with mock.patch.object(IntervalIndex, "rebuild") as rebuild:
+        session.add(Movie(year=1994, title="Movie 3", studios="Studio 1",
+                          producers="Producer X", winner=True))
+        session.commit()
+
+        result = MovieDTO(session, engine="index").get_winning_movies()
+        rebuild.assert_not_called()
+
+    assert result["min"][0]["interval"] == 4
+    assert result["max"][0]["interval"] == 6
+
+    session.delete(movie)
+    session.commit()
+
+    assert not interval_index.ready
+    assert MovieDTO(session, engine="index").get_winning_movies() == {
+        "min": [{"producer": "Producer X", "interval": 6,
+                 "previousWin": 1994, "followingWin": 2000}],
+        "max": [{"producer": "Producer X", "interval": 6,
+                 "previousWin": 1994, "followingWin": 2000}],
+    }
+
+
+def test_index_rebuild_racing_commit(session: Session) -> None:
+    """Test that a commit landing during a rebuild leaves the index stale.
+
+    Arguments:
+        session: The database session used in the test.
+
+    Asserts:
+        - A rebuild from rows read before a commit does not mark the index ready.
+        - The winners store is left stale the same way.
+        - The next read rebuilds both with the committed winner.
+
+    """
+    index_generation = interval_index.generation
+    store_generation = winners_store.generation
+    session.add_all([
+        Movie(year=1950, title="Movie 1", studios="Studio 1",
+              producers="Producer R", winner=True),
+        Movie(year=1951, title="Movie 2", studios="Studio 1",
+              producers="Producer R", winner=True),
+    ])
+    session.commit()
+
+    interval_index.rebuild([], index_generation)
+    winners_store.rebuild([], store_generation)
+    assert not interval_index.ready
+    assert not winners_store.ready
+
+    for engine in ("index", "columnar"):
+        result = MovieDTO(session, engine=engine).get_winning_movies()
+        assert {"producer": "Producer R", "interval": 1, "previousWin": 1950,
+                "followingWin": 1951} in result["min"]
+
+
+def test_year_range_external_write(session: Session, engine: Engine,
+                                   async_engine: AsyncEngine) -> None:
+    """Test that the year range follows the writes of another process.
+
+    Arguments:
+        session: The database session used in the test.
+        engine: The database engine used in the test.
+        async_engine: The async engine on the same database.
+
+    Asserts:
+        - After a write through a separate connection, a range covering every
+            year matches the unfiltered intervals, through both DTOs.
+
+    """
+    session.add_all([
+        Movie(year=year, title=f"Movie {year}", studios="Studio 1",
+              producers="Producer Q", winner=True)
+        for year in (1960, 1961)
+    ])
+    session.commit()
+
+    dto = MovieDTO(session, engine="python")
+    assert dto.get_intervals_between(0, 9999) == dto.get_winning_movies()
+
+    def write(year: int) -> dict:
+        with engine.begin() as connection:
+            load_movies(connection, [[
+                {"year": year, "title": f"Movie {year}", "studios": "Studio 1",
+                 "producers": "Producer Q", "winner": True}]])
+        return dto.get_winning_movies()
+
+    async def get_intervals_between() -> dict:
+        async with AsyncSession(async_engine) as async_session:
+            return await AsyncMovieDTO(async_session).get_intervals_between(0, 9999)
+
+    expected = write(2000)
+    assert dto.get_intervals_between(0, 9999) == expected
+
+    expected = write(2099)
+    assert asyncio.run(get_intervals_between()) == expected
@@ -0,0 +1,191 @@
+"""Implementation of the unit test for the bulk movies loader."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import Engine, func, inspect, select
+
+from app.db.loader import (
+    insert_movies,
+    iter_csv_stream_chunks,
+    load_movies_csv,
+    secondary_indexes_dropped,
+)
+from app.models.movies import Movie, MovieProducer, MoviesVersion, Producer
+from app.settings import env_data
+
+CSV_BODY = (
+    "year;title;studios;producers;winner\n"
+    "1990;Movie 1;Studio 1;Producer X and Producer Y;yes\n"
+    "\n"
+    "1991;Movie 2;Studio 1;Producer Ç;\n"
+    "1992;Movie 3;Studio 2;Producer Z;yes\n"
+    "1993;Movie 4;Studio 2;Producer Z;"
+).encode()
+
+
+def parse_stream(pieces: list[bytes], chunk_size: int) -> list[list[dict]]:
+    """Parse a CSV received in pieces with `iter_csv_stream_chunks`.
+
+    Arguments:
+        pieces (list[bytes]): The successive reads of the upload.
+        chunk_size (int): The maximum number of movies of each chunk.
+
+    Returns:
+        list[list[dict]]: The parsed chunks.
+
+    """
+    async def stream() -> AsyncIterator[bytes]:
+        for piece in pieces:
+            yield piece
+
+    async def collect() -> list[list[dict]]:
+        return [chunk async for chunk in iter_csv_stream_chunks(stream(), chunk_size)]
+
+    return asyncio.run(collect())
+
+
+def test_load_movies_csv(engine: Engine) -> None:
+    """Test the chunked load of the bundled award list.
+
+    Arguments:
+        engine: The database engine used in the test.
+
+    Asserts:
+        - Every row of the CSV is inserted, with the winners flagged.
+        - The producers of the loaded movies are linked.
+        - The secondary indexes dropped during the load are rebuilt.
+        - The shared version of the movies is bumped once for the whole load.
+
+    """
+    indexes = {index["name"] for index in inspect(engine).get_indexes("movies")}
+    version = select(MoviesVersion.version)
+    with engine.connect() as connection:
+        before = connection.scalar(version)
+
+    with engine.begin() as connection:
+        report = load_movies_csv(
+            connection, f"{env_data.ROOT_DIR}/data/Movielist.csv",
+            chunk_size=50, rebuild_indexes=True)
+
+    assert report["rows"] == 206
+    assert report["rows_per_second"] > 0
+
+    with engine.connect() as connection:
+        assert connection.scalar(select(func.count()).select_from(Movie)) == 206
+        assert connection.scalar(
+            select(func.count()).select_from(Movie).where(Movie.winner.is_(True))
+        ) == 42
+        assert connection.scalar(
+            select(func.count()).select_from(MovieProducer)) > 206
+        assert connection.scalar(version) == before + 1
+
+    assert {index["name"] for index in inspect(engine).get_indexes("movies")} == indexes
+
+
+def test_iter_csv_stream_chunks_boundaries() -> None:
+    """Test that chunks do not depend on where the upload is split.
+
+    Asserts:
+        - Full chunks hold `chunk_size` movies and the last one the remainder.
+        - Lines and UTF-8 characters split across reads are reassembled.
+        - Blank lines are skipped and the last line needs no line break.
+
+    """
+    expected = parse_stream([CSV_BODY], chunk_size=10)[0]
+    assert [movie["year"] for movie in expected] == [1990, 1991, 1992, 1993]
+    assert expected[1]["producers"] == "Producer Ç"
+    assert [movie["winner"] for movie in expected] == [True, False, True, False]
+
+    split = CSV_BODY.index("Ç".encode()) + 1
+    for pieces in ([CSV_BODY[:split], CSV_BODY[split:]],
+                   [CSV_BODY[i:i + 1] for i in range(len(CSV_BODY))]):
+        chunks = parse_stream(pieces, chunk_size=3)
+        assert [len(chunk) for chunk in chunks] == [3, 1]
+        assert [movie for chunk in chunks for movie in chunk] == expected
+
+    assert [len(chunk) for chunk in parse_stream([CSV_BODY], chunk_size=2)] == [2, 2]
+
+
+@pytest.mark.parametrize("body", [
+    b"year;title;studios\n1990;Movie 1;Studio 1\n",
+    b"year;title;studios;producers;winner\nnineteen;Movie 1;Studio 1;Producer X;\n",
+    b"year;title;studios;producers;winner\n1990;Movie 1\n",
+])
+def test_iter_csv_stream_chunks_malformed(body: bytes) -> None:
+    """Test that a malformed header or row is rejected.
+
+    Arguments:
+        body (bytes): A CSV missing a column, with a non-integer year or with a
+            truncated row.
+
+    Asserts:
+        - The parse raises a ValueError.
+
+    """
+    with pytest.raises(ValueError):
+        parse_stream([body], chunk_size=10)
+
+
+def test_secondary_indexes_restored_on_error(engine: Engine) -> None:
+    """Test that the dropped indexes are rebuilt when the load fails.
+
+    Arguments:
+        engine: The database engine used in the test.
+
+    Asserts:
+        - The indexes are dropped inside the context.
+        - They exist again after an error raised inside it.
+
+    """
+    indexes = {index["name"] for index in inspect(engine).get_indexes("movies")}
+
+    with engine.connect() as connection:
+        with pytest.raises(RuntimeError), secondary_indexes_dropped(connection):
+            assert not {index["name"] for index in
+                        inspect(connection).get_indexes("movies")} & indexes
+            raise RuntimeError("load failed")
+
+        assert {index["name"] for index in
+                inspect(connection).get_indexes("movies")} == indexes
+        connection.rollback()
+
+
+def test_insert_movies_links_producers(engine: Engine) -> None:
+    """Test that inserted movies are linked to their interned producers.
+
+    Arguments:
+        engine: The database engine used in the test.
+
+    Asserts:
+        - Every producer of a movie gets a `movie_producers` row with its year.
+        - A producer shared by movies is interned once.
+        - Nothing is linked when `link_producers` is disabled.
+
+    """
+    movies = [
+        {"year": 1970, "title": "Movie 1", "studios": "Studio 1",
+         "producers": "Producer L and Producer M", "winner": True},
+        {"year": 1975, "title": "Movie 2", "studios": "Studio 1",
+         "producers": "Producer L", "winner": False},
+    ]
+    links = select(Producer.name, MovieProducer.year, MovieProducer.winner).join(
+        Producer, Producer.id == MovieProducer.producer_id
+    ).where(Producer.name.in_(["Producer L", "Producer M"])).order_by(
+        MovieProducer.year, Producer.name)
+
+    with engine.connect() as connection:
+        assert insert_movies(connection, movies) == 2
+        assert connection.execute(links).tuples().all() == [
+            ("Producer L", 1970, True),
+            ("Producer M", 1970, True),
+            ("Producer L", 1975, False),
+        ]
+        assert connection.scalar(select(func.count()).select_from(Producer).where(
+            Producer.name == "Producer L")) == 1
+        connection.rollback()
+
+        assert insert_movies(connection, movies, link_producers=False) == 2
+        assert connection.execute(links).tuples().all() == []
+        connection.rollback()
@@ -0,0 +1,76 @@
+"""Implementation of the unit test for the system log."""
+
+import json
+import logging
+
+import pytest
+
+from app.utils.logger import (
+    JsonFormatter,
+    Logger,
+    SamplingFilter,
+    parse_sample_rates,
+    pipeline,
+)
+
+
+def make_record(level: int, msg: str = "message") -> logging.LogRecord:
+    """Build a log record of the given level.
+
+    Arguments:
+        level (int): The record level.
+        msg (str, optional): The record message.
+
+    Returns:
+        logging.LogRecord: The record.
+
+    """
+    return logging.LogRecord("tests", level, __file__, 1, msg, None, None)
+
+
+def test_logger_uses_shared_queue() -> None:
+    """Test that loggers hand their records to the shared pipeline once.
+
+    Asserts:
+        - Creating a logger twice attaches a single queue handler.
+
+    """
+    Logger("tests.logger")
+    logger = Logger("tests.logger")
+
+    assert logger.tip_logs.handlers == [pipeline.handler]
+
+
+def test_sampling_filter() -> None:
+    """Test the per-level sampling of the log records.
+
+    Asserts:
+        - A rate of 0.25 keeps one record out of four.
+        - A rate of 0 drops every record.
+        - Levels without a rate are always kept.
+
+    """
+    sampling = SamplingFilter(parse_sample_rates("info=0.25, DEBUG=0"))
+
+    assert sum(sampling.filter(make_record(logging.INFO)) for _ in range(100)) == 25
+    assert not any(sampling.filter(make_record(logging.DEBUG)) for _ in range(10))
+    assert all(sampling.filter(make_record(logging.ERROR)) for _ in range(10))
+
+    with pytest.raises(ValueError):
+        parse_sample_rates("VERBOSE=0.5")
+    with pytest.raises(ValueError):
+        parse_sample_rates("INFO=2")
+
+
+def test_json_formatter() -> None:
+    """Test the structured JSON log format.
+
+    Asserts:
+        - The record is written as a JSON document with its level and message.
+
+    """
+    document = json.loads(JsonFormatter().format(make_record(logging.INFO, "done")))
+
+    assert document["log_level"] == "INFO"
+    assert document["origin"] == "tests"
+    assert document["message"] == "done"
@@ -0,0 +1,125 @@
+"""Implementation of the unit test for the application metrics."""
+
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from starlette.routing import Route
+
+from app.utils.metrics import (
+    QUERY_LATENCY,
+    Histogram,
+    MetricsMiddleware,
+    instrument_engine,
+)
+
+
+def test_histogram_render() -> None:
+    """Test the Prometheus text format of a histogram.
+
+    Asserts:
+        - The buckets are cumulative and end with +Inf.
+        - The sum and count of the observations are rendered.
+
+    """
+    histogram = Histogram("duration_seconds", "A duration.", ("route",),
+                          buckets=(0.1, 1))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(5, "/a")
+
+    assert histogram.render().splitlines() == [
+        "# HELP duration_seconds A duration.",
+        "# TYPE duration_seconds histogram",
+        'duration_seconds_bucket{route="/a",le="0.1"} 1',
+        'duration_seconds_bucket{route="/a",le="1"} 2',
+        'duration_seconds_bucket{route="/a",le="+Inf"} 3',
+        'duration_seconds_sum{route="/a"} 5.55',
+        'duration_seconds_count{route="/a"} 3',
+    ]
+
+
+def test_get_metrics(app_client: TestClient) -> None:
+    """Test the metrics exposed on `/metrics`.
+
+    Arguments:
+        app_client: The test client to interact with the FastAPI application.
+
+    Asserts:
+        - Requests are measured under the path template of their route.
+        - Error responses are counted by status.
+        - The interval computation is timed.
+        - The tokenizer memo counters are exported.
+
+    """
+    app_client.get("api/producers/intervals")
+    app_client.get("api/producers/intervals", params={"top_k": 0})
+
+    response = app_client.get("metrics")
+    metrics = response.text
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert ('http_request_duration_seconds_count{method="GET",'
+            'route="/api/producers/intervals"}') in metrics
+    assert ('http_request_errors_total{method="GET",'
+            'route="/api/producers/intervals",status="422"}') in metrics
+    assert 'http_requests_in_progress{method="GET",route="/metrics"} 1' in metrics
+    assert "interval_compute_duration_seconds_count{engine=" in metrics
+    assert 'producer_tokenizer_lookups{result="hit"}' in metrics
+
+
+def test_instrument_engine() -> None:
+    """Test the SQL statement timing of an instrumented engine.
+
+    Asserts:
+        - Every executed statement is observed under its keyword.
+
+    """
+    def count() -> int:
+        lines = QUERY_LATENCY.render().splitlines()
+        prefix = 'db_query_duration_seconds_count{statement="SELECT"} '
+        return next((int(line.removeprefix(prefix)) for line in lines
+                     if line.startswith(prefix)), 0)
+
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    before = count()
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        connection.execute(text("  select 2"))
+
+    assert count() == before + 2
+    engine.dispose()
+
+
+def test_route_of_cached(get_app: FastAPI) -> None:
+    """Test that the route template of a path is only looked up once.
+
+    Arguments:
+        get_app: The FastAPI application whose routes are matched.
+
+    Asserts:
+        - Path parameters are labelled with the route template.
+        - The routes are not scanned again for a path already seen.
+        - Unknown paths are labelled "unmatched".
+
+    """
+    middleware = MetricsMiddleware(get_app)
+
+    def scope(path: str) -> dict:
+        return {"type": "http", "method": "GET", "path": path, "app": get_app}
+
+    with mock.patch.object(Route, "matches", autospec=True,
+                           side_effect=Route.matches) as matches:
+        wins = middleware.route_of(scope("/api/producers/Producer X/wins"))
+        scans = matches.call_count
+        assert scans > 0
+        assert middleware.route_of(scope("/api/producers/Producer X/wins")) == wins
+        assert matches.call_count == scans
+
+    assert wins == "/api/producers/{name}/wins"
+    assert middleware.route_of(scope("/nowhere")) == "unmatched"
+
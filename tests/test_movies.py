@@ -0,0 +1,177 @@
+"""Implementation of the unit test for the movies model."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import Select, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.interval_index import interval_index
+from app.models.movies import (
+    AsyncMovieDTO, CachedAsyncMovieDTO, Movie, MovieDTO, MovieProducer, Producer,
+    split_producers, _winning_movies_query, _winning_producer_years_query
+)
+
+
+def test_split_producers() -> None:
+    """Test the split of the free-text producers column.
+
+    Asserts:
+        - Names separated by commas and " and " are split and stripped.
+        - Blank and repeated names are discarded.
+
+    """
+    assert split_producers("Producer X, Producer Y and Producer Z") == [
+        "Producer X", "Producer Y", "Producer Z"]
+    assert split_producers("Producer X,  , Producer X") == ["Producer X"]
+
+
+def test_movie_producers_populated_on_write(session: Session) -> None:
+    """Test that ORM writes keep the `movie_producers` table in sync.
+
+    Arguments:
+        session: The database session used in the test.
+
+    Asserts:
+        - Inserting a movie interns its producers and links them to the movie.
+        - Updating the producers of a movie relinks it.
+        - Deleting a movie removes its links.
+
+    """
+    movie = Movie(year=1990, title="Movie 1", studios="Studio 1",
+                  producers="Producer X and Producer Y", winner=True)
+    session.add(movie)
+    session.commit()
+
+    query = select(Producer.name, MovieProducer.year, MovieProducer.winner).join(
+        Producer, Producer.id == MovieProducer.producer_id
+    ).where(MovieProducer.movie_id == movie.id).order_by(Producer.name)
+
+    assert session.execute(query).tuples().all() == [
+        ("Producer X", 1990, True), ("Producer Y", 1990, True)]
+
+    movie.producers = "Producer Z"
+    session.commit()
+
+    assert session.execute(query).tuples().all() == [("Producer Z", 1990, True)]
+
+    session.delete(movie)
+    session.commit()
+
+    assert session.execute(query).all() == []
+
+
+def test_interval_engines_match(session: Session) -> None:
+    """Test that every engine returns the same tied bounds.
+
+    Arguments:
+        session: The database session used in the test.
+
+    Asserts:
+        - Every engine returns every producer tied on a bound.
+        - The top_k smallest and largest intervals are ranked.
+        - An unknown engine is rejected.
+
+    """
+    session.add_all([
+        Movie(year=1990, title="Movie 1", studios="Studio 1",
+              producers="Producer X and Producer Y", winner=True),
+        Movie(year=1991, title="Movie 2", studios="Studio 1",
+              producers="Producer X, Producer Y", winner=True),
+        Movie(year=2000, title="Movie 3", studios="Studio 2",
+              producers="Producer Z", winner=True),
+        Movie(year=2013, title="Movie 4", studios="Studio 2",
+              producers="Producer Z", winner=True),
+        Movie(year=2015, title="Movie 5", studios="Studio 2",
+              producers="Producer X", winner=False),
+        Movie(year=2018, title="Movie 6", studios="Studio 2",
+              producers="Producer Y", winner=True),
+    ])
+    session.commit()
+
+    expected = {
+        "min": [
+            {"producer": "Producer X", "interval": 1,
+             "previousWin": 1990, "followingWin": 1991},
+            {"producer": "Producer Y", "interval": 1,
+             "previousWin": 1990, "followingWin": 1991},
+        ],
+        "max": [
+            {"producer": "Producer Y", "interval": 27,
+             "previousWin": 1991, "followingWin": 2018},
+        ],
+    }
+    for engine in MovieDTO.ENGINES:
+        assert MovieDTO(session, engine=engine).get_winning_movies() == expected
+
+    top = MovieDTO(session).get_winning_movies(top_k=2)
+
+    assert [(row["producer"], row["interval"]) for row in top["min"]] == [
+        ("Producer X", 1), ("Producer Y", 1)]
+    assert [(row["producer"], row["interval"]) for row in top["max"]] == [
+        ("Producer Y", 27), ("Producer Z", 13)]
+
+    with pytest.raises(ValueError):
+        MovieDTO(session, engine="unknown")
+
+
+def test_async_movie_dto(session: Session, async_engine: AsyncEngine) -> None:
+    """Test that the async DTO returns the same intervals as the sync one.
+
+    Arguments:
+        session: The database session used in the test.
+        async_engine: The async engine on the same database.
+
+    Asserts:
+        - Every engine returns the same result through both DTOs.
+        - The studio intervals are the same through both DTOs.
+
+    """
+    async def get_intervals(engine: str) -> dict:
+        async with AsyncSession(async_engine) as async_session:
+            return await AsyncMovieDTO(async_session, engine).get_winning_movies()
+
+    async def get_studio_intervals(top_k: int = None) -> dict:
+        async with AsyncSession(async_engine) as async_session:
+            return await CachedAsyncMovieDTO(async_session).get_dimension_intervals(
+                "studios", top_k)
+
+    for engine in MovieDTO.ENGINES:
+        interval_index.invalidate()
+        expected = MovieDTO(session, engine).get_winning_movies()
+
+        interval_index.invalidate()
+        assert asyncio.run(get_intervals(engine)) == expected
+
+    for top_k in (None, 2):
+        assert asyncio.run(get_studio_intervals(top_k)) == MovieDTO(
+            session).get_dimension_intervals("studios", top_k)
+
+
+@pytest.mark.parametrize("query, scan", [
+    (_winning_movies_query(),
+     "USING COVERING INDEX ix_movies_winner_producers_year"),
+    (_winning_producer_years_query(),
+     "USING INDEX ix_movie_producers_winner_producer_year"),
+])
+def test_winner_queries_use_index_order(session: Session, query: Select,
+                                        scan: str) -> None:
+    """Test that the winner queries are read in index order.
+
+    Arguments:
+        session: The database session used to explain the query.
+        query: The winner query to explain.
+        scan: The expected index scan of the query plan.
+
+    Asserts:
+        - The query plan scans the winner partial index.
+        - SQLite does not sort the rows in a temporary B-tree.
+
+    """
+    statement = query.compile(session.bind, compile_kwargs={"literal_binds": True})
+    plan = " | ".join(
+        row[-1] for row in session.execute(text(f"EXPLAIN QUERY PLAN {statement}")))
+
+    assert scan in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,91 @@
+"""Implementation of the unit test for the movies import route."""
+
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from app.models.cache import data_version
+from app.models.movies import MovieDTO
+from app.models.snapshot import snapshot_store
+from app.settings import env_data
+
+CSV_BODY = (
+    "year;title;studios;producers;winner\n"
+    "1990;Movie 1;Studio 1;Producer X and Producer Y;yes\n"
+    "1991;Movie 2;Studio 1;Producer Y;\n"
+    "2000;Movie 3;Studio 2;Producer X, Producer Z;yes\n"
+    "2002;Movie 4;Studio 2;Producer Ç;yes\n"
+).encode()
+
+
+def test_import_movies(app_client: TestClient) -> None:
+    """Test the streamed import of an award list.
+
+    The body is sent in small pieces that split lines and multi-byte characters,
+    and the import is written in chunks of two movies.
+
+    Arguments:
+        app_client: The test client to interact with the FastAPI application.
+
+    Asserts:
+        - Every movie of the body is imported.
+        - The data version is bumped once and the intervals reflect the import.
+
+    """
+    version = data_version.value
+
+    def body():
+        for start in range(0, len(CSV_BODY), 7):
+            yield CSV_BODY[start:start + 7]
+
+    with mock.patch.object(env_data, "LOAD_CHUNK_SIZE", 2):
+        response = app_client.post("api/movies/import", content=body())
+
+    assert response.status_code == 200
+    assert response.json()["rows"] == 4
+    assert data_version.value == version + 1
+
+    response = app_client.get("api/producers/intervals")
+
+    assert response.json()["min"][0] == {
+        "producer": "Producer X", "interval": 10,
+        "previousWin": 1990, "followingWin": 2000}
+
+
+def test_import_movies_invalid_csv(app_client: TestClient) -> None:
+    """Test that a malformed award list is rejected.
+
+    Arguments:
+        app_client: The test client to interact with the FastAPI application.
+
+    Asserts:
+        - A body without the producers column returns a 400 status code.
+
+    """
+    response = app_client.post(
+        "api/movies/import", content=b"year;title;studios\n1990;Movie 1;Studio 1\n")
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Missing CSV columns: ['producers']"}
+
+
+def test_import_movies_snapshot_failure(app_client: TestClient) -> None:
+    """Test that a failed snapshot write does not fail a committed import.
+
+    Arguments:
+        app_client: The test client to interact with the FastAPI application.
+
+    Asserts:
+        - The import is reported with a 200 status code.
+        - No snapshot is left, so the workers read the database.
+
+    """
+    with mock.patch.object(env_data, "INTERVAL_ENGINE", "snapshot"), \
+            mock.patch.object(MovieDTO, "write_snapshot",
+                              side_effect=OSError("No space left on device")):
+        response = app_client.post("api/movies/import", content=CSV_BODY)
+
+    assert response.status_code == 200
+    assert response.json()["rows"] == 4
+    assert snapshot_store.current() is None
+
@@ -0,0 +1,78 @@
+"""Implementation of the unit test for the polars interval engine."""
+
+import os
+
+from sqlalchemy import Engine, delete
+from sqlalchemy.orm import Session
+
+from app.db.loader import load_movies, load_movies_csv
+from app.models.movies import Movie, MovieDTO, MovieProducer, Producer
+from app.settings import env_data
+from benchmarks.synthetic import synthetic_movies
+
+# Raise it (e.g. SYNTHETIC_ROWS=10000000) to compare the engines on large inputs.
+SYNTHETIC_ROWS = int(os.environ.get("SYNTHETIC_ROWS", 20000))
+
+
+def test_synthetic_movies_deterministic() -> None:
+    """Test the synthetic award list generator.
+
+    Asserts:
+        - The same seed generates the same list.
+        - Credits are joined with ", " and " and " and split back by the loader.
+
+    """
+    movies = [movie for chunk in synthetic_movies(2000, chunk_size=300)
+              for movie in chunk]
+
+    assert len(movies) == 2000
+    assert movies == [movie for chunk in synthetic_movies(2000) for movie in chunk]
+    assert any(", " in movie["producers"] for movie in movies)
+    assert any(" and " in movie["producers"] for movie in movies)
+
+
+def assert_engines_match(session: Session) -> None:
+    """Assert that the polars engine matches the other engines.
+
+    Arguments:
+        session: The database session used to run the engines.
+
+    Asserts:
+        - The polars engine returns the same tied bounds as the python and sql
+          engines.
+
+    """
+    polars_result = MovieDTO(session, engine="polars").get_winning_movies()
+
+    assert polars_result == MovieDTO(session, engine="sql").get_winning_movies()
+    assert polars_result == MovieDTO(session, engine="python").get_winning_movies()
+
+
+def test_polars_engine_bundled_list(engine: Engine, session: Session) -> None:
+    """Test the polars engine on the bundled award list.
+
+    Arguments:
+        engine: The database engine used in the test.
+        session: The database session used in the test.
+
+    """
+    with engine.begin() as connection:
+        load_movies_csv(connection, f"{env_data.ROOT_DIR}/data/Movielist.csv")
+
+    assert_engines_match(session)
+
+
+def test_polars_engine_synthetic_list(engine: Engine, session: Session) -> None:
+    """Test the polars engine on a synthetic award list.
+
+    Arguments:
+        engine: The database engine used in the test.
+        session: The database session used in the test.
+
+    """
+    with engine.begin() as connection:
+        for model in (MovieProducer, Producer, Movie):
+            connection.execute(delete(model))
+        load_movies(connection, synthetic_movies(SYNTHETIC_ROWS))
+
+    assert_engines_match(session)
@@ -1,12 +1,36 @@
 """Implementation of the unit test for the producers route."""
 
+import asyncio
+import json
+import threading
+from collections.abc import AsyncIterator, Iterator
 from unittest import mock
 
 import pytest
+from fastapi import Depends, FastAPI, Response
 from fastapi.testclient import TestClient
+from sqlalchemy import Engine, delete, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models.movies import Movie, MovieDTO
+from app.db.loader import load_movies
+from app.db.sqlite import get_async_db
+from app.models.cache import data_version, result_cache
+from app.models.movies import (
+    Movie,
+    MovieDTO,
+    MovieProducer,
+    Producer,
+    mark_movies_changed,
+    observe_movies_version,
+    read_movies_version,
+)
+from app.models.producer_index import producer_index
+from app.routes.producers import get_producer_intervals, get_producer_intervals_async
+from app.schemas.producers import ProducersResultSchema
+from app.settings import env_data
+from app.settings import fastapi_app
+from app.settings.fastapi_app import conditional_get_async
 
 
 @pytest.fixture
@@ -40,12 +64,56 @@ def mock_data(session: Session) -> Session:
     session.commit()
     return session
 
+def delete_movies(session: Session) -> None:
+    """Delete every movie and producer of the test database.
+
+    Arguments:
+        session: The database session used to delete the rows.
+
+    Returns:
+        None: Method without data return.
+
+    """
+    session.execute(delete(MovieProducer))
+    session.execute(delete(Movie))
+    session.execute(delete(Producer))
+    mark_movies_changed(session, reindex=True)
+    session.commit()
+
+
+@pytest.fixture
+def empty_movies(session: Session) -> Iterator[Session]:
+    """Run a test on an empty database, restoring the rows of the module after it.
+
+    The database is shared by the tests of the module, so the movies are saved
+    before the test and inserted back once it is done.
+
+    Arguments:
+        session: The database session used in the test.
+
+    Returns:
+        Iterator[Session]: Yields the session of the emptied database.
+
+    """
+    movies = [
+        {column: getattr(movie, column) for column in
+         ("year", "title", "studios", "producers", "winner")}
+        for movie in session.scalars(select(Movie).order_by(Movie.id))
+    ]
+    delete_movies(session)
+    yield session
+    delete_movies(session)
+    session.add_all([Movie(**movie) for movie in movies])
+    session.commit()
+
+
 def test_get_producer_intervals_exception(app_client: TestClient) -> None:
     """Test handling of an exception when fetching producer intervals.
 
     This test simulates an error in the `get_winning_movies` method of the `MovieDTO`
     class by mocking it to raise an exception. It verifies that the API returns a 500
-    status code and a generic error message.
+    status code and a generic error message. The result cache primed at startup is
+    cleared first, so the intervals are computed again.
 
     Arguments:
         app_client: The test client to interact with the FastAPI application.
@@ -57,7 +125,7 @@ def test_get_producer_intervals_exception(app_client: TestClient) -> None:
     """
     with mock.patch.object(MovieDTO, 'get_winning_movies',
                            side_effect=Exception("Forced error")):
-
+        result_cache.clear()
         response = app_client.get("api/producers/intervals")
 
         assert response.status_code == 500
@@ -96,3 +164,465 @@ def test_get_producer_intervals(override_get_db: Session,
 
     assert len(data["min"]) > 0
     assert len(data["max"]) > 0
+
+
+def test_get_producer_intervals_async(mock_data: Session,
+                                      async_engine: AsyncEngine) -> None:
+    """Test the endpoint served on the event loop when DATABASE_MODE is async.
+
+    Arguments:
+        mock_data: The session used to populate the database with mock data for
+            testing.
+        async_engine: The async engine on the same database.
+
+    Asserts:
+        - The async endpoint returns the same intervals as the sync one.
+
+    """
+    async def get_intervals() -> ProducersResultSchema:
+        async with AsyncSession(async_engine) as session:
+            return await get_producer_intervals_async(Response(), session=session)
+
+    result = asyncio.run(get_intervals())
+
+    assert result == get_producer_intervals(Response(), session=mock_data)
+
+
+def test_get_producer_intervals_top_k(empty_movies: Session,
+                                      app_client: TestClient) -> None:
+    """Test the top_k query parameter of the producer intervals.
+
+    The test seeds its own movies, inserting the producers tied on the minimum
+    out of name order.
+
+    Arguments:
+        empty_movies: The session of the emptied database used to seed the
+            movies.
+        app_client: The test client to interact with the FastAPI application.
+
+    Asserts:
+        - The smallest intervals are returned in ascending order.
+        - The largest intervals are returned in descending order.
+        - Ties cut by top_k are kept by producer name, not insertion order.
+        - A year range covering every year keeps the same ties.
+        - A top_k below one is rejected.
+
+    """
+    empty_movies.add_all([
+        Movie(year=year, title=f"Movie {year}", studios="Studio 1",
+              producers=producer, winner=True)
+        for producer, year in (("Producer B", 2000), ("Producer B", 2001),
+                               ("Producer A", 2010), ("Producer A", 2011),
+                               ("Producer C", 1990), ("Producer C", 2000),
+                               ("Producer C", 2015))
+    ])
+    empty_movies.commit()
+
+    response = app_client.get("api/producers/intervals", params={"top_k": 2})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "min": [
+            {"producer": "Producer A", "interval": 1,
+             "previousWin": 2010, "followingWin": 2011},
+            {"producer": "Producer B", "interval": 1,
+             "previousWin": 2000, "followingWin": 2001},
+        ],
+        "max": [
+            {"producer": "Producer C", "interval": 15,
+             "previousWin": 2000, "followingWin": 2015},
+            {"producer": "Producer C", "interval": 10,
+             "previousWin": 1990, "followingWin": 2000},
+        ],
+    }
+
+    response = app_client.get("api/producers/intervals", params={"top_k": 1})
+
+    assert [row["producer"] for row in response.json()["min"]] == ["Producer A"]
+
+    for top_k in (1, 2, 3):
+        expected = app_client.get(
+            "api/producers/intervals", params={"top_k": top_k}).json()
+        response = app_client.get(
+            "api/producers/intervals",
+            params={"top_k": top_k, "year_from": 0, "year_to": 9999})
+
+        assert response.status_code == 200
+        assert response.json() == expected
+
+    response = app_client.get("api/producers/intervals", params={"top_k": 0})
+
+    assert response.status_code == 422
+
+
+def test_get_producer_intervals_year_range(mock_data: Session,
+                                           app_client: TestClient) -> None:
+    """Test the year_from and year_to query parameters of the producer intervals.
+
+    Arguments:
+        mock_data: The session used to populate the database with mock data for
+            testing.
+        app_client: The test client to interact with the FastAPI application.
+
+    Asserts:
+        - A range covering every year returns the unfiltered intervals.
+        - Only the intervals whose wins both fall within the range are counted.
+        - A range ending before it starts is rejected.
+
+    """
+    expected = app_client.get("api/producers/intervals").json()
+    response = app_client.get(
+        "api/producers/intervals", params={"year_from": 1900, "year_to": 2100})
+
+    assert response.status_code == 200
+    assert response.json() == expected
+
+    response = app_client.get("api/producers/intervals", params={"year_from": 2005})
+
+    assert response.status_code == 200
+    assert response.json()["max"] == [
+        {"producer": "Producer Y", "interval": 10,
+         "previousWin": 2010, "followingWin": 2020}]
+
+    response = app_client.get(
+        "api/producers/intervals", params={"year_from": 2010, "year_to": 2000})
+
+    assert response.status_code == 400
+
+
+def test_get_all_producer_intervals(mock_data: Session, app_client: TestClient,
+                                    engine: Engine) -> None:
+    """Test the paginated and streamed listing of every producer interval.
+
+    Arguments:
+        mock_data: The session used to populate the database with mock data for
+            testing.
+        app_client: The test client to interact with the FastAPI application.
+        engine: The database engine used in the test.
+
+    Asserts:
+        - Following the cursors returns every interval once, in keyset order.
+        - The pages match the keyset query run by the database.
+        - Only the requested pages are cached, never the whole list.
+        - The NDJSON stream returns the same intervals.
+        - The stream returns its connection to the pool once sent.
+        - A malformed cursor is rejected.
+
+    """
+    pages = []
+    params = {"limit": 2}
+    while True:
+        response = app_client.get("api/producers/intervals/all", params=params)
+        assert response.status_code == 200
+
+        page = response.json()
+        pages.extend(page["items"])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    keys = [(item["interval"], item["producer"], item["previousWin"])
+            for item in pages]
+    assert keys == sorted(keys)
+    assert pages == [
+        {field: row[field] for field in pages[0]}
+        for row in MovieDTO(mock_data).get_intervals_page()
+    ]
+    first_page = result_cache.get(
+        ("producer_intervals_page", 2, None, data_version.value))
+    assert [{field: row[field] for field in pages[0]}
+            for row in first_page] == pages[:2]
+    assert result_cache.get(("producer_intervals_page", None, None,
+                             data_version.value)) is None
+
+    mock_data.close()
+    response = app_client.get(
+        "api/producers/intervals/all", params={"output": "ndjson"})
+    assert engine.pool.checkedout() == 0
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    streamed = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(streamed, key=lambda item: sorted(item.items())) == sorted(
+        pages, key=lambda item: sorted(item.items()))
+
+    response = app_client.get(
+        "api/producers/intervals/all", params={"cursor": "invalid"})
+
+    assert response.status_code == 400
+
+
+def test_get_producer_intervals_conditional(mock_data: Session,
+                                            app_client: TestClient,
+                                            engine: Engine) -> None:
+    """Test the ETag and conditional GET support of the producers routes.
+
+    Arguments:
+        mock_data: The session used to populate the database with mock data for
+            testing.
+        app_client: The test client to interact with the FastAPI application.
+        engine: The database engine used in the test.
+
+    Asserts:
+        - Reads return an ETag and the Cache-Control header.
+        - A matching If-None-Match returns 304 without computing the intervals.
+        - A write to the movies table changes the ETag.
+        - A write made outside the sessions of the application, as by another
+            process, changes the ETag and the cached intervals.
+
+    """
+    response = app_client.get("api/producers/intervals")
+    etag = response.headers["etag"]
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-cache"
+
+    with mock.patch.object(MovieDTO, "get_winning_movies") as get_winning_movies:
+        response = app_client.get(
+            "api/producers/intervals", headers={"If-None-Match": f"W/{etag}"})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    get_winning_movies.assert_not_called()
+
+    mock_data.add(Movie(year=2030, title="Movie 5", studios="Studio 2",
+                        producers="Producer X", winner=True))
+    mock_data.commit()
+
+    response = app_client.get(
+        "api/producers/intervals", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+    etag = response.headers["etag"]
+    with engine.begin() as connection:
+        load_movies(connection, [[
+            {"year": 2100, "title": "Movie 7", "studios": "Studio 2",
+             "producers": "Producer X", "winner": True}]])
+
+    response = app_client.get(
+        "api/producers/intervals", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["max"][0]["followingWin"] == 2100
+
+
+@pytest.mark.parametrize("interval_engine", MovieDTO.ENGINES)
+def test_get_producer_intervals_external_write(empty_movies: Session,
+                                               app_client: TestClient,
+                                               engine: Engine, interval_engine: str,
+                                               monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that every engine follows a write made by another process.
+
+    Arguments:
+        empty_movies: The session of the emptied database used to seed the
+            movies.
+        app_client: The test client to interact with the FastAPI application.
+        engine: The database engine used in the test.
+        interval_engine: The interval engine serving the route.
+        monkeypatch: Selects the interval engine.
+
+    Asserts:
+        - A commit of this process is not taken for a write of another one.
+        - A write through a separate connection changes the ETag and the
+            intervals served with it, whatever the engine, and marks the
+            producer index for a rebuild.
+        - A year range covering every year follows the same write.
+
+    """
+    monkeypatch.setattr(env_data, "INTERVAL_ENGINE", interval_engine)
+    assert app_client.get("api/producers/intervals").status_code == 200
+
+    empty_movies.add_all([
+        Movie(year=year, title=f"Movie {year}", studios="Studio 1",
+              producers="Producer A", winner=True)
+        for year in (2000, 2001)
+    ])
+    empty_movies.commit()
+
+    assert observe_movies_version(read_movies_version(empty_movies)) is False
+
+    response = app_client.get("api/producers/intervals")
+    etag = response.headers["etag"]
+
+    assert response.json()["max"][0]["interval"] == 1
+
+    with engine.begin() as connection:
+        load_movies(connection, [[
+            {"year": 2086, "title": "Movie 2086", "studios": "Studio 1",
+             "producers": "Producer A", "winner": True}]])
+
+    response = app_client.get("api/producers/intervals")
+
+    assert response.headers["etag"] != etag
+    assert producer_index.version is None
+    assert response.json()["max"] == [
+        {"producer": "Producer A", "interval": 85,
+         "previousWin": 2001, "followingWin": 2086}]
+    assert app_client.get(
+        "api/producers/intervals", params={"year_from": 0, "year_to": 9999}
+    ).json() == response.json()
+
+
+def test_conditional_get_async(mock_data: Session, async_engine: AsyncEngine,
+                               app_client: TestClient) -> None:
+    """Test the conditional GET dependency of the async routes.
+
+    Arguments:
+        mock_data: The session used to populate the database with mock data for
+            testing.
+        async_engine: The async engine on the same database.
+        app_client: The test client to interact with the FastAPI application.
+
+    Asserts:
+        - The ETag is the one of the sync dependency.
+        - A matching If-None-Match is answered with 304.
+        - The version row is read on the event loop, not in the thread pool.
+
+    """
+    async def override_get_async_db() -> AsyncIterator[AsyncSession]:
+        async with AsyncSession(async_engine) as async_session:
+            yield async_session
+
+    async def read() -> dict:
+        return {}
+
+    threads = []
+    refresh = fastapi_app.refresh_movies_version
+
+    def record_thread(session: Session) -> str | None:
+        threads.append(threading.current_thread().name)
+        return refresh(session)
+
+    app = FastAPI()
+    app.add_api_route("/versioned", read, dependencies=[Depends(conditional_get_async)])
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    etag = app_client.get("api/producers/intervals").headers["etag"]
+
+    with mock.patch.object(fastapi_app, "refresh_movies_version", record_thread), \
+            TestClient(app) as client:
+        response = client.get("/versioned")
+
+        assert response.headers["etag"] == etag
+        assert client.get(
+            "/versioned", headers={"If-None-Match": etag}).status_code == 304
+
+    assert len(threads) == 2
+    assert not any(name.startswith("AnyIO worker") for name in threads)
+
+
+def test_get_producer_intervals_raw(mock_data: Session, app_client: TestClient,
+                                    monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the pre-serialized response mode of the producer intervals.
+
+    Arguments:
+        mock_data: The session used to populate the database with mock data for
+            testing.
+        app_client: The test client to interact with the FastAPI application.
+        monkeypatch: Used to switch the response mode.
+
+    Asserts:
+        - The raw response has the same content and headers as the model one.
+        - The encoded intervals are reused while the data version is unchanged.
+        - The OpenAPI schema still documents `ProducersResultSchema`.
+
+    """
+    expected = app_client.get("api/producers/intervals")
+    monkeypatch.setattr(env_data, "RESPONSE_MODE", "raw")
+
+    response = app_client.get("api/producers/intervals")
+
+    assert response.status_code == 200
+    assert response.json() == expected.json()
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"] == expected.headers["etag"]
+
+    with mock.patch.object(MovieDTO, "get_winning_movies") as get_winning_movies:
+        assert app_client.get("api/producers/intervals").content == response.content
+    get_winning_movies.assert_not_called()
+
+    schema = app_client.app.openapi()["paths"]["/api/producers/intervals"]["get"]
+    assert schema["responses"]["200"]["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/ProducersResultSchema"}
+
+
+def test_startup_warm_up(mock_data: Session, get_app: FastAPI) -> None:
+    """Test the interval precomputation and readiness reported at startup.
+
+    Arguments:
+        mock_data: The session used to populate the database with mock data for
+            testing.
+        get_app: The FastAPI application with the test database.
+
+    Asserts:
+        - The application is reported ready, with the startup durations.
+        - The first request is answered without computing the intervals.
+
+    """
+    with TestClient(app=get_app, base_url="http://test") as client:
+        response = client.get("ready")
+
+        assert response.status_code == 200
+        assert response.json()["ready"] is True
+        assert response.json()["warm"] is True
+        assert response.json()["time_to_ready_seconds"] >= 0
+
+        with mock.patch.object(MovieDTO, "get_winning_movies") as get_winning_movies:
+            assert client.get("api/producers/intervals").status_code == 200
+        get_winning_movies.assert_not_called()
+
+
+def test_search_producers_and_wins(mock_data: Session, app_client: TestClient) -> None:
+    """Test the producer prefix search and the wins of a producer.
+
+    Arguments:
+        mock_data: The session used to populate the database with mock data for
+            testing.
+        app_client: The test client to interact with the FastAPI application.
+
+    Asserts:
+        - The prefix search ignores case and is bounded by the limit.
+        - The prefix collapses its whitespace but keeps a trailing space.
+        - The wins of a producer are ordered by year, an unknown one is not found.
+        - A commit to the movies table marks the index for a rebuild, which
+            follows the write.
+
+    """
+    response = app_client.get("api/producers", params={"prefix": "PRODUCER "})
+
+    assert response.status_code == 200
+    assert response.json() == {"producers": ["Producer X", "Producer Y"]}
+    assert app_client.get(
+        "api/producers", params={"prefix": "producer", "limit": 1}
+    ).json() == {"producers": ["Producer X"]}
+    assert app_client.get(
+        "api/producers", params={"prefix": "producer  x"}
+    ).json() == {"producers": ["Producer X"]}
+    assert app_client.get(
+        "api/producers", params={"prefix": "producer x "}
+    ).json() == {"producers": []}
+    assert app_client.get("api/producers", params={"prefix": ""}).status_code == 422
+
+    response = app_client.get("api/producers/Producer X/wins")
+    wins = response.json()["wins"]
+
+    assert response.status_code == 200
+    assert response.json()["producer"] == "Producer X"
+    assert wins[0] == {"year": 1990, "title": "Movie 1"}
+    assert [win["year"] for win in wins] == sorted(win["year"] for win in wins)
+    assert app_client.get("api/producers/Nobody/wins").status_code == 404
+
+    mock_data.add(Movie(year=2031, title="Movie 6", studios="Studio 3",
+                        producers="Producer Zed", winner=True))
+    mock_data.commit()
+
+    assert producer_index.version is None
+    assert app_client.get(
+        "api/producers", params={"prefix": "producer z"}
+    ).json() == {"producers": ["Producer Zed"]}
+    assert app_client.get("api/producers/Producer Zed/wins").json()["wins"] == [
+        {"year": 2031, "title": "Movie 6"}]
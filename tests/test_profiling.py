@@ -0,0 +1,188 @@
+"""Implementation of the unit test for the request profiler."""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.types import Message, Receive, Scope, Send
+
+from app.models.movies import _intervals_from_producer_years
+from app.utils.profiling import ProfilingMiddleware
+from app.utils.tokenizer import split_producers
+
+
+def profiled_client(**options) -> TestClient:
+    """Build a client of an application with a slow route and the profiler.
+
+    Arguments:
+        **options: The options of the `ProfilingMiddleware`.
+
+    Returns:
+        TestClient: The client of the application.
+
+    """
+    app = FastAPI()
+
+    def slow() -> int:
+        deadline = time.perf_counter() + 0.05
+        count = 0
+        while time.perf_counter() < deadline:
+            count += len(split_producers("Producer X, Producer Y and Producer Z"))
+        return count
+
+    async def slow_async() -> int:
+        return slow()
+
+    def intervals() -> int:
+        rows = [(f"Producer {year % 50}", year) for year in range(1900, 2100)]
+        rows.sort()
+        deadline = time.perf_counter() + 0.05
+        count = 0
+        while time.perf_counter() < deadline:
+            count += len(_intervals_from_producer_years(rows)["min"])
+        return count
+
+    app.add_api_route("/slow", slow)
+    app.add_api_route("/slow-async", slow_async)
+    app.add_api_route("/intervals", intervals)
+
+    app.add_middleware(ProfilingMiddleware, **options)
+    return TestClient(app)
+
+
+def test_profiling_summary_header() -> None:
+    """Test the profile summary returned in a response header.
+
+    Asserts:
+        - Requests without the profiling header are not profiled.
+        - The cProfile summary names the profiled functions.
+        - The sampling rate bounds the profiled requests.
+
+    """
+    client = profiled_client(sample_rate=0.5)
+
+    assert "x-profile-summary" not in client.get("/slow").headers
+
+    headers = [client.get("/slow-async", headers={"X-Profile": "cprofile"}).headers
+               for _ in range(4)]
+    summaries = [item["x-profile-summary"] for item in headers
+                 if "x-profile-summary" in item]
+
+    assert len(summaries) == 2
+    assert summaries[0].startswith("split_producers (tokenizer.py:")
+
+
+def test_profiling_output_directory(tmp_path: Path) -> None:
+    """Test the profiles written to the output directory.
+
+    Arguments:
+        tmp_path: A temporary output directory.
+
+    Asserts:
+        - The sampling profiler writes collapsed stacks of the application code.
+        - The response names the written file.
+
+    """
+    client = profiled_client(directory=str(tmp_path), interval=0.002)
+
+    response = client.get("/intervals", headers={"X-Profile": "1"})
+    path = tmp_path / response.headers["x-profile-file"]
+
+    assert response.status_code == 200
+    assert path.suffix == ".collapsed"
+    assert "_intervals_from_producer_years" in path.read_text()
+
+
+def test_profiling_unknown_mode() -> None:
+    """Test the validation of the default profiler.
+
+    Asserts:
+        - An unknown mode is rejected.
+
+    """
+    with pytest.raises(ValueError):
+        ProfilingMiddleware(FastAPI(), mode="perf")
+
+
+def run_requests(
+    middleware: ProfilingMiddleware, responses: list[list[Message]]
+) -> None:
+    """Send concurrent requests asking for a profile through a middleware.
+
+    Arguments:
+        middleware (ProfilingMiddleware): The middleware serving the requests.
+        responses (list[list[Message]]): One list per request, filled with
+            the messages sent for it.
+
+    Returns:
+        None: Method without data return.
+
+    """
+    async def request(sent: list[Message]) -> None:
+        scope = {"type": "http", "method": "GET", "path": "/slow",
+                 "headers": [(b"x-profile", b"cprofile")]}
+
+        async def send(message: Message) -> None:
+            sent.append(message)
+
+        await middleware(scope, None, send)
+
+    async def run() -> None:
+        await asyncio.gather(*(request(sent) for sent in responses))
+
+    asyncio.run(run())
+
+
+def test_profiling_one_request_at_a_time() -> None:
+    """Test that concurrent requests are not profiled at the same time.
+
+    Asserts:
+        - Every request is served.
+        - Only the first request is profiled while it runs.
+
+    """
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await asyncio.sleep(0.01)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    responses = [[], [], []]
+    run_requests(ProfilingMiddleware(app), responses)
+    profiled = [
+        any(name == b"x-profile-summary" for name, _ in sent[0]["headers"])
+        for sent in responses
+    ]
+
+    assert [sent[-1]["body"] for sent in responses] == [b"ok"] * 3
+    assert profiled == [True, False, False]
+
+
+def test_profiling_streamed_response(tmp_path: Path) -> None:
+    """Test that a streamed response is forwarded while it is profiled.
+
+    Arguments:
+        tmp_path: A temporary output directory.
+
+    Asserts:
+        - The first chunk is sent before the stream ends.
+        - The response names the profile file, written once the stream ends.
+
+    """
+    sent, forwarded = [], []
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"1\n", "more_body": True})
+        forwarded.append(len(sent))
+        await send({"type": "http.response.body", "body": b"2\n"})
+
+    run_requests(ProfilingMiddleware(app, directory=str(tmp_path)), [sent])
+    headers = dict(sent[0]["headers"])
+
+    assert forwarded == [2]
+    assert [message.get("body") for message in sent[1:]] == [b"1\n", b"2\n"]
+    assert (tmp_path / headers[b"x-profile-file"].decode()).exists()
+
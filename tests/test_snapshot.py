@@ -0,0 +1,188 @@
+"""Implementation of the unit test for the shared interval snapshot."""
+
+from pathlib import Path
+from unittest import mock
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from app.db.loader import load_movies
+from app.models import movies
+from app.models.cache import DataVersion
+from app.models.movies import Movie, MovieDTO, read_movies_version
+from app.models.snapshot import Snapshot, SnapshotStore, snapshot_store, write_snapshot
+
+WINS = [("Producer B", 1990), ("Producer B", 1991), ("Producer A", 2000),
+        ("Producer A", 2013), ("Producer B", 2018)]
+INTERVALS = {
+    "min": [{"producer": "Producer B", "interval": 1,
+             "previousWin": 1990, "followingWin": 1991}],
+    "max": [{"producer": "Producer B", "interval": 27,
+             "previousWin": 1991, "followingWin": 2018}],
+}
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    """Test that a snapshot maps back the years and intervals it was written with.
+
+    Arguments:
+        tmp_path: The temporary directory of the test.
+
+    Asserts:
+        - The intervals are decoded from the file.
+        - The years of a producer are found in name order.
+        - An unknown producer has no years.
+        - The version token of the movies is kept in the header.
+
+    """
+    path = tmp_path / "intervals.snapshot"
+    generation = write_snapshot(path, WINS, INTERVALS, "0123456789abcdef-42")
+    snapshot = Snapshot(path)
+
+    assert snapshot.generation == generation
+    assert snapshot.token == "0123456789abcdef-42"
+    assert snapshot.producers == 2
+    assert snapshot.get_intervals() == INTERVALS
+    assert snapshot.producer_years("Producer A") == [2000, 2013]
+    assert snapshot.producer_years("Producer B") == [1990, 1991, 2018]
+    assert snapshot.producer_years("Producer C") == []
+
+
+def test_snapshot_store_swaps_generations(tmp_path: Path) -> None:
+    """Test that a store maps the file written by another writer.
+
+    Arguments:
+        tmp_path: The temporary directory of the test.
+
+    Asserts:
+        - A missing file has no snapshot.
+        - A replaced file is mapped on the next read and bumps a following version.
+        - A discarded file is no longer read.
+
+    """
+    store = SnapshotStore(tmp_path / "intervals.snapshot")
+    version = DataVersion()
+    version.follow(store.generation)
+    version.follow(store.generation)
+
+    assert store.current() is None
+    assert version.value == 0
+
+    first = write_snapshot(store.path, WINS, INTERVALS)
+    assert store.generation() == first
+    assert version.value == 1
+
+    second = write_snapshot(store.path, WINS[:2], {"min": INTERVALS["min"],
+                                                   "max": INTERVALS["min"]})
+    assert version.value == 2
+    assert store.generation() == second
+    assert store.current().get_intervals()["max"] == INTERVALS["min"]
+
+    store.discard()
+    assert store.current() is None
+    assert version.value == 3
+
+
+def test_snapshot_store_checks_tokens(tmp_path: Path) -> None:
+    """Test that a snapshot is only used for the version it was written for.
+
+    Arguments:
+        tmp_path: The temporary directory of the test.
+
+    Asserts:
+        - A snapshot of another version is refused.
+        - Discarding for the version of the file keeps it, for another one
+            removes it.
+        - A write whose version changed before the rename leaves no file.
+
+    """
+    store = SnapshotStore(tmp_path / "intervals.snapshot")
+    write_snapshot(store.path, WINS, INTERVALS, "a-1")
+
+    assert store.current("a-1").token == "a-1"
+    assert store.current("a-2") is None
+
+    store.discard("a-1")
+    assert store.path.exists()
+    store.discard("a-2")
+    assert not store.path.exists()
+
+    assert write_snapshot(store.path, WINS, INTERVALS, "a-2", lambda: False) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_snapshot_engine_follows_commits(session: Session) -> None:
+    """Test that the snapshot engine rebuilds the file after a commit.
+
+    Arguments:
+        session: The database session used in the test.
+
+    Asserts:
+        - The first read writes the snapshot file.
+        - A commit removes it and the next read includes the new winner.
+
+    """
+    session.add_all([
+        Movie(year=1980, title="Movie 1", studios="Studio 1",
+              producers="Producer S", winner=True),
+        Movie(year=1984, title="Movie 2", studios="Studio 1",
+              producers="Producer S", winner=True),
+    ])
+    session.commit()
+
+    dto = MovieDTO(session, engine="snapshot")
+    assert dto.get_winning_movies() == MovieDTO(session).get_winning_movies()
+    assert snapshot_store.path.exists()
+
+    session.add(Movie(year=1985, title="Movie 3", studios="Studio 1",
+                      producers="Producer S", winner=True))
+    session.commit()
+
+    assert not snapshot_store.path.exists()
+    assert dto.get_winning_movies()["min"][0]["followingWin"] == 1985
+    assert snapshot_store.current().producer_years("Producer S")[-3:] == [
+        1980, 1984, 1985]
+
+
+def test_snapshot_engine_checks_version(session: Session, engine: Engine) -> None:
+    """Test that the snapshot engine never serves a snapshot of other movies.
+
+    Arguments:
+        session: The database session used in the test.
+        engine: The database engine used in the test.
+
+    Asserts:
+        - A snapshot written before another process wrote is rewritten.
+        - A snapshot whose winners were read before a concurrent commit is
+            dropped instead of replacing the file.
+
+    """
+    session.add_all([
+        Movie(year=1970, title="Movie 1", studios="Studio 1",
+              producers="Producer T", winner=True),
+        Movie(year=1972, title="Movie 2", studios="Studio 1",
+              producers="Producer T", winner=True),
+    ])
+    session.commit()
+
+    def write(year: int) -> None:
+        with engine.begin() as connection:
+            load_movies(connection, [[
+                {"year": year, "title": f"Movie {year}", "studios": "Studio 1",
+                 "producers": "Producer T", "winner": True}]])
+
+    dto = MovieDTO(session, engine="snapshot")
+    dto.get_winning_movies()
+    write(1973)
+
+    assert dto.get_winning_movies() == MovieDTO(session).get_winning_movies()
+    assert snapshot_store.current().token == read_movies_version(session)
+
+    compute = movies._intervals_from_producer_years
+    with mock.patch.object(movies, "_intervals_from_producer_years",
+                           side_effect=lambda wins: (write(1974), compute(wins))[1]):
+        assert dto.write_snapshot() is None
+
+    assert snapshot_store.current(read_movies_version(session)) is None
+    assert dto.get_winning_movies() == MovieDTO(session).get_winning_movies()
+
@@ -0,0 +1,124 @@
+"""Implementation of the unit test for the studios route."""
+
+from collections.abc import AsyncIterator
+from unittest import mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.sqlite import get_async_db
+from app.models.movies import Movie, MovieDTO
+from app.routes.studios import get_studio_intervals_async
+
+
+def test_get_studio_intervals(session: Session, app_client: TestClient) -> None:
+    """Test the intervals between consecutive wins of the studios.
+
+    Arguments:
+        session: The database session used in the test.
+        app_client: The test client to interact with the FastAPI application.
+
+    Asserts:
+        - Studio credits are split like producer credits.
+        - The top_k smallest and largest intervals are ranked.
+        - The intervals are cached per data version.
+
+    """
+    session.add_all([
+        Movie(year=1980, title="Movie 1", studios="Studio A, Studio B and Studio C",
+              producers="Producer X", winner=True),
+        Movie(year=1981, title="Movie 2", studios="Studio A, and Studio B",
+              producers="Producer Y", winner=True),
+        Movie(year=1990, title="Movie 3", studios="Studio C", producers="Producer Z",
+              winner=True),
+        Movie(year=1991, title="Movie 4", studios="Studio C", producers="Producer Z",
+              winner=False),
+    ])
+    session.commit()
+
+    response = app_client.get("api/studios/intervals")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "min": [
+            {"studio": "Studio A", "interval": 1,
+             "previousWin": 1980, "followingWin": 1981},
+            {"studio": "Studio B", "interval": 1,
+             "previousWin": 1980, "followingWin": 1981},
+        ],
+        "max": [
+            {"studio": "Studio C", "interval": 10,
+             "previousWin": 1980, "followingWin": 1990},
+        ],
+    }
+
+    top = app_client.get("api/studios/intervals", params={"top_k": 1}).json()
+
+    assert [(row["studio"], row["interval"]) for row in top["min"]] == [
+        ("Studio A", 1)]
+    assert [(row["studio"], row["interval"]) for row in top["max"]] == [
+        ("Studio C", 10)]
+
+    with mock.patch.object(MovieDTO, "get_dimension_intervals") as compute:
+        assert app_client.get("api/studios/intervals").status_code == 200
+    compute.assert_not_called()
+
+
+def test_dimension_intervals(session: Session) -> None:
+    """Test the dimensions of the interval engine.
+
+    Arguments:
+        session: The database session used in the test.
+
+    Asserts:
+        - The producers dimension is computed by the selected engine.
+        - An unknown dimension is rejected.
+
+    """
+    dto = MovieDTO(session)
+
+    assert dto.get_dimension_intervals("producers") == dto.get_winning_movies()
+    with pytest.raises(ValueError):
+        dto.get_dimension_intervals("titles")
+
+
+def test_get_studio_intervals_async(session: Session, async_engine: AsyncEngine,
+                                    app_client: TestClient) -> None:
+    """Test that the async studios endpoint answers like the sync one.
+
+    Arguments:
+        session: The database session used in the test.
+        async_engine: The async engine on the same database.
+        app_client: The test client to interact with the FastAPI application.
+
+    Asserts:
+        - The async endpoint returns the intervals of the sync one, with and
+            without top_k.
+
+    """
+    session.add_all([
+        Movie(year=1980, title="Movie 1", studios="Studio A, Studio B",
+              producers="Producer X", winner=True),
+        Movie(year=1984, title="Movie 2", studios="Studio A", producers="Producer Y",
+              winner=True),
+    ])
+    session.commit()
+
+    async def override_get_async_db() -> AsyncIterator[AsyncSession]:
+        async with AsyncSession(async_engine) as async_session:
+            yield async_session
+
+    app = FastAPI()
+    app.add_api_route("/intervals", get_studio_intervals_async)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    with TestClient(app) as client:
+        for params in ({}, {"top_k": 1}):
+            response = client.get("/intervals", params=params)
+
+            assert response.status_code == 200
+            assert response.json() == app_client.get(
+                "api/studios/intervals", params=params).json()
@@ -0,0 +1,45 @@
+"""Implementation of the unit test for the producer credits tokenizer."""
+
+from app.utils.tokenizer import (
+    normalize_name,
+    split_producers,
+    tokenize_credits,
+    tokenizer_stats,
+)
+
+
+def test_tokenize_credits_separators() -> None:
+    """Test the separators and normalization of the producer credits.
+
+    Asserts:
+        - Commas, " and " and ", and" separate names, whatever the whitespace.
+        - "and" inside a name is kept.
+        - Names are NFC-normalized and their whitespace collapsed.
+
+    """
+    assert split_producers("Producer X, Producer Y, and Producer Z") == [
+        "Producer X", "Producer Y", "Producer Z"]
+    assert split_producers(" Producer X ,Producer Y  and\tProducer Z ") == [
+        "Producer X", "Producer Y", "Producer Z"]
+    assert split_producers("Sandy Anderson and Andrew Rand") == [
+        "Sandy Anderson", "Andrew Rand"]
+    assert split_producers("Jose\u0301  Padilha, José Padilha") == [
+        "José Padilha"]
+    assert normalize_name("  Producer \n X ") == "Producer X"
+
+
+def test_tokenize_credits_memo() -> None:
+    """Test the memo of the tokenizer.
+
+    Asserts:
+        - A repeated credit is answered from the memo.
+        - The hit rate reflects the lookups.
+
+    """
+    tokenize_credits.cache_clear()
+
+    first = tokenize_credits("Producer A and Producer B")
+    second = tokenize_credits("Producer A and Producer B")
+
+    assert first is second
+    assert tokenizer_stats() == {"size": 1, "hits": 1, "misses": 1, "hit_rate": 0.5}
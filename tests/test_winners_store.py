@@ -0,0 +1,30 @@
+"""Implementation of the unit test for the columnar winners store."""
+
+from app.models.movies import _intervals_from_producer_years
+from app.models.winners_store import WinnersStore
+from benchmarks.synthetic import synthetic_credits
+
+
+def test_winners_store_matches_python_engine() -> None:
+    """Test that the store computes the intervals of the Python engine.
+
+    Asserts:
+        - An empty store has no intervals.
+        - The intervals of synthetic credits match, ties included.
+        - Each credit is held in six bytes of buffers.
+
+    """
+    store = WinnersStore()
+    store.rebuild([])
+    assert store.get_intervals() == {"min": [], "max": []}
+
+    wins = list(synthetic_credits(5000, seed=7))
+    store.rebuild(wins)
+
+    assert store.ready
+    assert len(store) == 5000
+    assert store.nbytes() == 6 * 5000
+    assert store.get_intervals() == _intervals_from_producer_years(wins)
+
+    store.invalidate()
+    assert not store.ready